@@ -0,0 +1,75 @@
+"""Worst-case latency of every check on adversarial inputs up to 1 MB.
+
+Runs each `is_*` function on every input of `benchmarks.corpus`
+`ADVERSARIAL` at each size, keeps the slowest call per check and size,
+and fails with exit status 1 if any exceeds `--budget-ms`. A pattern
+that backtracks takes seconds or never finishes on these inputs; the
+linear-time patterns stay in the low milliseconds at 1 MB, most of them
+in microseconds thanks to their length ceilings.
+
+Run with `uv run python -m benchmarks.bench_adversarial`.
+"""
+
+import argparse
+import sys
+
+import lsre
+from benchmarks.common import best_of, print_table
+from benchmarks.corpus import ADVERSARIAL
+from lsre.registry import registry
+
+SIZES = (1_024, 16_384, 262_144, 1_048_576)
+"""Input lengths, 1 KB to 1 MB."""
+
+
+def worst_case(name: str, size: int, repeat: int) -> tuple[float, str]:
+    """Return the slowest call of one check over the adversarial inputs.
+
+    Args:
+        name (str): check name
+        size (int): input length
+        repeat (int): runs per input, the fastest is kept
+
+    Returns:
+        tuple[float, str]: seconds per call and the input's name
+    """
+    func = getattr(lsre, f'is_{name}')
+    timings = []
+    for label, make in ADVERSARIAL.items():
+        text = make(size)
+        timings.append((best_of(lambda t=text: func(t), repeat), label))
+    return max(timings)
+
+
+def main() -> None:
+    """Run the benchmark and exit with 1 when a check is over budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--checks', nargs='+', default=list(registry))
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--budget-ms', type=float, default=50.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    over = []
+    for name in args.checks:
+        row = [name]
+        for size in args.sizes:
+            elapsed, label = worst_case(name, size, args.repeat)
+            row.append(f'{elapsed * 1e3:.3f}')
+            if elapsed * 1e3 > args.budget_ms:
+                over.append((name, f'{size:,}', label, f'{elapsed:.3f}'))
+        rows.append(row)
+    print('worst ms per call')
+    print_table(('check', *(f'{size:,}' for size in args.sizes)), rows)
+
+    if not over:
+        print(f'\nevery check under {args.budget_ms:g} ms')
+        return
+    print(f'\n{len(over)} over {args.budget_ms:g} ms:')
+    print_table(('check', 'size', 'input', 'seconds'), over)
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Event-loop stalls while validating batches from async code.
+
+Starts `--jobs` concurrent validation tasks, each checking its share
+of `--rows` sample texts against every check, next to a heartbeat task
+that sleeps 1 ms at a time. How late each heartbeat wakes up is how
+long any other request on the loop would have waited. Compares calling
+`lsre.validate_many` straight from a coroutine with `lsre.aio` at two
+chunk sizes and with the chunks offloaded to threads and processes.
+
+Run with `uv run python -m benchmarks.bench_aio`.
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import lsre
+from benchmarks.common import load_samples, print_table
+from lsre import aio
+
+HEARTBEAT = 0.001
+"""Seconds the heartbeat task sleeps between wake-ups."""
+
+type Job = Callable[[list[str]], Awaitable[object]]
+
+
+async def _blocking(texts: list[str]) -> object:
+    """Validate in one call on the loop, as a plain handler would."""
+    return lsre.validate_many(texts)
+
+
+async def _run(job: Job, texts: list[str], jobs: int) -> tuple[float, list]:
+    """Run `jobs` copies of `job` next to a heartbeat.
+
+    Returns:
+        tuple[float, list]: seconds until all jobs finished and how late
+            each heartbeat woke up, in seconds
+    """
+    lateness: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT)
+            lateness.append(time.perf_counter() - start - HEARTBEAT)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    share = len(texts) // jobs
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(job(texts[i * share : (i + 1) * share]) for i in range(jobs))
+    )
+    elapsed = time.perf_counter() - start
+    done.set()
+    await beat
+    return elapsed, lateness
+
+
+def main() -> None:
+    """Run the benchmark and print throughput and stall times."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--jobs', type=int, default=4)
+    args = parser.parse_args()
+
+    samples = load_samples()
+    texts = list(itertools.islice(itertools.cycle(samples), args.rows))
+    threads = ThreadPoolExecutor(max_workers=args.jobs)
+    processes = ProcessPoolExecutor(max_workers=args.jobs)
+    workloads: list[tuple[str, Job]] = [
+        ('blocking validate_many', _blocking),
+        ('aio, chunks of 1,000', aio.validate_many),
+        (
+            'aio, chunks of 100',
+            lambda t: aio.validate_many(t, chunk_size=100),
+        ),
+        (
+            'aio, offloaded to threads',
+            lambda t: aio.validate_many(t, executor=threads, offload_above=0),
+        ),
+        (
+            'aio, offloaded to processes',
+            lambda t: aio.validate_many(
+                t, executor=processes, offload_above=0
+            ),
+        ),
+    ]
+
+    rows = []
+    with threads, processes:
+        # start the worker processes outside the measurement
+        list(processes.map(lsre.validate_many, [[]] * args.jobs))
+        for label, job in workloads:
+            elapsed, lateness = asyncio.run(_run(job, texts, args.jobs))
+            p99 = statistics.quantiles(lateness, n=100, method='inclusive')[98]
+            rows.append(
+                (
+                    label,
+                    f'{args.rows / elapsed:,.0f}',
+                    f'{len(lateness):,}',
+                    f'{p99 * 1e3:.1f}',
+                    f'{max(lateness) * 1e3:.1f}',
+                )
+            )
+    print(
+        f'{args.rows:,} texts in {args.jobs} concurrent jobs, '
+        f'{HEARTBEAT * 1e3:g} ms heartbeat'
+    )
+    print_table(
+        ('workload', 'items/sec', 'heartbeats', 'p99 ms', 'max ms'), rows
+    )
+
+
+if __name__ == '__main__':
+    main()
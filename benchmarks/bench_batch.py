@@ -0,0 +1,61 @@
+"""Throughput of `validate_many` vs the per-item loop in `scripts/main.py`.
+
+The per-item loop calls every `lsre.is_*` function on each text and
+builds a results dict, exactly as `scripts/main.py` does (minus the
+result logging). `validate_many` runs the same checks over the whole
+batch at once.
+
+Run with `uv run python -m benchmarks.bench_batch`.
+"""
+
+import argparse
+import itertools
+
+import lsre
+from benchmarks.common import best_of, load_samples, print_table
+from lsre.registry import registry
+
+
+def _per_item(texts: list[str], checks: tuple[str, ...]) -> None:
+    """Validate `texts` one by one through the public functions."""
+    functions = {name: getattr(lsre, f'is_{name}') for name in checks}
+    for text in texts:
+        {name: func(text) for name, func in functions.items()}
+
+
+def _batch(texts: list[str], checks: tuple[str, ...]) -> None:
+    """Validate `texts` in one `validate_many` call."""
+    lsre.validate_many(texts, checks)
+
+
+def main() -> None:
+    """Run the benchmark and print items/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=13_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    samples = load_samples()
+    texts = list(itertools.islice(itertools.cycle(samples), args.rows))
+    workloads = [('all 13 checks', tuple(registry))]
+
+    rows = []
+    for label, checks in workloads:
+        loop = best_of(lambda c=checks: _per_item(texts, c), args.repeat)
+        batch = best_of(lambda c=checks: _batch(texts, c), args.repeat)
+        rows.append(
+            (
+                label,
+                f'{args.rows / loop:,.0f}',
+                f'{args.rows / batch:,.0f}',
+                f'{loop / batch:.1f}x',
+            )
+        )
+    print(f'{args.rows:,} texts, items/sec')
+    print_table(
+        ('workload', 'per-item loop', 'validate_many', 'speedup'), rows
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Direct bytes validation vs decoding every field first.
+
+Fields of a synthetic access log are held as `bytes` or as `memoryview`
+slices of one ASCII buffer, as they would be after parsing a network
+read. Each field is validated either by decoding it to `str` first, or
+by passing it straight to the validator, which matches it with a bytes
+pattern.
+
+Run with `uv run python -m benchmarks.bench_bytes`.
+"""
+
+import argparse
+import random
+import re
+
+import lsre
+from benchmarks.bench_extract import _log_line
+from benchmarks.common import best_of, print_table
+
+FIELDS = re.compile(
+    rb'^(?P<ipv4>\S+) - (?P<email>\S+) .* request_id=(?P<uuid>\S+)$',
+    re.MULTILINE,
+)
+"""Pulls the IP, user email and request UUID out of each log line."""
+
+
+def _fields(lines: int) -> dict[str, list[memoryview]]:
+    """Return zero-copy slices of each field, keyed by check name."""
+    rng = random.Random(0)
+    data = ''.join(_log_line(rng) for _ in range(lines)).encode('ascii')
+    view = memoryview(data)
+    fields: dict[str, list[memoryview]] = {'ipv4': [], 'email': [], 'uuid': []}
+    for match in FIELDS.finditer(data):
+        for name, slices in fields.items():
+            slices.append(view[match.start(name) : match.end(name)])
+    return fields
+
+
+def main() -> None:
+    """Run the benchmark and print fields/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lines', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for name, views in _fields(args.lines).items():
+        func = getattr(lsre, f'is_{name}')
+        for kind, fields in (
+            ('bytes', [bytes(view) for view in views]),
+            ('memoryview', views),
+        ):
+            workloads = [
+                lambda f=func, s=fields: [f(str(v, 'ascii')) for v in s],
+                lambda f=func, s=fields: [f(v) for v in s],
+                lambda n=name, s=fields: lsre.validate_many(
+                    [str(v, 'ascii') for v in s], n
+                ),
+                lambda n=name, s=fields: lsre.validate_many(s, n),
+            ]
+            timings = [best_of(w, args.repeat) for w in workloads]
+            rows.append(
+                (name, kind, *(f'{len(fields) / t:,.0f}' for t in timings))
+            )
+    print(f'{args.lines:,} log lines, fields/sec')
+    print_table(
+        (
+            'check',
+            'input',
+            'decode + is_*',
+            'bytes is_*',
+            'decode + validate_many',
+            'bytes validate_many',
+        ),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
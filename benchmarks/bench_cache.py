@@ -0,0 +1,87 @@
+"""Validator result cache on a Zipf-distributed stream of repeated values.
+
+Draws a stream of IPv4 addresses, emails and UUIDs from a pool of
+distinct values with Zipf weights, so a few values make up most of the
+stream like in real logs. Times the `is_*` calls over the stream
+without caching and with `lsre.cache` enabled at several table sizes,
+each starting empty, and reports calls/sec and the hit ratio.
+
+Run with `uv run python -m benchmarks.bench_cache`.
+"""
+
+import argparse
+import random
+import uuid
+
+import lsre
+from benchmarks.common import best_of, print_table
+from lsre import cache
+
+SIZES = (256, 4096, 65536)
+"""Cache sizes to compare, per validator."""
+
+
+def _pool(rng: random.Random, distinct: int) -> list[tuple[str, str]]:
+    """Return `distinct` (check, value) pairs of each kind."""
+    pairs = []
+    for i in range(distinct):
+        octets = '.'.join(str(rng.randrange(256)) for _ in range(4))
+        pairs += [
+            ('ipv4', octets),
+            ('email', f'user{i}@example{i % 97}.com'),
+            ('uuid', str(uuid.UUID(int=rng.getrandbits(128)))),
+        ]
+    rng.shuffle(pairs)
+    return pairs
+
+
+def main() -> None:
+    """Run the benchmark and print calls/sec and hit ratio."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=300_000)
+    parser.add_argument('--distinct', type=int, default=100_000)
+    parser.add_argument('--skew', type=float, default=1.1)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pool = _pool(rng, args.distinct)
+    weights = [1 / rank**args.skew for rank in range(1, len(pool) + 1)]
+    stream = [
+        (getattr(lsre, f'is_{name}'), text)
+        for name, text in rng.choices(pool, weights, k=args.calls)
+    ]
+
+    def run() -> None:
+        for func, text in stream:
+            func(text)
+
+    cache.disable()
+    baseline = best_of(run, repeat=3)
+    rows = [('off', f'{args.calls / baseline:,.0f}', '-', '1.0x')]
+    for size in SIZES:
+
+        def cold_run(size: int = size) -> None:
+            cache.enable(maxsize=size)
+            run()
+
+        elapsed = best_of(cold_run, repeat=3)
+        stats = cache.snapshot()
+        hits = sum(s['hits'] for s in stats.values())
+        rows.append(
+            (
+                f'{size:,}',
+                f'{args.calls / elapsed:,.0f}',
+                f'{hits / args.calls:.0%}',
+                f'{baseline / elapsed:.1f}x',
+            )
+        )
+    cache.disable()
+    print(
+        f'{args.calls:,} calls over {len(pool):,} distinct values, '
+        f'Zipf s={args.skew}'
+    )
+    print_table(('cache size', 'calls/sec', 'hit ratio', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Build time, memory and lookups/sec of `lsre.cidr.CidrIndex`.
+
+Random IPv4 prefix lists of 10K, 100K and 1M entries are generated,
+mostly `/24`s with shorter and longer prefixes mixed in, many of them
+nested. For each size the benchmark reports:
+
+- build: seconds to build a `CidrIndex`, against parsing every prefix
+  with `ipaddress.ip_network`, and the memory each holds per prefix,
+  measured with `tracemalloc` in a separate run
+- lookups/sec of `CidrIndex.lookup` per address text, of `lookup_many`
+  on the output of `parse_ipv4_many` with and without the parsing, and
+  of testing membership in every `ipaddress` network in turn, on
+  `--linear` addresses only
+
+Run with `uv run python -m benchmarks.bench_cidr`.
+"""
+
+import argparse
+import ipaddress
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks.common import best_of, print_table
+from lsre.cidr import CidrIndex
+from lsre.parse import parse_ipv4_many
+
+
+def _prefixes(count: int, rng: random.Random) -> list[str]:
+    """Return `count` IPv4 prefixes, mostly `/24`s."""
+    prefixes = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.6:  # noqa: PLR2004
+            length = 24
+        elif roll < 0.8:  # noqa: PLR2004
+            length = rng.randint(8, 23)
+        else:
+            length = rng.randint(25, 32)
+        value = rng.getrandbits(length) << (32 - length)
+        prefixes.append(f'{ipaddress.IPv4Address(value)}/{length}')
+    return prefixes
+
+
+def _retained(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the result of `build`."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    """Run the benchmark and print build and lookup tables."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lookups', type=int, default=100_000)
+    parser.add_argument('--linear', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    addresses = [
+        str(ipaddress.IPv4Address(rng.getrandbits(32)))
+        for _ in range(args.lookups)
+    ]
+    packed = parse_ipv4_many(addresses)
+    sample = [ipaddress.IPv4Address(a) for a in addresses[: args.linear]]
+    build_rows = []
+    lookup_rows = []
+    for size in (10_000, 100_000, 1_000_000):
+        prefixes = _prefixes(size, rng)
+        start = time.perf_counter()
+        index = CidrIndex(prefixes)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        networks = [ipaddress.ip_network(p, strict=False) for p in prefixes]
+        parsed = time.perf_counter() - start
+        index_bytes = _retained(lambda p=prefixes: CidrIndex(p))
+        network_bytes = _retained(
+            lambda p=prefixes: [ipaddress.ip_network(x) for x in p]
+        )
+        build_rows.append(
+            (
+                f'{size:,}',
+                f'{built:.2f}',
+                f'{index_bytes / size:.1f}',
+                f'{parsed:.2f}',
+                f'{network_bytes / size:.1f}',
+            )
+        )
+
+        scalar = best_of(lambda i=index: list(map(i.lookup, addresses)), 1)
+        with_parse = best_of(
+            lambda i=index: i.lookup_many(parse_ipv4_many(addresses)),
+            args.repeat,
+        )
+        packed_only = best_of(
+            lambda i=index: i.lookup_many(packed), args.repeat
+        )
+        linear = best_of(
+            lambda n=networks: [any(a in net for net in n) for a in sample],
+            1,
+        )
+        lookup_rows.append(
+            (
+                f'{size:,}',
+                f'{args.lookups / scalar:,.0f}',
+                f'{args.lookups / with_parse:,.0f}',
+                f'{args.lookups / packed_only:,.0f}',
+                f'{len(sample) / linear:,.1f}',
+            )
+        )
+    print('build: seconds and bytes held per prefix')
+    print_table(
+        ('prefixes', 'CidrIndex s', 'B/prefix', 'ip_network s', 'B/prefix'),
+        build_rows,
+    )
+    print(f'\nlookups/sec over {args.lookups:,} addresses')
+    print_table(
+        (
+            'prefixes',
+            'lookup',
+            'parse + lookup_many',
+            'lookup_many',
+            'linear ipaddress',
+        ),
+        lookup_rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
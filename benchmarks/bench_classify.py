@@ -0,0 +1,67 @@
+"""Throughput of `classify_many` vs running every `is_*` per text.
+
+The `configs/config.yaml` samples are repeated up to `--rows` texts.
+The per-item loop calls every `lsre.is_*` function on each text, as
+`scripts/main.py` does; `classify_many` answers all checks for a text in
+one combined regex call. Both must produce the same answers.
+
+Run with `uv run python -m benchmarks.bench_classify`.
+"""
+
+import argparse
+import itertools
+import time
+
+import lsre
+from benchmarks.common import load_samples, print_table
+from lsre.registry import registry
+
+
+def _per_item(texts: list[str], checks: tuple[str, ...]) -> list[tuple]:
+    """Classify `texts` by calling each public function in turn."""
+    functions = [(name, getattr(lsre, f'is_{name}')) for name in checks]
+    return [
+        tuple(name for name, func in functions if func(text)) for text in texts
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print items/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument(
+        '--exclude', nargs='*', default=[], help='checks to leave out'
+    )
+    args = parser.parse_args()
+
+    checks = tuple(name for name in registry if name not in args.exclude)
+    samples = load_samples()
+    texts = list(itertools.islice(itertools.cycle(samples), args.rows))
+
+    start = time.perf_counter()
+    expected = _per_item(texts, checks)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = lsre.classify_many(texts, checks)
+    combined = time.perf_counter() - start
+
+    if result != expected:
+        msg = 'classify_many disagrees with the is_* functions'
+        raise AssertionError(msg)
+
+    print(f'{args.rows:,} texts, {len(checks)} checks, items/sec')
+    print_table(
+        ('per-item is_* loop', 'classify_many', 'speedup'),
+        [
+            (
+                f'{args.rows / loop:,.0f}',
+                f'{args.rows / combined:,.0f}',
+                f'{loop / combined:.1f}x',
+            )
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Column validation vs mapping the `is_*` functions over a Series.
+
+Builds a pandas Series cycling through the sample strings with one value
+in ten missing, then for a few checks times `Series.map` of the `is_*`
+function, `validate_many` over the list of values and `validate_column`
+on the Series and on the equivalent Arrow array. `ipv4`, `uuid` and
+`iso_date` run in Arrow's regex kernel; `email` falls back to Python.
+
+Run with `uv run python -m benchmarks.bench_columns`.
+"""
+
+import argparse
+import itertools
+
+import pandas as pd
+import pyarrow as pa
+
+import lsre
+from benchmarks.common import best_of, load_samples, print_table
+from lsre.columns import re2_source, validate_column
+
+CHECKS = ('ipv4', 'uuid', 'iso_date', 'email')
+"""Three checks the kernel runs and one it cannot."""
+
+
+def main() -> None:
+    """Run the benchmark and print rows/sec for every approach."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    samples = [*load_samples(), None]
+    values = list(itertools.islice(itertools.cycle(samples), args.rows))
+    series = pd.Series(values, dtype=object)
+    array = pa.array(values, type=pa.string())
+    texts = series.fillna('').tolist()
+
+    rows = []
+    for name in CHECKS:
+        func = getattr(lsre, f'is_{name}')
+        mapped = best_of(
+            lambda f=func: series.map(f, na_action='ignore'), repeat=3
+        )
+        batch = best_of(lambda n=name: lsre.validate_many(texts, n), repeat=3)
+        column = best_of(lambda n=name: validate_column(series, n), repeat=3)
+        arrow = best_of(lambda n=name: validate_column(array, n), repeat=3)
+        rows.append(
+            (
+                name,
+                'kernel' if re2_source(name) else 'python',
+                f'{args.rows / mapped:,.0f}',
+                f'{args.rows / batch:,.0f}',
+                f'{args.rows / column:,.0f}',
+                f'{args.rows / arrow:,.0f}',
+                f'{mapped / column:.1f}x',
+            )
+        )
+    print(f'{args.rows:,} rows, rows/sec')
+    print_table(
+        (
+            'check',
+            'path',
+            'Series.map',
+            'validate_many',
+            'column(Series)',
+            'column(Arrow)',
+            'speedup',
+        ),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
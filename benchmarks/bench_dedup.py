@@ -0,0 +1,99 @@
+"""Deduplicated vs plain `validate_many` at different repeat rates.
+
+Draws `--rows` texts from pools of `ipv4` and `email` corpus values of
+shrinking size, so from none to 99.9% of the texts repeat an earlier
+one, and checks them against every check. Reports items/sec with and
+without `dedup=True`, the dedup ratio and the time saved the stats
+estimate.
+
+A second table streams the same texts through `validate_stream` with a
+table of `--max-size` values, to show the cost of spilling once the
+distinct values outgrow it.
+
+Run with `uv run python -m benchmarks.bench_dedup`.
+"""
+
+import argparse
+import random
+
+import lsre
+from benchmarks.common import best_of, print_table
+from benchmarks.corpus import generate
+from lsre.dedup import DedupStats, DedupTable
+from lsre.registry import registry
+from lsre.stream import validate_stream
+
+
+def _texts(rows: int, distinct: int) -> list[str]:
+    """Return `rows` texts drawn from `distinct` values."""
+    values = [
+        value
+        for name in ('ipv4', 'email')
+        for _, value in generate(name, distinct // 2 + 1)
+    ]
+    values = list(dict.fromkeys(values))[:distinct]
+    rng = random.Random(0)
+    if distinct >= rows:
+        return values[:rows]
+    return rng.choices(values, k=rows)
+
+
+def main() -> None:
+    """Run the benchmark and print items/sec and dedup stats."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--max-size', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    stream_rows = []
+    for distinct in (args.rows, args.rows // 10, args.rows // 100, 100):
+        texts = _texts(args.rows, distinct)
+        plain = best_of(lambda t=texts: lsre.validate_many(t), args.repeat)
+        deduped = best_of(
+            lambda t=texts: lsre.validate_many(t, dedup=True), args.repeat
+        )
+        stats = lsre.validate_many(texts, dedup=True).dedup or DedupStats()
+        label = f'{len(set(texts)):,}'
+        rows.append(
+            (
+                label,
+                f'{stats.ratio:.1%}',
+                f'{args.rows / plain:,.0f}',
+                f'{args.rows / deduped:,.0f}',
+                f'{plain / deduped:.1f}x',
+                f'{stats.seconds_saved * 1e3:,.0f}',
+            )
+        )
+        table = DedupTable(registry.resolve(None), args.max_size)
+        results = [r for _, r in validate_stream(texts, dedup=table)]
+        streamed = DedupStats.merge(r.dedup or DedupStats() for r in results)
+        stream_rows.append(
+            (
+                label,
+                f'{streamed.ratio:.1%}',
+                f'{streamed.spilled:,}',
+                f'{streamed.seconds_saved * 1e3:,.0f}',
+            )
+        )
+    print(f'validate_many over {args.rows:,} texts, {len(registry)} checks')
+    print_table(
+        (
+            'distinct',
+            'dedup ratio',
+            'plain items/sec',
+            'dedup items/sec',
+            'speedup',
+            'saved ms',
+        ),
+        rows,
+    )
+    print(f'\nvalidate_stream with a table of {args.max_size:,} values')
+    print_table(
+        ('distinct', 'dedup ratio', 'spilled', 'saved ms'), stream_rows
+    )
+
+
+if __name__ == '__main__':
+    main()
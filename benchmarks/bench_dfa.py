@@ -0,0 +1,97 @@
+"""Table-driven `dfa` engine vs the regexes for the lookaround-free checks.
+
+Three measurements:
+
+- per call: the bare regex `match` against the check's automaton on a
+  valid value, a near miss and a garbage value of the seeded corpus
+- one pass: every check of `DFA_CHECKS` on a mixed corpus, as one
+  regex call per check against one run of their product automaton
+- worst case: both on the `benchmarks.corpus.ADVERSARIAL` inputs that
+  grow with `--size`, for the unbounded checks `alphanumeric` and
+  `slug`
+
+Run with `uv run python -m benchmarks.bench_dfa`.
+"""
+
+import argparse
+import random
+import timeit
+
+from benchmarks.common import best_of, print_table
+from benchmarks.corpus import ADVERSARIAL, KINDS, generate, pool
+from lsre.dfa import CHECKS, DFA_CHECKS, compile_checks
+from lsre.registry import registry
+
+
+def _per_call_ns(func: object, text: str, number: int) -> float:
+    """Return the best per-call time of `func(text)` in nanoseconds."""
+    timer = timeit.Timer('func(text)', globals={'func': func, 'text': text})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    """Run the benchmark and print latency, items/sec and worst cases."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=100_000)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--size', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = []
+    for name in DFA_CHECKS:
+        for kind in KINDS:
+            text = pool(name, kind, 1)[0]
+            regex = _per_call_ns(registry[name].match, text, args.number)
+            dfa = _per_call_ns(CHECKS[name], text, args.number)
+            rows.append(
+                (
+                    name,
+                    kind,
+                    f'{regex:.0f}',
+                    f'{dfa:.0f}',
+                    f'{regex / dfa:.2f}x',
+                )
+            )
+    print('per call, ns')
+    print_table(('check', 'input', 're', 'dfa', 'speedup'), rows)
+
+    texts = [
+        value
+        for name in registry
+        for _, value in generate(name, args.rows // len(registry) + 1)
+    ]
+    random.Random(0).shuffle(texts)
+    texts = texts[: args.rows]
+    matches = [registry[name].match for name in DFA_CHECKS]
+    mask = compile_checks(DFA_CHECKS).mask
+    regex = best_of(
+        lambda: [[match(text) for match in matches] for text in texts], 3
+    )
+    product = best_of(lambda: list(map(mask, texts)), 3)
+    print(f'\n{len(DFA_CHECKS)} checks over {len(texts):,} texts, items/sec')
+    print_table(
+        ('one regex per check', 'product automaton', 'speedup'),
+        [
+            (
+                f'{len(texts) / regex:,.0f}',
+                f'{len(texts) / product:,.0f}',
+                f'{regex / product:.2f}x',
+            )
+        ],
+    )
+
+    rows = []
+    for name in ('alphanumeric', 'slug'):
+        for label, make in ADVERSARIAL.items():
+            text = make(args.size)
+            regex = best_of(lambda m=registry[name].match, t=text: m(t), 3)
+            dfa = best_of(lambda c=CHECKS[name], t=text: c(t), 3)
+            rows.append(
+                (name, label, f'{regex * 1e3:.2f}', f'{dfa * 1e3:.2f}')
+            )
+    print(f'\nworst cases of {args.size:,} characters, ms')
+    print_table(('check', 'input', 're', 'dfa'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Hand-written `fast` engine vs the regexes for the fixed-shape checks.
+
+For each check with a hand-written version, times the bare regex
+`match` against the `lsre.fastpath` function on a valid value, a
+near miss and an unrelated string, then compares `validate_many`
+throughput under both engines over a mix of all three.
+
+Run with `uv run python -m benchmarks.bench_engines`.
+"""
+
+import argparse
+import itertools
+import timeit
+
+import lsre
+from benchmarks.common import best_of, print_table
+from lsre.fastpath import CHECKS
+from lsre.registry import registry
+
+INPUTS = {
+    'ipv4': ('192.168.100.200', '192.168.100.256', 'hello world'),
+    'ipv6': ('2001:db8:85a3::8a2e:370:7334', '2001:db8:85a3::8a2e:370:', '::'),
+    'hex_color': ('#1a2b3c', '#1a2b3g', 'hello world'),
+}
+"""Valid value, near miss and unrelated string per check."""
+
+
+def _per_call_ns(func: object, text: str, number: int) -> float:
+    """Return the best per-call time of `func(text)` in nanoseconds."""
+    timer = timeit.Timer('func(text)', globals={'func': func, 'text': text})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    """Run the benchmark and print per-call latency and items/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=200_000)
+    parser.add_argument('--rows', type=int, default=300_000)
+    args = parser.parse_args()
+
+    rows = []
+    for name, texts in INPUTS.items():
+        match = registry[name].match
+        for label, text in zip(
+            ('valid', 'near miss', 'other'), texts, strict=True
+        ):
+            regex = _per_call_ns(match, text, args.number)
+            fast = _per_call_ns(CHECKS[name], text, args.number)
+            rows.append(
+                (
+                    name,
+                    label,
+                    f'{regex:.0f}',
+                    f'{fast:.0f}',
+                    f'{regex / fast:.1f}x',
+                )
+            )
+    print('per call, ns')
+    print_table(('check', 'input', 're', 'fast', 'speedup'), rows)
+
+    rows = []
+    for name, texts in INPUTS.items():
+        items = list(itertools.islice(itertools.cycle(texts), args.rows))
+        regex = best_of(lambda n=name, i=items: lsre.validate_many(i, n))
+        fast = best_of(
+            lambda n=name, i=items: lsre.validate_many(i, n, engine='fast')
+        )
+        rows.append(
+            (
+                name,
+                f'{args.rows / regex:,.0f}',
+                f'{args.rows / fast:,.0f}',
+                f'{regex / fast:.1f}x',
+            )
+        )
+    print(f'\nvalidate_many over {args.rows:,} texts, items/sec')
+    print_table(('check', 're', 'fast', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Throughput of the memory-mapped extraction scanner.
+
+A synthetic access log of `--mb` megabytes is generated, then searched
+with `lsre.extract.scan_file` and, as a baseline, by splitting every
+line into tokens and running the `is_*` functions on each token.
+
+Run with `uv run python -m benchmarks.bench_extract`.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import lsre
+from benchmarks.common import print_table
+from lsre.extract import scan_file
+
+KINDS = ('url', 'email', 'uuid', 'ipv6', 'ipv4')
+
+
+def _log_line(rng: random.Random) -> str:
+    """Return one access-log style line with a few values in it."""
+    ip = '.'.join(str(rng.randrange(256)) for _ in range(4))
+    user = f'user{rng.randrange(10_000)}@example{rng.randrange(100)}.com'
+    request_id = '%08x-%04x-%04x-%04x-%012x' % (  # noqa: UP031
+        rng.getrandbits(32),
+        rng.getrandbits(16),
+        rng.getrandbits(16),
+        rng.getrandbits(16),
+        rng.getrandbits(48),
+    )
+    path = rng.choice(['/', '/login', '/api/v1/items', '/static/app.js'])
+    return (
+        f'{ip} - {user} [22/Aug/2025:10:00:00 +0000] "GET {path} HTTP/1.1" '
+        f'200 {rng.randrange(10_000)} "https://example.com{path}" '
+        f'request_id={request_id}\n'
+    )
+
+
+def _write_log(path: Path, megabytes: float) -> None:
+    """Write a synthetic log of about `megabytes` MB to `path`."""
+    rng = random.Random(0)
+    target = int(megabytes * 1e6)
+    written = 0
+    with path.open('w', encoding='ascii') as f:
+        while written < target:
+            line = _log_line(rng)
+            f.write(line)
+            written += len(line)
+
+
+def _tokenize_and_validate(path: Path) -> int:
+    """Count values by validating every whitespace-separated token."""
+    checks = [getattr(lsre, f'is_{kind}') for kind in KINDS]
+    found = 0
+    with path.open(encoding='ascii') as f:
+        for line in f:
+            for token in line.split():
+                found += any(check(token.strip('"')) for check in checks)
+    return found
+
+
+def main() -> None:
+    """Run the benchmark and print MB/s."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'access.log'
+        _write_log(path, args.mb)
+        size = path.stat().st_size / 1e6
+
+        start = time.perf_counter()
+        spans = sum(1 for _ in scan_file(path))
+        scanned = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tokens = _tokenize_and_validate(path)
+        tokenized = time.perf_counter() - start
+
+    print(f'{size:,.1f} MB synthetic access log')
+    print_table(
+        ('method', 'values', 'MB/s'),
+        [
+            ('extract.scan_file', f'{spans:,}', f'{size / scanned:,.1f}'),
+            ('split + is_*', f'{tokens:,}', f'{size / tokenized:,.1f}'),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Startup cost of `lsre` in a fresh interpreter.
+
+Starts `--runs` new Python processes per step and reports the median
+cumulative time `python -X importtime` gives for `import lsre`, then
+the time of the first `is_email` call, which loads the validators and
+loguru, and of importing every submodule up front as `lsre` did before
+it was lazy.
+
+Run with `uv run python -m benchmarks.bench_import`.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import print_table
+
+STEPS = {
+    'import lsre': 'import lsre',
+    'first is_email call': (
+        'import lsre, time; t = time.perf_counter(); '
+        "lsre.is_email('a@b.co'); "
+        'print(int((time.perf_counter() - t) * 1e6))'
+    ),
+    'every submodule eagerly': (
+        'import time; t = time.perf_counter(); '
+        'import lsre.batch, lsre.classifier, lsre.regex_functions; '
+        'print(int((time.perf_counter() - t) * 1e6))'
+    ),
+}
+"""Step name to the program timing it."""
+
+
+def _run(program: str) -> int:
+    """Return the microseconds one fresh interpreter spends on `program`."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', program],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    if result.stdout:
+        return int(result.stdout)
+    last = result.stderr.splitlines()[-1]
+    return int(last.split('|')[1])
+
+
+def main() -> None:
+    """Run the benchmark and print median milliseconds per step."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for label, program in STEPS.items():
+        timings = [_run(program) for _ in range(args.runs)]
+        rows.append((label, f'{statistics.median(timings) / 1e3:.2f}'))
+    print(f'median of {args.runs} fresh interpreters')
+    print_table(('step', 'ms'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Luhn-checked card validation, scalar and vectorized.
+
+`--rows` card candidates of 13 to 19 digits are generated, half of them
+grouped by spaces and a tenth with a valid check digit. Reported in
+items/sec:
+
+- the current `is_credit_card` regex alone, which skips the checksum
+- that regex followed by a typical pure-Python Luhn loop, the second
+  pass this module replaces
+- `is_credit_card(luhn=True)` and `is_credit_card(extended=True)`
+- `validate_cards` on the list and on a NumPy array built beforehand
+- the checksum alone: the loop above, `luhn_valid` and
+  `luhn_valid_many`
+
+Run with `uv run python -m benchmarks.bench_luhn`.
+"""
+
+import argparse
+import random
+
+import numpy as np
+
+import lsre
+from benchmarks.common import best_of, print_table
+from lsre.luhn import luhn_valid, luhn_valid_many, validate_cards
+
+
+def _candidates(rows: int) -> list[str]:
+    """Return `rows` card numbers, about a tenth of them Luhn-valid."""
+    rng = random.Random(0)
+    numbers = []
+    for _ in range(rows):
+        body = ''.join(rng.choices('0123456789', k=rng.randint(12, 18)))
+        last = [d for d in '0123456789' if luhn_valid(body + d)]
+        if rng.random() >= 0.1:  # noqa: PLR2004
+            last = rng.choices('0123456789')
+        digits = body + last[0]
+        if rng.random() < 0.5:  # noqa: PLR2004
+            digits = ' '.join(digits[i : i + 4] for i in range(0, 20, 4))
+        numbers.append(digits.strip())
+    return numbers
+
+
+def _python_luhn(number: str) -> bool:
+    """Check the Luhn checksum the way a second pass usually does."""
+    digits = [int(c) for c in number if c.isdigit()]
+    total = 0
+    for i, digit in enumerate(reversed(digits)):
+        value = digit * 2 if i % 2 else digit
+        total += value - 9 if value > 9 else value  # noqa: PLR2004
+    return total % 10 == 0
+
+
+def main() -> None:
+    """Run the benchmark and print items/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = _candidates(args.rows)
+    array = np.array(texts)
+    check = lsre.is_credit_card
+
+    methods = {
+        'is_credit_card, no checksum': lambda: list(map(check, texts)),
+        'is_credit_card + Python Luhn loop': lambda: [
+            check(t) and _python_luhn(t) for t in texts
+        ],
+        'is_credit_card(luhn=True)': lambda: [
+            check(t, luhn=True) for t in texts
+        ],
+        'is_credit_card(extended=True, luhn=True)': lambda: [
+            check(t, extended=True, luhn=True) for t in texts
+        ],
+        'validate_cards(list)': lambda: validate_cards(texts),
+        'validate_cards(array)': lambda: validate_cards(array),
+        'validate_cards(array, extended=True)': lambda: validate_cards(
+            array, extended=True
+        ),
+        'Python Luhn loop alone': lambda: list(map(_python_luhn, texts)),
+        'luhn_valid alone': lambda: list(map(luhn_valid, texts)),
+        'luhn_valid_many(array) alone': lambda: luhn_valid_many(array),
+    }
+    baseline = 0.0
+    rows = []
+    for label, method in methods.items():
+        seconds = best_of(method, args.repeat)
+        baseline = baseline or seconds
+        rows.append(
+            (
+                label,
+                f'{args.rows / seconds:,.0f}',
+                f'{baseline / seconds:.2f}x',
+            )
+        )
+    accepted = [check(t, extended=True, luhn=True) for t in texts]
+    print(
+        f'{args.rows:,} candidates, {sum(accepted):,} accepted '
+        'with extended=True, luhn=True'
+    )
+    print_table(('method', 'items/sec', 'vs regex'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Per-call cost of the metrics hooks, disabled vs enabled.
+
+`is_ipv4` is timed against its compiled pattern alone and against its
+body without the type check, cache and metrics decorators, so the rows
+show what the decorators add while metrics and caching are off.
+
+Run with `uv run python -m benchmarks.bench_metrics`.
+"""
+
+import argparse
+import inspect
+import timeit
+
+from benchmarks.common import load_samples, print_table
+from lsre import is_ipv4, metrics
+from lsre.registry import registry
+
+
+def main() -> None:
+    """Run the benchmark and print ns/call."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=20_000)
+    args = parser.parse_args()
+
+    samples = load_samples()
+    match = registry['ipv4'].match
+    body = inspect.unwrap(is_ipv4)
+    calls = args.number * len(samples)
+
+    def bare() -> None:
+        for text in samples:
+            match(text)
+
+    def undecorated() -> None:
+        for text in samples:
+            body(text)
+
+    def public() -> None:
+        for text in samples:
+            is_ipv4(text)
+
+    rows = []
+    for label, func, enabled in [
+        ('compiled pattern only', bare, False),
+        ('is_ipv4 body, no decorators', undecorated, False),
+        ('is_ipv4, metrics disabled', public, False),
+        ('is_ipv4, metrics enabled', public, True),
+    ]:
+        if enabled:
+            metrics.enable()
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=3))
+        metrics.disable()
+        rows.append((label, f'{elapsed / calls * 1e9:,.0f}'))
+    print_table(('scenario', 'ns/call'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Scaling of the process- and thread-pool engines with the workers.
+
+`--rows` texts built from the `configs/config.yaml` samples are
+validated serially with `lsre.stream.validate_stream` and then with
+`lsre.parallel.imap_validate` in each pool at each worker count.
+
+Threads only scale without the GIL; compare by running this on both
+builds:
+
+    uv run python -m benchmarks.bench_parallel
+    uv run --python 3.13t python -m benchmarks.bench_parallel
+"""
+
+import argparse
+import itertools
+import os
+import platform
+import time
+from collections.abc import Iterable
+
+from benchmarks.common import load_samples, print_table
+from lsre.parallel import POOLS, gil_enabled, imap_validate
+from lsre.registry import registry
+from lsre.stream import validate_stream
+
+
+def _drain(chunks: Iterable[object]) -> None:
+    """Consume `chunks` without keeping them."""
+    for _ in chunks:
+        pass
+
+
+def main() -> None:
+    """Run the benchmark and print items/sec per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    parser.add_argument('--checks', nargs='+', choices=list(registry))
+    parser.add_argument('--pools', nargs='+', choices=POOLS, default=POOLS)
+    args = parser.parse_args()
+
+    samples = load_samples()
+    texts = list(itertools.islice(itertools.cycle(samples), args.rows))
+
+    start = time.perf_counter()
+    _drain(validate_stream(texts, args.checks, args.chunk_size))
+    serial = time.perf_counter() - start
+    rows = [('serial', f'{args.rows / serial:,.0f}', '1.0x')]
+
+    for pool, workers in itertools.product(args.pools, args.workers):
+        start = time.perf_counter()
+        _drain(
+            imap_validate(
+                texts,
+                args.checks,
+                workers=workers,
+                chunk_size=args.chunk_size,
+                pool=pool,
+            )
+        )
+        elapsed = time.perf_counter() - start
+        rows.append(
+            (
+                f'{pool} x{workers}',
+                f'{args.rows / elapsed:,.0f}',
+                f'{serial / elapsed:.1f}x',
+            )
+        )
+    build = 'GIL enabled' if gil_enabled() else 'GIL disabled'
+    print(
+        f'{args.rows:,} texts on {os.cpu_count()} CPUs, '
+        f'Python {platform.python_version()}, {build}'
+    )
+    print_table(('engine', 'items/sec', 'vs serial'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Parse-once `lsre.parse` vs checking then parsing with the stdlib.
+
+For each of `ipv4`, `ipv6`, `uuid` and `hex_color`, `--rows` texts are
+drawn from the seeded corpus, nine valid values to every near miss, and
+turned into values three ways:
+
+- `is_*` and then `ipaddress`, `uuid.UUID` or `int(..., 16)` on the
+  valid texts, into a list of objects
+- `parse_*` per text, into a list of ints
+- `parse_*_many`, into a `Packed` array and mask
+
+Reports items/sec and the memory the result holds per text, measured
+with `tracemalloc` in a separate run.
+
+Run with `uv run python -m benchmarks.bench_parse`.
+"""
+
+import argparse
+import ipaddress
+import random
+import tracemalloc
+import uuid
+from collections.abc import Callable
+
+import lsre
+from benchmarks.common import best_of, print_table
+from benchmarks.corpus import pool
+from lsre import parse
+
+
+def _ipv4(text: str) -> ipaddress.IPv4Address | None:
+    """Parse an address `is_ipv4` accepts, unless it has leading zeros."""
+    try:
+        return ipaddress.IPv4Address(text)
+    except ValueError:
+        return None
+
+
+def _color(text: str) -> int:
+    """Parse a colour `is_hex_color` accepts."""
+    digits = text[1:]
+    if len(digits) == 3:  # noqa: PLR2004
+        digits = ''.join(c * 2 for c in digits)
+    return int(digits, 16)
+
+
+BASELINES: dict[str, tuple[Callable[[str], bool], Callable[[str], object]]] = {
+    'ipv4': (lsre.is_ipv4, _ipv4),
+    'ipv6': (lsre.is_ipv6, ipaddress.IPv6Address),
+    'uuid': (lsre.is_uuid, uuid.UUID),
+    'hex_color': (lsre.is_hex_color, _color),
+}
+"""Check name to its `is_*` function and stdlib parser."""
+
+
+def _texts(name: str, rows: int) -> list[str]:
+    """Return `rows` texts for `name`, a tenth of them near misses."""
+    texts = pool(name, 'valid', 1_000) * 9 + pool(name, 'near_miss', 1_000)
+    return random.Random(0).choices(texts, k=rows)
+
+
+def _retained(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the result of `build`."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    """Run the benchmark and print items/sec and bytes per text."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for name, (check, stdlib) in BASELINES.items():
+        texts = _texts(name, args.rows)
+        scalar = getattr(parse, f'parse_{name}')
+        many = getattr(parse, f'parse_{name}_many')
+        methods: dict[str, Callable[[], object]] = {
+            f'is_{name} + stdlib': lambda c=check, p=stdlib, t=texts: [
+                p(text) if c(text) else None for text in t
+            ],
+            f'parse_{name}': lambda s=scalar, t=texts: list(map(s, t)),
+            f'parse_{name}_many': lambda m=many, t=texts: m(t),
+        }
+        baseline = 0.0
+        for label, method in methods.items():
+            seconds = best_of(method, args.repeat)
+            baseline = baseline or seconds
+            rows.append(
+                (
+                    label,
+                    f'{args.rows / seconds:,.0f}',
+                    f'{baseline / seconds:.2f}x',
+                    f'{_retained(method) / args.rows:.1f}',
+                )
+            )
+    print(f'{args.rows:,} texts per check, 90% valid')
+    print_table(('method', 'items/sec', 'speedup', 'bytes/text'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Regex calls avoided by the fingerprint prefilter, and what it saves.
+
+Two workloads of `--rows` texts, all 13 checks:
+
+- samples: the `configs/config.yaml` samples, repeated
+- corpus: valid, near-miss and garbage values of every check from the
+  seeded corpus of `benchmarks.corpus`, shuffled
+
+For each, reports the share of (text, check) pairs `lsre.prefilter`
+rules out, which is the share of regex calls `validate_many` avoids,
+and items/sec of `validate_many` and `classify_many` with and without
+the prefilter.
+
+Run with `uv run python -m benchmarks.bench_prefilter`.
+"""
+
+import argparse
+import itertools
+import random
+
+import lsre
+from benchmarks.common import best_of, load_samples, print_table
+from benchmarks.corpus import generate
+from lsre.prefilter import screen
+from lsre.registry import registry
+
+
+def _workloads(rows: int) -> dict[str, list[str]]:
+    """Return workload name to texts."""
+    samples = list(itertools.islice(itertools.cycle(load_samples()), rows))
+    corpus = [
+        value
+        for name in registry
+        for _, value in generate(name, rows // len(registry) + 1)
+    ]
+    random.Random(0).shuffle(corpus)
+    return {'samples': samples, 'corpus': corpus[:rows]}
+
+
+def main() -> None:
+    """Run the benchmark and print the avoided calls and items/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for label, texts in _workloads(args.rows).items():
+        screens = screen(texts)
+        allowed = sum(flags.count(1) for flags in screens)
+        avoided = 1 - allowed / (len(texts) * len(registry))
+        for func in (lsre.validate_many, lsre.classify_many):
+            plain = best_of(
+                lambda f=func, t=texts: f(t, prefilter=False), args.repeat
+            )
+            screened = best_of(lambda f=func, t=texts: f(t), args.repeat)
+            rows.append(
+                (
+                    label,
+                    f'{avoided:.0%}',
+                    func.__name__,
+                    f'{len(texts) / plain:,.0f}',
+                    f'{len(texts) / screened:,.0f}',
+                    f'{plain / screened:.1f}x',
+                )
+            )
+    print(f'{args.rows:,} texts, {len(registry)} checks, items/sec')
+    print_table(
+        (
+            'workload',
+            'calls avoided',
+            'function',
+            'no prefilter',
+            'prefilter',
+            'speedup',
+        ),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Throughput of the streaming PII redactor on synthetic logs.
+
+A synthetic application log of `--mb` megabytes is generated, with an
+email on most lines and a phone or card number on some. It is then
+copied with `lsre.redact.Redactor.redact_file` under each mask and, as
+a baseline, by splitting every line into tokens and replacing those
+`is_email`, `is_phone_number` or `is_credit_card` accept. The baseline
+misses numbers written with spaces, which span several tokens.
+
+Run with `uv run python -m benchmarks.bench_redact`.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import lsre
+from benchmarks.common import print_table
+from lsre.redact import MASKS, Redactor
+
+
+def _log_line(rng: random.Random) -> str:
+    """Return one application log line with some PII in it."""
+    user = f'user{rng.randrange(10_000)}@example{rng.randrange(100)}.com'
+    fields = [
+        f'2025-08-22T10:{rng.randrange(60):02d}:00Z',
+        rng.choice(['INFO', 'WARN', 'DEBUG']),
+        f'request_id={rng.getrandbits(64):016x}',
+        f'user={user}',
+        f'latency_ms={rng.randrange(1_000)}',
+    ]
+    roll = rng.random()
+    if roll < 0.2:  # noqa: PLR2004
+        area, line = rng.randrange(200, 999), rng.randrange(100, 199)
+        fields.append(f'phone=+1-{area}-555-0{line}')
+    elif roll < 0.3:  # noqa: PLR2004
+        groups = [f'{rng.randrange(10_000):04d}' for _ in range(4)]
+        fields.append(f'card={" ".join(groups)}')
+    return ' '.join(fields) + ' msg="checkout completed"\n'
+
+
+def _write_log(path: Path, megabytes: float) -> None:
+    """Write a synthetic log of about `megabytes` MB to `path`."""
+    rng = random.Random(0)
+    target = int(megabytes * 1e6)
+    written = 0
+    with path.open('w', encoding='ascii') as f:
+        while written < target:
+            line = _log_line(rng)
+            f.write(line)
+            written += len(line)
+
+
+def _split_and_validate(path: Path, target: Path) -> int:
+    """Redact tokens the validators accept, counting them."""
+    checks = (lsre.is_email, lsre.is_phone_number, lsre.is_credit_card)
+    found = 0
+    with (
+        path.open(encoding='ascii') as source,
+        target.open('w', encoding='ascii') as out,
+    ):
+        for line in source:
+            tokens = line.split()
+            for i, token in enumerate(tokens):
+                _, _, value = token.rpartition('=')
+                if any(check(value) for check in checks):
+                    tokens[i] = token[: len(token) - len(value)] + '[PII]'
+                    found += 1
+            out.write(' '.join(tokens) + '\n')
+    return found
+
+
+def main() -> None:
+    """Run the benchmark and print MB/s."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=100)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'app.log'
+        target = Path(tmp) / 'clean.log'
+        _write_log(path, args.mb)
+        size = path.stat().st_size / 1e6
+        for mask in MASKS:
+            redactor = Redactor(mask=mask, key=b'benchmark')
+            start = time.perf_counter()
+            counts = redactor.redact_file(path, target)
+            elapsed = time.perf_counter() - start
+            rows.append(
+                (
+                    f'redact_file, {mask}',
+                    f'{sum(counts.values()):,}',
+                    f'{size / elapsed:,.1f}',
+                )
+            )
+        start = time.perf_counter()
+        found = _split_and_validate(path, target)
+        elapsed = time.perf_counter() - start
+        rows.append(('split + is_*', f'{found:,}', f'{size / elapsed:,.1f}'))
+
+    print(f'{size:,.1f} MB synthetic application log')
+    print_table(('method', 'values', 'MB/s'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Per-call latency of the `is_*` functions vs the pre-registry path.
+
+Every check is run over the `configs/config.yaml` samples, once through
+a replica of the validators as they were before the registry and once
+through the public `lsre.is_*` function. The replica keeps what each
+old call did: the string type check, a `logger.debug` f-string before
+and after, and `re.match(pattern=source, ...)`, with loguru configured
+as `lsre` used to configure it (a single INFO handler on stderr). The
+cache pressure column pushes throwaway patterns through the `re` module
+cache before each pass, as an application using many patterns would.
+
+Run with `uv run python -m benchmarks.bench_registry`.
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+import lsre
+from benchmarks.common import load_samples, print_table
+from lsre.registry import registry
+from lsre.utils import enforce_str_arg
+
+
+def _baseline(name: str) -> Callable[[str], bool]:
+    """Return check `name` as the `is_*` functions used to run it."""
+    source, flags = registry.source(name)
+
+    @enforce_str_arg
+    def check(text: str) -> bool:
+        logger.debug(f'Checking if {text} is {name}')
+        match = re.match(pattern=source, string=text, flags=flags)
+        logger.debug(f'Match result: {match}')
+        return match is not None
+
+    return check
+
+
+def _pollute_re_cache(count: int) -> None:
+    """Push `count` throwaway patterns through the `re` module cache."""
+    for i in range(count):
+        re.match(f'pollution-{i}', '')
+
+
+def _time_passes(
+    check: Callable[[str], bool],
+    samples: list[str],
+    passes: int,
+    pollute: int,
+) -> float:
+    """Return seconds per call of the fastest pass, excluding pollution."""
+    fastest = float('inf')
+    for _ in range(passes):
+        _pollute_re_cache(pollute)
+        start = time.perf_counter()
+        for text in samples:
+            check(text)
+        fastest = min(fastest, time.perf_counter() - start)
+    return fastest / len(samples)
+
+
+def _row(name: str, timings: list[float]) -> tuple[str, ...]:
+    """Format ns/call and speedups of the four `timings` of a check."""
+    before, after, pressured_before, pressured_after = timings
+    return (
+        name,
+        f'{before * 1e9:,.0f}',
+        f'{after * 1e9:,.0f}',
+        f'{before / after:.1f}x',
+        f'{pressured_before * 1e9:,.0f}',
+        f'{pressured_after * 1e9:,.0f}',
+        f'{pressured_before / pressured_after:.1f}x',
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print per-call latency."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--passes', type=int, default=200)
+    parser.add_argument('--pollution', type=int, default=600)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level='INFO')
+    samples = load_samples()
+    totals = [0.0] * 4
+    rows = []
+    for name in registry:
+        old = _baseline(name)
+        new = getattr(lsre, f'is_{name}')
+        timings = [
+            _time_passes(check, samples, args.passes, pollute)
+            for pollute in (0, args.pollution)
+            for check in (old, new)
+        ]
+        totals = [t + s for t, s in zip(totals, timings, strict=True)]
+        rows.append(_row(name, timings))
+    rows.append(_row('mixed', [t / len(registry) for t in totals]))
+
+    print(f'{len(samples)} samples, fastest of {args.passes} passes, ns/call')
+    print_table(
+        (
+            'check',
+            'before',
+            'is_*',
+            'speedup',
+            'before+pressure',
+            'is_*+pressure',
+            'speedup',
+        ),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Load test of the HTTP validation service with and without batching.
+
+Starts `python -m lsre.server` in a subprocess for each configuration,
+then sends `--requests` requests of `--texts` sample texts each over
+`--connections` concurrent keep-alive connections, checking every
+built-in check. Reports requests/sec, p50 and p99 latency, and how many
+requests the server merged into each batch, read from `/metrics`.
+
+Run with `uv run python -m benchmarks.bench_server`.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import load_samples, print_table
+
+CONFIGS = {
+    'one batch per request': ['--max-batch', '1'],
+    'batch same loop turn': ['--max-delay-ms', '0'],
+    'batch within 2 ms': ['--max-delay-ms', '2'],
+}
+"""Configuration name to extra `lsre.server` arguments."""
+
+
+async def _send(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    body: bytes = b'',
+) -> bytes:
+    """Send one request over an open connection and return its body."""
+    head = f'{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n'
+    writer.write(head.encode() + body)
+    await reader.readline()
+    length = 0
+    while (line := await reader.readline()) != b'\r\n':
+        name, _, value = line.decode().partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    return await reader.readexactly(length)
+
+
+async def _load(
+    port: int, bodies: list[bytes], connections: int
+) -> tuple[float, list[float], str]:
+    """Send `bodies` over `connections` connections.
+
+    Returns:
+        tuple[float, list[float], str]: total seconds, seconds per
+            request and the `/metrics` text afterwards
+    """
+    latencies: list[float] = []
+
+    async def client(share: list[bytes]) -> None:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        for body in share:
+            start = time.perf_counter()
+            await _send(reader, writer, 'POST', '/validate', body)
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(bodies[i::connections]) for i in range(connections))
+    )
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    text = await _send(reader, writer, 'GET', '/metrics')
+    writer.close()
+    return elapsed, latencies, text.decode()
+
+
+def _counter(text: str, name: str) -> int:
+    """Return the value of a counter in Prometheus text."""
+    return next(
+        int(line.split()[-1])
+        for line in text.splitlines()
+        if line.startswith(f'{name} ')
+    )
+
+
+def main() -> None:
+    """Run the load test and print throughput and latency."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5_000)
+    parser.add_argument('--texts', type=int, default=10)
+    parser.add_argument('--connections', type=int, default=32)
+    args = parser.parse_args()
+
+    samples = itertools.cycle(load_samples())
+    bodies = [
+        json.dumps(
+            {'texts': list(itertools.islice(samples, args.texts))}
+        ).encode()
+        for _ in range(args.requests)
+    ]
+
+    rows = []
+    for label, extra in CONFIGS.items():
+        command = [sys.executable, '-m', 'lsre.server', '--port', '0']
+        with subprocess.Popen(  # noqa: S603
+            [*command, *extra], stdout=subprocess.PIPE, text=True
+        ) as process:
+            assert process.stdout is not None  # noqa: S101
+            port = int(process.stdout.readline().rsplit(':', 1)[1])
+            elapsed, latencies, text = asyncio.run(
+                _load(port, bodies, args.connections)
+            )
+            process.terminate()
+        percentiles = statistics.quantiles(
+            latencies, n=100, method='inclusive'
+        )
+        batches = _counter(text, 'lsre_server_batches_total')
+        rows.append(
+            (
+                label,
+                f'{args.requests / elapsed:,.0f}',
+                f'{percentiles[49] * 1e3:.2f}',
+                f'{percentiles[98] * 1e3:.2f}',
+                f'{args.requests / batches:.1f}',
+            )
+        )
+    print(
+        f'{args.requests:,} requests of {args.texts} texts over '
+        f'{args.connections} connections, all checks'
+    )
+    print_table(
+        ('server', 'requests/sec', 'p50 ms', 'p99 ms', 'requests/batch'),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Throughput and memory of the streaming pipeline over a large file.
+
+A file of `--rows` lines is generated from the `configs/config.yaml`
+samples, then read, validated and written as JSONL to `os.devnull`
+through the same functions `python -m lsre` uses. Peak RSS is reported
+for each size to show memory does not grow with the input.
+
+Run with `uv run python -m benchmarks.bench_stream`.
+"""
+
+import argparse
+import itertools
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import load_samples, print_table
+from lsre.registry import registry
+from lsre.stream import read_lines, validate_stream, write_csv, write_jsonl
+
+
+def _write_input(path: Path, rows: int) -> None:
+    """Write `rows` sample lines to `path`."""
+    lines = itertools.islice(itertools.cycle(load_samples()), rows)
+    with path.open('w', encoding='utf-8') as f:
+        f.writelines(f'{line}\n' for line in lines)
+
+
+def main() -> None:
+    """Run the benchmark and print lines/sec, MB/s and peak RSS."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--rows', type=int, nargs='+', default=[100_000, 1_000_000]
+    )
+    parser.add_argument('--checks', nargs='+', choices=list(registry))
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl')
+    args = parser.parse_args()
+
+    table = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f'{rows}.txt'
+            _write_input(path, rows)
+            size = path.stat().st_size
+            start = time.perf_counter()
+            with Path(os.devnull).open('w', encoding='utf-8') as out:
+                chunks = validate_stream(read_lines([path]), args.checks)
+                if args.format == 'csv':
+                    write_csv(chunks, out, args.checks)
+                else:
+                    write_jsonl(chunks, out)
+            elapsed = time.perf_counter() - start
+            peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            table.append(
+                (
+                    f'{rows:,}',
+                    f'{size / 1e6:,.1f}',
+                    f'{rows / elapsed:,.0f}',
+                    f'{size / 1e6 / elapsed:,.2f}',
+                    f'{peak_mb:,.0f}',
+                )
+            )
+            path.unlink()
+    print_table(
+        ('lines', 'input MB', 'lines/sec', 'MB/s', 'peak RSS MB'), table
+    )
+
+
+if __name__ == '__main__':
+    main()
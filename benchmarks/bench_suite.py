@@ -0,0 +1,190 @@
+"""Per-call latency and batch throughput of every check, with baselines.
+
+Generates a seeded corpus per check with `benchmarks.corpus`, then
+measures:
+
+- `latency_ns`: mean time of one `is_*` call on valid, near-miss and
+  garbage inputs
+- `throughput`: items/sec of `validate_many` over the whole corpus, at
+  every requested size
+
+Results are written as JSON. Given a previous run with `--baseline`,
+every metric that got worse by more than `--threshold` (a fraction,
+default 0.2) is reported and the exit status is 1, so the suite can
+gate a pattern change:
+
+    just bench suite --output before.json
+    # change a pattern
+    just bench suite --baseline before.json
+
+Compare runs from the same machine only; on a busy one, per-call
+latencies vary by 10-20% between runs. Sizes up to 10M are supported
+with `--sizes`; `benchmarks.corpus` repeats values past 50K per kind.
+
+Run with `uv run python -m benchmarks.bench_suite`.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import lsre
+from benchmarks.common import best_of, print_table
+from benchmarks.corpus import KINDS, generate
+from lsre.registry import registry
+
+LATENCY_SAMPLES = 1_000
+"""Values per kind timed one call at a time."""
+
+
+def measure(
+    checks: Iterable[str], sizes: Iterable[int], seed: int, repeat: int
+) -> dict[str, Any]:
+    """Run the suite and return its results.
+
+    Args:
+        checks (Iterable[str]): check names
+        sizes (Iterable[int]): corpus sizes for the throughput runs
+        seed (int): corpus seed
+        repeat (int): runs per measurement, the fastest is kept
+
+    Returns:
+        dict[str, Any]: `meta` describing the run, `latency_ns` as
+            check to kind to nanoseconds and `throughput` as check to
+            size to items/sec
+    """
+    sizes = sorted(sizes)
+    latency: dict[str, dict[str, float]] = {}
+    throughput: dict[str, dict[str, float]] = {}
+    for name in checks:
+        func = getattr(lsre, f'is_{name}')
+        corpus = generate(name, LATENCY_SAMPLES * len(KINDS), seed)
+        latency[name] = {}
+        for kind in KINDS:
+            values = [value for k, value in corpus if k == kind]
+            elapsed = best_of(
+                lambda f=func, v=values: [f(value) for value in v], repeat
+            )
+            latency[name][kind] = elapsed / len(values) * 1e9
+        throughput[name] = {}
+        for size in sizes:
+            texts = [value for _, value in generate(name, size, seed)]
+            elapsed = best_of(
+                lambda t=texts, n=name: lsre.validate_many(t, n), repeat
+            )
+            throughput[name][str(size)] = size / elapsed
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'sizes': sizes,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'latency_ns': latency,
+        'throughput': throughput,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[tuple[str, float, float, float]]:
+    """Return the metrics that regressed by more than `threshold`.
+
+    Latency regresses when it grows, throughput when it shrinks.
+    Metrics missing from either run are skipped.
+
+    Args:
+        current (dict[str, Any]): results of `measure`
+        baseline (dict[str, Any]): earlier results of `measure`
+        threshold (float): allowed relative slowdown, e.g. 0.1
+
+    Returns:
+        list[tuple[str, float, float, float]]: metric path, baseline
+            value, current value and relative slowdown
+
+    Examples:
+        >>> old = {'latency_ns': {'ipv4': {'valid': 100.0}}}
+        >>> new = {'latency_ns': {'ipv4': {'valid': 130.0}}}
+        >>> compare(new, old, threshold=0.2)
+        [('latency_ns/ipv4/valid', 100.0, 130.0, 0.3)]
+        >>> compare(new, old, threshold=0.5)
+        []
+    """
+    regressions = []
+    for section, higher_is_better in (
+        ('latency_ns', False),
+        ('throughput', True),
+    ):
+        for name, values in current.get(section, {}).items():
+            before = baseline.get(section, {}).get(name, {})
+            for key, value in values.items():
+                if key not in before:
+                    continue
+                old = before[key]
+                ratio = old / value if higher_is_better else value / old
+                slowdown = round(ratio - 1, 6)
+                if slowdown > threshold:
+                    path = f'{section}/{name}/{key}'
+                    regressions.append((path, old, value, slowdown))
+    return regressions
+
+
+def main() -> None:
+    """Run the suite, write the results and check them against a baseline."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--checks', nargs='+', default=list(registry))
+    parser.add_argument(
+        '--sizes', nargs='+', type=int, default=[1_000, 10_000]
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=Path, default=Path('bench.json'))
+    parser.add_argument('--baseline', type=Path)
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = measure(args.checks, args.sizes, args.seed, args.repeat)
+    args.output.write_text(json.dumps(results, indent=2) + '\n')
+
+    rows = [
+        (
+            name,
+            *(f'{results["latency_ns"][name][kind]:.0f}' for kind in KINDS),
+            *(f'{rate:,.0f}' for rate in results['throughput'][name].values()),
+        )
+        for name in args.checks
+    ]
+    sizes = [f'{size:,}/s' for size in results['meta']['sizes']]
+    print('latency in ns per call, throughput in items/sec')
+    print_table(('check', *KINDS, *sizes), rows)
+    print(f'\nwrote {args.output}')
+
+    if args.baseline is None:
+        return
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(results, baseline, args.threshold)
+    if not regressions:
+        print(f'no regressions over {args.threshold:.0%} vs {args.baseline}')
+        return
+    print(f'\n{len(regressions)} regressions over {args.threshold:.0%}:')
+    print_table(
+        ('metric', 'baseline', 'current', 'slowdown'),
+        [
+            (path, f'{old:,.1f}', f'{new:,.1f}', f'{slowdown:.0%}')
+            for path, old, new, slowdown in regressions
+        ],
+    )
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Helpers shared by the benchmark scripts."""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import yaml
+
+root_dir = Path(__file__).resolve().parent.parent
+
+
+def load_samples() -> list[str]:
+    """Load the sample `text_list` from `configs/config.yaml`.
+
+    Returns:
+        list[str]: sample strings, one per built-in check
+    """
+    config_path = root_dir / 'configs' / 'config.yaml'
+    with config_path.open(encoding='utf-8') as f:
+        return list(yaml.safe_load(f)['text_list'])
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Return the fastest of `repeat` runs of `func` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(header: tuple[str, ...], rows: list[tuple[str, ...]]) -> None:
+    """Print `rows` as an aligned plain-text table."""
+    widths = [
+        max(len(str(row[i])) for row in [header, *rows])
+        for i in range(len(header))
+    ]
+    for row in [header, *rows]:
+        print(
+            '  '.join(
+                f'{cell:>{w}}' for cell, w in zip(row, widths, strict=True)
+            )
+        )
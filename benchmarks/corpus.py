@@ -0,0 +1,246 @@
+"""Seeded synthetic inputs for every built-in check.
+
+Each check gets three kinds of input:
+
+- `valid`: values its pattern accepts, e.g. `10.4.0.255` for `ipv4`
+- `near_miss`: a valid value with one character replaced, inserted or
+  deleted so that the pattern rejects it, e.g. `10.4.0.2x5`
+- `garbage`: random printable text the pattern rejects
+
+`ADVERSARIAL` adds inputs of any length built to make a backtracking
+matcher work as hard as possible: long runs of the characters a pattern
+repeats, ending where a match becomes impossible.
+
+The same seed always gives the same corpus. Generating values one by
+one is slow beyond a few hundred thousand, so each kind is drawn from a
+pool of at most `POOL_SIZE` distinct values; larger corpora repeat them
+in a seeded random order.
+
+Examples:
+    >>> from benchmarks.corpus import generate
+    >>> corpus = generate('ipv4', 6, seed=1)
+    >>> [kind for kind, _ in corpus]
+    ['valid', 'near_miss', 'garbage', 'valid', 'near_miss', 'garbage']
+    >>> generate('ipv4', 6, seed=1) == corpus
+    True
+"""
+
+import random
+import string
+from collections.abc import Callable
+
+from lsre.registry import registry
+
+KINDS = ('valid', 'near_miss', 'garbage')
+"""Kinds of input, in the order `generate` interleaves them."""
+
+POOL_SIZE = 50_000
+"""Most distinct values generated per check and kind."""
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+"""Corpus sizes the benchmark suite knows about."""
+
+_LOWER = string.ascii_lowercase
+_ALNUM = string.ascii_letters + string.digits
+_HEX = '0123456789abcdef'
+_PRINTABLE = string.ascii_letters + string.digits + string.punctuation + ' '
+_MUTATIONS = _PRINTABLE + 'é٠'
+"""Characters a near miss may gain, including a Unicode digit."""
+
+
+def _word(rng: random.Random, alphabet: str, low: int, high: int) -> str:
+    """Return `low` to `high` random characters from `alphabet`."""
+    return ''.join(rng.choices(alphabet, k=rng.randint(low, high)))
+
+
+def _email(rng: random.Random) -> str:
+    local = _word(rng, _LOWER + string.digits, 1, 12)
+    if rng.random() < 0.3:  # noqa: PLR2004
+        local += rng.choice('._+-') + _word(rng, _LOWER, 1, 6)
+    labels = [_word(rng, _LOWER, 2, 10) for _ in range(rng.randint(1, 3))]
+    return f'{local}@{".".join(labels)}.{_word(rng, _LOWER, 2, 4)}'
+
+
+def _url(rng: random.Random) -> str:
+    scheme = rng.choice(('http', 'https', 'ftp'))
+    host = _word(rng, _LOWER + string.digits, 3, 12)
+    port = f':{rng.randint(1, 65535)}' if rng.random() < 0.2 else ''  # noqa: PLR2004
+    path = f'/{_word(rng, _ALNUM, 1, 10)}' if rng.random() < 0.5 else ''  # noqa: PLR2004
+    return f'{scheme}://{host}.com{port}{path}'
+
+
+def _ipv6(rng: random.Random) -> str:
+    groups = [format(rng.getrandbits(16), 'x') for _ in range(8)]
+    if rng.random() < 0.5:  # noqa: PLR2004
+        start = rng.randint(1, 6)
+        end = rng.randint(start + 1, 7)
+        return ':'.join(groups[:start]) + '::' + ':'.join(groups[end:])
+    return ':'.join(groups)
+
+
+def _phone(rng: random.Random) -> str:
+    digits = [_word(rng, string.digits, 3, 3) for _ in range(3)]
+    shape = rng.choice(('+1-{}-{}-{}', '({}) {}-{}', '{}{}{}', '{} {} {}'))
+    return shape.format(*digits) + rng.choice(string.digits)
+
+
+def _card(rng: random.Random) -> str:
+    digits = _word(rng, string.digits, 16, 16)
+    if rng.random() < 0.5:  # noqa: PLR2004
+        return ' '.join(digits[i : i + 4] for i in range(0, 16, 4))
+    return digits
+
+
+def _iso_date(rng: random.Random) -> str:
+    month = rng.choice(('01', '02', '03', '04', '05', '06', '09', '11', '12'))
+    return f'{rng.randint(1900, 2099)}-{month}-{rng.randint(1, 31):02}'
+
+
+def _time(rng: random.Random) -> str:
+    text = f'{rng.randint(0, 23):02}:{rng.randint(0, 59):02}'
+    if rng.random() < 0.5:  # noqa: PLR2004
+        text += f':{rng.randint(0, 59):02}'
+    return text
+
+
+def _password(rng: random.Random) -> str:
+    chars = [
+        rng.choice(_LOWER),
+        rng.choice(string.ascii_uppercase),
+        rng.choice(string.digits),
+        rng.choice('!@#$%&'),
+        *rng.choices(_ALNUM + '!@#$%&', k=rng.randint(4, 12)),
+    ]
+    rng.shuffle(chars)
+    return ''.join(chars)
+
+
+VALID: dict[str, Callable[[random.Random], str]] = {
+    'alphanumeric': lambda rng: _word(rng, _ALNUM, 1, 16),
+    'email': _email,
+    'url': _url,
+    'ipv4': lambda rng: '.'.join(str(rng.randrange(256)) for _ in range(4)),
+    'ipv6': _ipv6,
+    'phone_number': _phone,
+    'credit_card': _card,
+    'iso_date': _iso_date,
+    'time': _time,
+    'hex_color': lambda rng: '#' + _word(rng, _HEX + 'ABCDEF', 3, 6),
+    'uuid': lambda rng: '-'.join(
+        _word(rng, _HEX, n, n) for n in (8, 4, 4, 4, 12)
+    ),
+    'slug': lambda rng: '-'.join(
+        _word(rng, _LOWER + string.digits, 1, 8)
+        for _ in range(rng.randint(1, 4))
+    ),
+    'strong_password': _password,
+}
+"""Check name to a function making one value the check accepts."""
+
+
+def _mutate(rng: random.Random, text: str) -> str:
+    """Replace, insert or delete one character of `text`."""
+    position = rng.randrange(len(text) + 1)
+    edit = rng.randrange(3)
+    if edit == 0 and position < len(text):
+        return text[:position] + text[position + 1 :]
+    char = rng.choice(_MUTATIONS)
+    skip = edit == 1 and position < len(text)
+    return text[:position] + char + text[position + skip :]
+
+
+def _draw(
+    make: Callable[[], str], accept: Callable[[str], bool], count: int
+) -> list[str]:
+    """Return `count` values from `make` that `accept` allows."""
+    values: list[str] = []
+    while len(values) < count:
+        value = make()
+        if accept(value):
+            values.append(value)
+    return values
+
+
+def pool(check: str, kind: str, count: int, seed: int = 0) -> list[str]:
+    """Return `count` generated values of one kind for one check.
+
+    Args:
+        check (str): check name, e.g. `email`
+        kind (str): one of `KINDS`
+        count (int): number of values
+        seed (int): random seed
+
+    Returns:
+        list[str]: values, identical for the same arguments
+
+    Raises:
+        KeyError: If `check` has no generator.
+        ValueError: If `kind` is unknown.
+    """
+    rng = random.Random(f'{seed}-{check}-{kind}')
+    match = registry[check].match
+    valid = VALID[check]
+    if kind == 'valid':
+        return _draw(lambda: valid(rng), lambda v: bool(match(v)), count)
+    if kind == 'near_miss':
+        return _draw(
+            lambda: _mutate(rng, valid(rng)), lambda v: not match(v), count
+        )
+    if kind == 'garbage':
+        return _draw(
+            lambda: _word(rng, _PRINTABLE, 1, 40),
+            lambda v: not match(v),
+            count,
+        )
+    msg = f'Unknown kind {kind!r}, expected any of {list(KINDS)}'
+    raise ValueError(msg)
+
+
+def generate(check: str, size: int, seed: int = 0) -> list[tuple[str, str]]:
+    """Return a corpus of `size` (kind, value) pairs for one check.
+
+    The kinds take turns, so every kind makes up a third of the corpus
+    and any prefix is balanced too.
+
+    Args:
+        check (str): check name, e.g. `email`
+        size (int): number of values
+        seed (int): random seed
+
+    Returns:
+        list[tuple[str, str]]: kind and value pairs
+    """
+    per_kind = -(-size // len(KINDS))
+    distinct = min(per_kind, POOL_SIZE)
+    columns = []
+    for kind in KINDS:
+        values = pool(check, kind, distinct, seed)
+        if per_kind > distinct:
+            rng = random.Random(f'{seed}-{check}-{kind}-order')
+            values = rng.choices(values, k=per_kind)
+        columns.append([(kind, value) for value in values])
+    rows = (pair for row in zip(*columns, strict=True) for pair in row)
+    return list(rows)[:size]
+
+
+def _cycle(unit: str, size: int, tail: str = '') -> str:
+    """Return `unit` repeated to `size` characters, ending with `tail`."""
+    body = unit * (size // len(unit) + 1)
+    return body[: max(size - len(tail), 0)] + tail
+
+
+ADVERSARIAL: dict[str, Callable[[int], str]] = {
+    'letters': lambda size: _cycle('a', size, '!'),
+    'digits': lambda size: _cycle('1', size, 'x'),
+    'spaced digits': lambda size: _cycle('1 ', size, ' '),
+    'dotted labels': lambda size: _cycle('a.', size),
+    'hyphenated': lambda size: _cycle('a-', size, '-'),
+    'email domain': lambda size: 'a@' + _cycle('a-', size - 2, '.c'),
+    'email labels': lambda size: 'a@' + _cycle('a.', size - 2, '1'),
+    'hex groups': lambda size: _cycle('1:', size),
+    'url host': lambda size: 'http://' + _cycle('a.', size - 7),
+    'url userinfo': lambda size: 'http://' + _cycle('a', size - 7, ':'),
+    'no symbol': lambda size: _cycle('aA1', size),
+    'newlines': lambda size: _cycle('1\n', size),
+}
+"""Worst-case input name to a function making one of the given length."""
@@ -30,6 +30,7 @@ def setup_logging(cfg: DictConfig) -> None:
             logger_config['sink'] = sys.stderr
 
         logger.add(**logger_config)
+    logger.enable('lsre')
 
 
 @hydra.main(
@@ -1,29 +1,109 @@
-"""Root `lsre` class."""
-
-import sys
-
-from loguru import logger
-
-from .regex_functions import (
-    is_alphanumeric,
-    is_credit_card,
-    is_email,
-    is_hex_color,
-    is_ipv4,
-    is_ipv6,
-    is_iso_date,
-    is_phone_number,
-    is_slug,
-    is_strong_password,
-    is_time,
-    is_url,
-    is_uuid,
-)
-
-logger.remove()  # Remove default handler
-logger.add(sys.stderr, level='INFO')
+"""Root `lsre` class.
+
+Importing `lsre` loads nothing but this file: the validators, the batch
+functions and the `cache`, `engines` and `metrics` modules are imported
+on first use, and so is loguru. `lsre._log` disables the `lsre` records
+when it imports loguru, as loguru recommends for libraries, and no
+handler is added or removed. As that happens on first use, call
+`logger.enable('lsre')` after the first `lsre` call to see them.
+"""
+
+from importlib import import_module
+
+TYPE_CHECKING = False
+"""Set by type checkers only; `typing` alone would double the import time."""
+
+if TYPE_CHECKING:
+    from . import cache, engines, metrics
+    from .batch import BatchResult, validate_many
+    from .classifier import classify, classify_many
+    from .regex_functions import (
+        is_alphanumeric,
+        is_credit_card,
+        is_email,
+        is_hex_color,
+        is_ipv4,
+        is_ipv6,
+        is_iso_date,
+        is_phone_number,
+        is_slug,
+        is_strong_password,
+        is_time,
+        is_url,
+        is_uuid,
+    )
+
+_SUBMODULES = ('cache', 'engines', 'metrics')
+"""Modules exported as attributes."""
+
+_EXPORTS = {
+    'BatchResult': 'batch',
+    'validate_many': 'batch',
+    'classify': 'classifier',
+    'classify_many': 'classifier',
+    **{
+        f'is_{name}': 'regex_functions'
+        for name in (
+            'alphanumeric',
+            'credit_card',
+            'email',
+            'hex_color',
+            'ipv4',
+            'ipv6',
+            'iso_date',
+            'phone_number',
+            'slug',
+            'strong_password',
+            'time',
+            'url',
+            'uuid',
+        )
+    },
+}
+"""Exported name to the module defining it."""
+
+
+def __getattr__(name: str) -> object:
+    """Import the module behind an exported name on first access.
+
+    Every name the module exports is bound here, so later lookups skip
+    this function. The first lookup also imports `lsre._log`, so the
+    `lsre` records are disabled before any function is called.
+
+    Args:
+        name (str): attribute name
+
+    Returns:
+        object: the exported function, class or module
+
+    Raises:
+        AttributeError: If `name` is not exported.
+    """
+    source = _EXPORTS.get(name)
+    if source is None and name not in _SUBMODULES:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    import_module('._log', __name__)
+    if source is None:
+        return import_module(f'.{name}', __name__)
+    module = import_module(f'.{source}', __name__)
+    for export, defined_in in _EXPORTS.items():
+        if defined_in == source:
+            globals()[export] = getattr(module, export)
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes, including those not yet imported."""
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
+    'BatchResult',
+    'cache',
+    'classify',
+    'classify_many',
+    'engines',
     'is_alphanumeric',
     'is_credit_card',
     'is_email',
@@ -37,4 +117,6 @@ __all__ = [
     'is_time',
     'is_url',
     'is_uuid',
+    'metrics',
+    'validate_many',
 ]
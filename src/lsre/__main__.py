@@ -0,0 +1,5 @@
+"""Entry point for `python -m lsre`."""
+
+from lsre.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,13 @@
+"""Loguru logger shared by the lsre modules, silent by default.
+
+A library should not decide where its records go, so `lsre` adds no
+handlers and disables its own records here, where it first imports
+loguru, as loguru recommends for libraries. Applications opt in with
+`logger.enable('lsre')` after their first `lsre` call.
+"""
+
+from loguru import logger
+
+logger.disable('lsre')
+
+__all__ = ['logger']
@@ -0,0 +1,166 @@
+"""Validate batches from async code without blocking the event loop.
+
+`lsre.validate_many` over a large batch holds the event loop for as
+long as it runs, so every other request handled by the loop waits. The
+functions here split the batch into chunks of `chunk_size` texts and
+hand control back to the loop between chunks, so no other task waits
+longer than one chunk. With `offload_above`, large batches run in an
+executor instead and the loop only waits for the results.
+
+Examples:
+    >>> import asyncio
+    >>> from lsre import aio
+    >>> result = asyncio.run(aio.validate_many(['a', '-'], 'slug'))
+    >>> result['slug']
+    [True, False]
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sized
+from concurrent.futures import Executor
+from functools import partial
+
+from lsre import batch
+from lsre._log import logger
+from lsre.batch import BatchResult
+from lsre.registry import registry
+from lsre.utils import Text, chunked
+
+DEFAULT_CHUNK_SIZE = 1_000
+"""Texts validated between two yields to the loop, ~5 ms with all checks."""
+
+
+async def _achunked[T](
+    items: AsyncIterable[T], size: int
+) -> AsyncIterator[list[T]]:
+    """Split an async iterable into lists of at most `size` items."""
+    if size < 1:
+        msg = f'Chunk size must be at least 1, got {size}'
+        raise ValueError(msg)
+    chunk: list[T] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _chunks[T](
+    items: Iterable[T] | AsyncIterable[T], size: int
+) -> AsyncIterator[list[T]]:
+    """Split sync or async `items` into lists of at most `size` items."""
+    if isinstance(items, AsyncIterable):
+        async for chunk in _achunked(items, size):
+            yield chunk
+    else:
+        for chunk in chunked(items, size):
+            yield chunk
+
+
+async def validate_stream(  # noqa: PLR0913
+    texts: Iterable[Text] | AsyncIterable[Text],
+    checks: Iterable[str] | None = None,
+    *,
+    engine: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+    offload_above: int | None = None,
+) -> AsyncIterator[tuple[list[Text], BatchResult]]:
+    """Validate `texts` chunk by chunk, yielding to the loop in between.
+
+    The async counterpart of `lsre.stream.validate_stream`. Chunks of
+    `chunk_size` texts run on the loop, which gets control back after
+    each one. Once more than `offload_above` texts are known to be in
+    the batch, the chunks run in `executor` instead: for a sized input
+    that is decided up front, for an async iterable from the chunk that
+    takes the count past it.
+
+    Args:
+        texts (Iterable[Text] | AsyncIterable[Text]): values to check,
+            strings or UTF-8 bytes
+        checks (Iterable[str] | None): check names, defaults to all
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
+        chunk_size (int): number of texts per chunk
+        executor (Executor | None): where offloaded chunks run, defaults
+            to the loop's default thread pool
+        offload_above (int | None): batch size from which chunks are
+            offloaded, never by default
+
+    Yields:
+        tuple[list[Text], BatchResult]: a chunk of texts and its results
+
+    Raises:
+        TypeError: If any item of `texts` is neither a string nor
+            bytes-like.
+        ValueError: If any check name is unknown, or `chunk_size` is
+            less than 1.
+    """
+    names = registry.resolve(checks)
+    loop = asyncio.get_running_loop()
+    known = len(texts) if isinstance(texts, Sized) else None
+    seen = 0
+    async for chunk in _chunks(texts, chunk_size):
+        seen += len(chunk)
+        run = partial(batch.validate_many, chunk, names, engine=engine)
+        size = seen if known is None else known
+        if offload_above is not None and size > offload_above:
+            result = await loop.run_in_executor(executor, run)
+        else:
+            result = run()
+            await asyncio.sleep(0)
+        yield chunk, result
+
+
+async def validate_many(  # noqa: PLR0913
+    texts: Iterable[Text] | AsyncIterable[Text],
+    checks: Iterable[str] | None = None,
+    *,
+    engine: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+    offload_above: int | None = None,
+) -> BatchResult:
+    """Run several checks over many strings without blocking the loop.
+
+    Same answers as `lsre.validate_many`, computed in chunks as
+    `validate_stream` does.
+
+    Args:
+        texts (Iterable[Text] | AsyncIterable[Text]): values to check,
+            strings or UTF-8 bytes
+        checks (Iterable[str] | None): check names, defaults to all
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
+        chunk_size (int): number of texts per chunk
+        executor (Executor | None): where offloaded chunks run, defaults
+            to the loop's default thread pool
+        offload_above (int | None): batch size from which chunks are
+            offloaded, never by default
+
+    Returns:
+        BatchResult: one match mask per check, in input order
+
+    Raises:
+        TypeError: If any item of `texts` is neither a string nor
+            bytes-like.
+        ValueError: If any check name is unknown, or `chunk_size` is
+            less than 1.
+    """
+    names = registry.resolve(checks)
+    logger.debug('Validating asynchronously against {}', names)
+    # an empty result up front keeps every check in the output, even
+    # when there are no texts at all
+    results = [batch.validate_many([], names, engine=engine)]
+    chunks = validate_stream(
+        texts,
+        names,
+        engine=engine,
+        chunk_size=chunk_size,
+        executor=executor,
+        offload_above=offload_above,
+    )
+    results += [result async for _, result in chunks]
+    return BatchResult.merge(results)
@@ -0,0 +1,195 @@
+"""Batch validation of many strings at once."""
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from lsre import engines, metrics
+from lsre._log import logger
+from lsre.dedup import DedupStats, DedupTable
+from lsre.prefilter import MIN_CHECKS, run_allowed, screen
+from lsre.registry import registry
+from lsre.utils import Text, ensure_text_items
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Match masks produced by `validate_many`.
+
+    Attributes:
+        size (int): number of texts in the batch
+        masks (dict[str, bytearray]): check name to a mask holding `1`
+            at every position whose text passed the check, else `0`
+        dedup (DedupStats | None): what deduplication did, None if the
+            batch was not deduplicated; not compared
+    """
+
+    size: int
+    masks: dict[str, bytearray]
+    dedup: DedupStats | None = field(default=None, compare=False)
+
+    @property
+    def checks(self) -> tuple[str, ...]:
+        """Names of the checks that were run, in order."""
+        return tuple(self.masks)
+
+    def __getitem__(self, check: str) -> list[bool]:
+        """Return the results of `check` as a list of booleans.
+
+        Raises:
+            KeyError: If `check` was not run for this batch.
+        """
+        return [bool(flag) for flag in self.masks[check]]
+
+    @classmethod
+    def merge(cls, results: Iterable['BatchResult']) -> 'BatchResult':
+        """Concatenate results of consecutive batches, in order.
+
+        Args:
+            results (Iterable[BatchResult]): results that all ran the same
+                checks
+
+        Returns:
+            BatchResult: one result covering every batch, with the
+                deduplication stats added up if every batch has them
+
+        Examples:
+            >>> from lsre import BatchResult, validate_many
+            >>> parts = [
+            ...     validate_many(['a'], 'slug'),
+            ...     validate_many(['-'], 'slug'),
+            ... ]
+            >>> BatchResult.merge(parts)['slug']
+            [True, False]
+        """
+        size = 0
+        masks: dict[str, bytearray] = {}
+        stats: list[DedupStats | None] = []
+        for result in results:
+            size += result.size
+            stats.append(result.dedup)
+            for name, mask in result.masks.items():
+                masks.setdefault(name, bytearray()).extend(mask)
+        dedup = (
+            DedupStats.merge(s for s in stats if s is not None)
+            if stats and None not in stats
+            else None
+        )
+        return cls(size=size, masks=masks, dedup=dedup)
+
+    def row(self, index: int) -> dict[str, bool]:
+        """Return every check result for the text at `index`.
+
+        Args:
+            index (int): position of the text in the batch
+
+        Returns:
+            dict[str, bool]: check name to result, like the `results`
+                dict built per text in `scripts/main.py`
+        """
+        return {name: bool(mask[index]) for name, mask in self.masks.items()}
+
+
+def validate_many(
+    texts: Iterable[Text],
+    checks: Iterable[str] | None = None,
+    *,
+    engine: str | None = None,
+    prefilter: bool = True,
+    dedup: bool | DedupTable = False,
+) -> BatchResult:
+    """Run several checks over many strings.
+
+    Gives the same answers as calling the matching `is_*` function on
+    every item, but the type check, check lookup and logging happen once
+    per batch rather than once per item. A batch of ASCII bytes is
+    matched with bytes patterns, without decoding any item. When running
+    at least `lsre.prefilter.MIN_CHECKS` checks, those `lsre.prefilter`
+    rules out for an item are not run on it. With `dedup`, the checks
+    run once per distinct value, see `lsre.dedup`.
+
+    Args:
+        texts (Iterable[Text]): values to check, strings or UTF-8 bytes
+        checks (Iterable[str] | None): check names, e.g. `['email',
+            'ipv4']`; defaults to all built-in checks
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
+        prefilter (bool): skip checks an item's fingerprint rules out;
+            turn off to run every check on every item
+        dedup (bool | DedupTable): check each distinct value once and
+            report it in `BatchResult.dedup`; pass a `DedupTable` made
+            for the same checks to reuse results across calls
+
+    Returns:
+        BatchResult: one match mask per check
+
+    Raises:
+        TypeError: If any item of `texts` is neither a string nor
+            bytes-like.
+        ValueError: If any check name or the engine is unknown, or if
+            `dedup` is a table made for other checks.
+
+    Examples:
+        >>> from lsre import validate_many
+        >>> result = validate_many(['abc123', '10.0.0.1'], ['ipv4', 'slug'])
+        >>> result['ipv4']
+        [False, True]
+        >>> result.row(0)
+        {'ipv4': False, 'slug': True}
+    """
+    names = registry.resolve(checks)
+    own_checks = engines.get(engine)
+    items = ensure_text_items(texts)
+    logger.debug('Validating {} texts against {}', len(items), names)
+    if dedup is False:
+        masks = _run_checks(items, names, own_checks, prefilter=prefilter)
+        return BatchResult(size=len(items), masks=masks)
+    table = DedupTable(names) if dedup is True else dedup
+    if table.checks != names:
+        msg = f'Dedup table holds checks {table.checks}, not {names}'
+        raise ValueError(msg)
+    masks, stats = table.run(
+        items,
+        lambda values: _run_checks(
+            values, names, own_checks, prefilter=prefilter
+        ),
+    )
+    return BatchResult(size=len(items), masks=masks, dedup=stats)
+
+
+def _run_checks(
+    items: list[Text],
+    names: tuple[str, ...],
+    own_checks: Mapping[str, Callable[[str], bool]],
+    *,
+    prefilter: bool,
+) -> dict[str, bytearray]:
+    """Return one match mask per check for `ensure_text_items` output."""
+    binary = bool(items) and not isinstance(items[0], str)
+    decoded: list[str] | None = None
+    screens = screen(items) if prefilter and len(names) >= MIN_CHECKS else None
+    masks = {}
+    for name in names:
+        start = time.perf_counter_ns()
+        check = own_checks.get(name)
+        if check is None:
+            pattern = registry.binary(name) if binary else registry[name]
+            match: Callable[[Any], object] = pattern.match
+            values: list[Any] = items
+        else:
+            if decoded is None:
+                decoded = [
+                    item if isinstance(item, str) else str(item, 'ascii')
+                    for item in items
+                ]
+            match, values = check, decoded
+        if screens is None:
+            mask = bytearray(map(bool, map(match, values)))
+        else:
+            mask = run_allowed(match, name, values, screens)
+        masks[name] = mask
+        if metrics.is_enabled():
+            elapsed = time.perf_counter_ns() - start
+            metrics.record(name, len(mask), mask.count(1), elapsed)
+    return masks
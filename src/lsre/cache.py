@@ -0,0 +1,201 @@
+"""Opt-in LRU caches of validator results for repeated inputs.
+
+Log streams repeat the same addresses and identifiers over and over;
+with caching enabled, a validator answers a text it has seen recently
+from a bounded least-recently-used table instead of running its check
+again. Each validator has its own table and its own hit and miss
+counts.
+
+Caching is off by default; while disabled each validator call pays a
+single dict lookup. Turn it on for every `is_*` function with `enable`,
+or wrap one validator for a single call site with `cached`. Only `str`
+and `bytes` arguments are cached, and only when no `engine` is passed;
+other calls run the validator as usual. The tables are the C
+implementation of `functools.lru_cache`, which is safe to share
+between threads.
+
+Examples:
+    >>> from lsre import cache, is_ipv4
+    >>> cache.enable(maxsize=1024)
+    >>> is_ipv4('10.0.0.1'), is_ipv4('10.0.0.1')
+    (True, True)
+    >>> stats = cache.snapshot()['ipv4']
+    >>> stats['hits'], stats['misses'], stats['size']
+    (1, 1, 1)
+    >>> cache.disable()
+"""
+
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from importlib import import_module
+from typing import Any
+
+DEFAULT_MAXSIZE = 4096
+"""Entries kept per validator unless another size is given."""
+
+_KEY_TYPES = (str, bytes)
+
+
+class CachedValidator:
+    """A validator with its own bounded LRU table of results.
+
+    Calls with one `str` or `bytes` argument are answered from the
+    table; any other call goes straight to the validator.
+
+    Args:
+        func (Callable[..., bool]): validator to cache, e.g.
+            `lsre.is_email`
+        maxsize (int): most results kept before the least recently used
+            is evicted
+
+    Examples:
+        >>> from lsre import is_email
+        >>> from lsre.cache import CachedValidator
+        >>> check = CachedValidator(is_email, maxsize=2)
+        >>> check('user@example.com'), check('user@example.com')
+        (True, True)
+        >>> check.info()['hits']
+        1
+    """
+
+    def __init__(
+        self, func: Callable[..., bool], maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        """Wrap `func`; raise ValueError if `maxsize` is less than 1."""
+        if maxsize < 1:
+            msg = f"Argument 'maxsize' must be at least 1, got {maxsize}"
+            raise ValueError(msg)
+        self.func = func
+        self._lookup = lru_cache(maxsize)(func)
+
+    def __call__(self, text: Any, *args: Any, **kwargs: Any) -> bool:  # noqa: ANN401
+        """Return the validator's answer for `text`, cached if possible."""
+        if args or kwargs or type(text) not in _KEY_TYPES:
+            return self.func(text, *args, **kwargs)
+        return self._lookup(text)
+
+    def info(self) -> dict[str, Any]:
+        """Return the counters of this cache.
+
+        Returns:
+            dict[str, Any]: `hits`, `misses`, `hit_ratio`, current
+                `size` and `maxsize`
+        """
+        hits, misses, maxsize, size = self._lookup.cache_info()
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / lookups if lookups else 0.0,
+            'size': size,
+            'maxsize': maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached result and zero the counters."""
+        self._lookup.cache_clear()
+
+
+_validators: dict[str, Callable[..., bool]] = {}
+_active: dict[str, CachedValidator] = {}
+
+
+def enable(maxsize: int = DEFAULT_MAXSIZE) -> None:
+    """Cache the results of every `is_*` function.
+
+    Enabling again replaces the tables, dropping what they held.
+
+    Args:
+        maxsize (int): results kept per validator
+
+    Raises:
+        ValueError: If `maxsize` is less than 1.
+    """
+    # the validators register themselves when their module is imported,
+    # which `import lsre` leaves to their first use
+    import_module('lsre.regex_functions')
+    caches = {
+        name: CachedValidator(func, maxsize)
+        for name, func in _validators.items()
+    }
+    # replace the tables key by key, so no concurrent call sees caching off
+    _active.update(caches)
+
+
+def disable() -> None:
+    """Stop caching and drop every cached result."""
+    _active.clear()
+
+
+def is_enabled() -> bool:
+    """Return True if the `is_*` functions are cached."""
+    return bool(_active)
+
+
+def clear() -> None:
+    """Drop the cached results and counters, keeping caching enabled."""
+    for validator in list(_active.values()):
+        validator.clear()
+
+
+def memoize(name: str) -> Callable[[Callable[..., bool]], Callable[..., bool]]:
+    """Answer from validator `name`'s table while caching is enabled.
+
+    Args:
+        name (str): validator name, e.g. `email`
+
+    Returns:
+        Callable: decorator for a validator taking `text` first
+    """
+
+    def decorator(func: Callable[..., bool]) -> Callable[..., bool]:
+        _validators[name] = func
+
+        @wraps(func)
+        def wrapper(text: Any, *args: Any, **kwargs: Any) -> bool:  # noqa: ANN401
+            validator = _active.get(name)
+            if validator is None:
+                return func(text, *args, **kwargs)
+            return validator(text, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def cached(
+    func: Callable[..., bool], maxsize: int = DEFAULT_MAXSIZE
+) -> CachedValidator:
+    """Return `func` with a private cache, for use at one call site.
+
+    Args:
+        func (Callable[..., bool]): validator, e.g. `lsre.is_ipv4`
+        maxsize (int): results kept
+
+    Returns:
+        CachedValidator: callable like `func`, with `info` and `clear`
+
+    Raises:
+        ValueError: If `maxsize` is less than 1.
+
+    Examples:
+        >>> from lsre import is_uuid
+        >>> from lsre.cache import cached
+        >>> check_uuid = cached(is_uuid, maxsize=256)
+        >>> check_uuid('not-a-uuid')
+        False
+    """
+    return CachedValidator(func, maxsize)
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Return the counters of every enabled validator cache.
+
+    Returns:
+        dict[str, dict[str, Any]]: validator name to its `hits`,
+            `misses`, `hit_ratio`, current `size` and `maxsize`; empty
+            while caching is disabled
+    """
+    return {
+        name: validator.info() for name, validator in sorted(_active.items())
+    }
@@ -0,0 +1,249 @@
+"""Find the longest CIDR prefix holding an address, for allow and block lists.
+
+A `CidrIndex` is built once from IPv4 and IPv6 prefixes such as
+`10.0.0.0/8` and `2001:db8::/32`. It splits each address space into
+intervals, every one owned by the longest prefix covering it, and keeps
+the interval starts in a sorted array. A lookup is then one binary
+search, whatever the number of prefixes, where testing membership in
+every `ipaddress` network costs one test per prefix.
+
+Prefixes are parsed with `lsre.parse`, so they load without creating
+an `ipaddress` object each. Host bits are cleared, as with
+`ipaddress.ip_network(text, strict=False)`, and an address without a
+length is a prefix of its full length. IPv6 prefixes and addresses
+may end in `::`, as in `2001:db8::/32`, though `is_ipv6` rejects
+such addresses.
+
+`lookup_many` takes the packed results of `parse_ipv4_many` and
+`parse_ipv6_many`, or an `array('I')` of IPv4 addresses, and returns an
+`array('i')` of prefix positions.
+
+Examples:
+    >>> from lsre.cidr import CidrIndex
+    >>> index = CidrIndex(['10.0.0.0/8', '10.1.0.0/16', '2001:db8::/32'])
+    >>> index.lookup('10.1.2.3'), index.lookup('10.2.0.1')
+    ('10.1.0.0/16', '10.0.0.0/8')
+    >>> '192.168.0.1' in index, '2001:db8::1' in index
+    (False, True)
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from itertools import repeat
+
+from lsre.parse import Packed, parse_ipv4, parse_ipv4_many, parse_ipv6
+
+_BITS = {4: 32, 6: 128}
+"""Bits per address of each IP version."""
+_LENGTHS = {str(length): length for length in range(129)}
+"""Prefix length texts to their value."""
+
+
+class _Intervals:
+    """Sorted interval starts of one address space and their owners.
+
+    Attributes:
+        starts (array[int] | list[int]): first address of every
+            interval, from 0 up; an `array('I')` for IPv4
+        owners (array[int]): position of the prefix owning each
+            interval, -1 for none, shifted by one so that the result of
+            `bisect_right` indexes it directly
+    """
+
+    def __init__(self, bits: int, networks: dict[int, int]) -> None:
+        """Split the space of `bits`-bit addresses among `networks`.
+
+        Args:
+            bits (int): bits per address
+            networks (dict[int, int]): first address shifted left by 8
+                bits plus prefix length, to the position of the prefix
+        """
+        limit = 1 << bits
+        # interval start to owner; the starts come in ascending order,
+        # and a later owner at the same start replaces the earlier one
+        intervals = {0: -1}
+        # prefixes either nest or are disjoint, so the ones covering the
+        # current address form a stack, the longest on top, above one
+        # covering the whole space and owned by none
+        ends = [limit]
+        owners = [-1]
+        for key in sorted(networks):
+            start = key >> 8
+            while ends[-1] <= start:
+                owners.pop()
+                intervals[ends.pop()] = owners[-1]
+            owner = networks[key]
+            intervals[start] = owner
+            ends.append(start + (1 << (bits - (key & 0xFF))))
+            owners.append(owner)
+        while len(ends) > 1:
+            owners.pop()
+            intervals[ends.pop()] = owners[-1]
+        intervals.pop(limit, None)
+        self.starts: array[int] | list[int] = (
+            array('I', intervals) if bits == _BITS[4] else list(intervals)
+        )
+        self.owners = array('i', [-1, *intervals.values()])
+
+    def find(self, address: int) -> int:
+        """Return the position of the longest prefix holding `address`."""
+        return self.owners[bisect_right(self.starts, address)]
+
+    def find_many(self, addresses: Iterable[int]) -> array[int]:
+        """Return `find` of every address."""
+        return array(
+            'i',
+            map(
+                self.owners.__getitem__,
+                map(bisect_right, repeat(self.starts), addresses),
+            ),
+        )
+
+
+class CidrIndex:
+    """Longest-prefix match over IPv4 and IPv6 CIDR prefixes.
+
+    Attributes:
+        prefixes (tuple[str, ...]): prefixes as given, in order; lookups
+            return these texts or their positions
+    """
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        """Parse `prefixes` and build the index.
+
+        Args:
+            prefixes (Iterable[str]): texts such as `10.0.0.0/8`,
+                `2001:db8::/32` or `192.168.0.1`; when one is repeated,
+                its first position is reported
+
+        Raises:
+            ValueError: If a prefix is not an address the `is_ipv4` or
+                `is_ipv6` check accepts, optionally followed by `/` and
+                a length from 0 up to the address size.
+        """
+        self.prefixes = tuple(prefixes)
+        networks: dict[int, dict[int, int]] = {4: {}, 6: {}}
+        split = [prefix.partition('/') for prefix in self.prefixes]
+        ipv4 = parse_ipv4_many([address for address, _, _ in split])
+        for position, (address, slash, length_text) in enumerate(split):
+            if ipv4.mask[position]:
+                version, value = 4, ipv4.values[position]
+            else:
+                version, value = _parse_address(address)
+            bits = _BITS[version]
+            length = _LENGTHS.get(length_text, -1) if slash else bits
+            if value is None or not 0 <= length <= bits:
+                prefix = self.prefixes[position]
+                msg = (
+                    'Expected a CIDR prefix such as 10.0.0.0/8, '
+                    f'got {prefix!r}'
+                )
+                raise ValueError(msg)
+            host = bits - length
+            key = value >> host << host + 8 | length
+            networks[version].setdefault(key, position)
+        self._spaces = {
+            version: _Intervals(_BITS[version], networks[version])
+            for version in _BITS
+        }
+
+    def __len__(self) -> int:
+        """Return the number of prefixes given."""
+        return len(self.prefixes)
+
+    def __contains__(self, address: object) -> bool:
+        """Return True if a prefix holds the address text `address`.
+
+        Anything but an IPv4 or IPv6 address text is held by none.
+        """
+        if not isinstance(address, str):
+            return False
+        version, value = _parse_address(address)
+        return value is not None and self._spaces[version].find(value) >= 0
+
+    def lookup(self, address: str) -> str | None:
+        """Return the longest prefix holding `address`.
+
+        Args:
+            address (str): IPv4 or IPv6 address
+
+        Returns:
+            str | None: the prefix as given, None if none holds it
+
+        Raises:
+            ValueError: If `address` is neither an IPv4 nor an IPv6
+                address.
+        """
+        position = self.position(address)
+        return None if position < 0 else self.prefixes[position]
+
+    def position(self, address: str) -> int:
+        """Return the position of the longest prefix holding `address`.
+
+        Args:
+            address (str): IPv4 or IPv6 address
+
+        Returns:
+            int: index into `prefixes`, -1 if none holds the address
+
+        Raises:
+            ValueError: If `address` is neither an IPv4 nor an IPv6
+                address.
+        """
+        version, value = _parse_address(address)
+        if value is None:
+            msg = f'Expected an IPv4 or IPv6 address, got {address!r}'
+            raise ValueError(msg)
+        return self._spaces[version].find(value)
+
+    def lookup_many(self, addresses: Packed | array[int]) -> array[int]:
+        """Return the position of the longest prefix holding each address.
+
+        Args:
+            addresses (Packed | array[int]): result of `parse_ipv4_many`
+                or `parse_ipv6_many`, or IPv4 addresses as ints
+
+        Returns:
+            array[int]: an `array('i')` of indexes into `prefixes`, -1
+                where no prefix holds the address or its text was not
+                valid
+
+        Examples:
+            >>> from lsre.cidr import CidrIndex
+            >>> from lsre.parse import parse_ipv4_many
+            >>> index = CidrIndex(['10.0.0.0/8', '10.1.0.0/16'])
+            >>> packed = parse_ipv4_many(['10.1.0.1', '10.9.0.1', 'x'])
+            >>> index.lookup_many(packed).tolist()
+            [1, 0, -1]
+        """
+        if isinstance(addresses, array):
+            return self._spaces[4].find_many(addresses)
+        values = addresses.values
+        if isinstance(values, array):
+            found = self._spaces[4].find_many(values)
+        else:
+            size = len(addresses)
+            view = memoryview(values)
+            found = self._spaces[6].find_many(
+                int.from_bytes(view[i : i + 16])
+                for i in range(0, size * 16, 16)
+            )
+        mask = addresses.mask
+        invalid = mask.find(0)
+        while invalid >= 0:
+            found[invalid] = -1
+            invalid = mask.find(0, invalid + 1)
+        return found
+
+
+def _parse_address(address: str) -> tuple[int, int | None]:
+    """Return the version and value of `address`, None if invalid."""
+    value = parse_ipv4(address)
+    if value is not None:
+        return 4, value
+    # `is_ipv6` rejects a trailing `::` after groups, as in `2001:db8::`,
+    # but that is how `ipaddress` writes such addresses
+    if address.endswith('::'):
+        address += '0'
+    return 6, parse_ipv6(address)
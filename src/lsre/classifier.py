@@ -0,0 +1,167 @@
+"""Answer every check for a string in a single regex call."""
+
+import re
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, cast
+
+from lsre import metrics
+from lsre._log import logger
+from lsre.metrics import track
+from lsre.prefilter import MIN_CHECKS, fingerprint, screen, select, table
+from lsre.registry import registry
+from lsre.utils import Text, enforce_text_arg, ensure_text_items
+
+
+def _passed(match: re.Match[Any] | None) -> tuple[str, ...]:
+    """Return the checks whose named group took part in `match`."""
+    # the combined pattern is only optional lookaheads, so it always matches
+    groups = match.groupdict() if match else {}
+    return tuple(name for name, value in groups.items() if value is not None)
+
+
+def _nothing(text: Text) -> tuple[str, ...]:  # noqa: ARG001
+    """Classify a text every check is ruled out for."""
+    return ()
+
+
+class _Classifiers(dict[bytes, Callable[[Text], tuple[str, ...]]]):
+    """Screening flags to a classifier of the checks they allow."""
+
+    def __init__(self, names: tuple[str, ...], *, binary: bool) -> None:
+        """Classify against `names`, with bytes patterns if `binary`."""
+        super().__init__()
+        self.names = names
+        self.binary = binary
+
+    def __missing__(self, flags: bytes) -> Callable[[Text], tuple[str, ...]]:
+        """Compile the combined pattern of the checks `flags` allow."""
+        allowed = select(self.names, flags)
+        if not allowed:
+            self[flags] = _nothing
+            return _nothing
+        pattern = (
+            registry.combined_binary(allowed)
+            if self.binary
+            else registry.combined(allowed)
+        )
+        match = cast('Callable[[Text], re.Match[Any] | None]', pattern.match)
+
+        def classifier(text: Text) -> tuple[str, ...]:
+            return _passed(match(text))
+
+        self[flags] = classifier
+        return classifier
+
+
+_classifiers: dict[tuple[tuple[str, ...], bool], _Classifiers] = {}
+
+
+def _classifiers_for(names: tuple[str, ...], *, binary: bool) -> _Classifiers:
+    """Return the shared classifiers for `names` and input kind."""
+    classifiers = _classifiers.get((names, binary))
+    if classifiers is None:
+        classifiers = _Classifiers(names, binary=binary)
+        _classifiers[names, binary] = classifiers
+    return classifiers
+
+
+@track('classify')
+@enforce_text_arg
+def classify(
+    text: Text, checks: Iterable[str] | None = None, *, prefilter: bool = True
+) -> tuple[str, ...]:
+    """Return the names of every check `text` passes.
+
+    All checks are evaluated by one combined pattern from
+    `registry.combined`, so the string is handed to the regex engine
+    once instead of once per `is_*` function. When considering at least
+    `lsre.prefilter.MIN_CHECKS` checks, those `lsre.prefilter` rules out
+    are left out of the pattern. The answer is the same as calling each
+    `is_*` function in turn.
+
+    Args:
+        text (Text): value to check, as a string or UTF-8 bytes
+        checks (Iterable[str] | None): check names to consider, defaults
+            to all built-in checks
+        prefilter (bool): leave out checks the text's fingerprint rules
+            out
+
+    Returns:
+        tuple[str, ...]: names of the passing checks, in check order
+
+    Raises:
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If any check name is unknown.
+
+    Examples:
+        >>> from lsre import classify
+        >>> classify('abc123')
+        ('alphanumeric', 'slug')
+        >>> classify('10.0.0.1', checks=['ipv4', 'ipv6'])
+        ('ipv4',)
+    """
+    binary = not isinstance(text, str)
+    if prefilter:
+        names = registry.resolve(checks)
+        if len(names) >= MIN_CHECKS:
+            classifiers = _classifiers_for(names, binary=binary)
+            return classifiers[table[fingerprint(text)]](text)
+    if binary:
+        return _passed(registry.combined_binary(checks).match(text))
+    return _passed(registry.combined(checks).match(text))
+
+
+def classify_many(
+    texts: Iterable[Text],
+    checks: Iterable[str] | None = None,
+    *,
+    prefilter: bool = True,
+) -> list[tuple[str, ...]]:
+    """Run `classify` over many strings.
+
+    Args:
+        texts (Iterable[Text]): values to check, strings or UTF-8 bytes
+        checks (Iterable[str] | None): check names to consider, defaults
+            to all built-in checks
+        prefilter (bool): leave out checks each text's fingerprint rules
+            out
+
+    Returns:
+        list[tuple[str, ...]]: passing check names for each text
+
+    Raises:
+        TypeError: If any item of `texts` is neither a string nor
+            bytes-like.
+        ValueError: If any check name is unknown.
+
+    Examples:
+        >>> from lsre import classify_many
+        >>> classify_many(['#fff', '23:59'], checks=['hex_color', 'time'])
+        [('hex_color',), ('time',)]
+    """
+    items = ensure_text_items(texts)
+    names = registry.resolve(checks)
+    binary = bool(items) and not isinstance(items[0], str)
+    logger.debug('Classifying {} texts', len(items))
+    start = time.perf_counter_ns()
+    if prefilter and len(names) >= MIN_CHECKS:
+        classifiers = _classifiers_for(names, binary=binary)
+        results = [
+            classifiers[flags](text)
+            for flags, text in zip(screen(items), items, strict=True)
+        ]
+    else:
+        pattern = (
+            registry.combined_binary(names)
+            if binary
+            else registry.combined(names)
+        )
+        match = cast('Callable[[Text], re.Match[Any] | None]', pattern.match)
+        results = [_passed(match(text)) for text in items]
+    if metrics.is_enabled():
+        elapsed = time.perf_counter_ns() - start
+        metrics.record(
+            'classify', len(items), sum(map(bool, results)), elapsed
+        )
+    return results
@@ -0,0 +1,111 @@
+"""Command line interface for streaming validation.
+
+Reads lines from files or standard input, runs the chosen checks and
+writes one result row per line as JSONL or CSV.
+
+Examples:
+    `python -m lsre access.log --checks email ipv4 --format csv`
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TextIO
+
+from lsre._log import logger
+from lsre.registry import registry
+from lsre.stream import (
+    DEFAULT_CHUNK_SIZE,
+    read_lines,
+    validate_stream,
+    write_csv,
+    write_jsonl,
+)
+
+
+def _positive_int(value: str) -> int:
+    """Return `value` as an int, for argparse, if it is at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        msg = f'expected a positive integer, got {value!r}'
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the `lsre` command."""
+    parser = argparse.ArgumentParser(
+        prog='lsre',
+        description='Validate lines from files or stdin with lsre checks.',
+    )
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        default=['-'],
+        help='files to read, `-` or nothing reads stdin',
+    )
+    parser.add_argument(
+        '-c',
+        '--checks',
+        nargs='+',
+        choices=list(registry),
+        metavar='CHECK',
+        help=f'checks to run, any of {", ".join(registry)}; default all',
+    )
+    parser.add_argument(
+        '-f',
+        '--format',
+        choices=['jsonl', 'csv'],
+        default='jsonl',
+        help='output format (default: jsonl)',
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='-',
+        help='file to write, `-` writes stdout (default)',
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=_positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f'lines validated per batch (default: {DEFAULT_CHUNK_SIZE})',
+    )
+    parser.add_argument(
+        '--dedup',
+        action='store_true',
+        help='check each distinct line once and copy its results to repeats',
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `lsre` command.
+
+    Args:
+        argv (Sequence[str] | None): arguments, defaults to `sys.argv`
+
+    Returns:
+        int: process exit code
+    """
+    args = build_parser().parse_args(argv)
+    chunks = validate_stream(
+        read_lines(args.paths), args.checks, args.chunk_size, dedup=args.dedup
+    )
+
+    def write(out: TextIO) -> int:
+        if args.format == 'csv':
+            return write_csv(chunks, out, args.checks)
+        return write_jsonl(chunks, out)
+
+    if args.output == '-':
+        rows = write(sys.stdout)
+    else:
+        with Path(args.output).open('w', encoding='utf-8', newline='') as out:
+            rows = write(out)
+    logger.debug('Wrote {} rows', rows)
+    return 0
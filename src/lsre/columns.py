@@ -0,0 +1,229 @@
+r"""Validate whole pyarrow arrays and pandas Series at once.
+
+Requires `pyarrow`; pandas is only needed for Series input. Checks
+whose pattern RE2 can run are evaluated by Arrow's
+`match_substring_regex` kernel, after a translation that keeps the
+scalar semantics:
+
+- `$` also matches before a trailing newline in Python, so `\n?` is
+  allowed before the end of the text
+- `\d` matches any Unicode decimal digit in Python, so it becomes
+  `\p{Nd}`
+- possessive quantifiers become plain ones: the registry only uses them
+  where giving characters back could not lead to a match, and RE2 never
+  backtracks anyway
+
+Patterns with lookarounds, `\w` or `\s` run through `validate_many`
+instead. Either way nulls stay null and every other value gets exactly
+the answer of the matching `is_*` function.
+
+Examples:
+    >>> import pyarrow as pa
+    >>> from lsre.columns import validate_column
+    >>> values = pa.array(['10.0.0.1', None, 'nope'])
+    >>> validate_column(values, 'ipv4').to_pylist()
+    [True, None, False]
+"""
+
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from lsre.batch import validate_many
+from lsre.registry import registry
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+type Column = pa.Array | pa.ChunkedArray | pd.Series
+"""Containers accepted by `validate_column`."""
+
+_RE2_UNSUPPORTED = re.compile(r'\(\?[=!<]|\\[wsWSbB]')
+"""Syntax RE2 lacks or gives ASCII-only meaning, unlike Python."""
+
+_POSSESSIVE = re.compile(r'(?<!\\)([+*?}])\+')
+"""The `+` marking a quantifier as possessive."""
+
+
+def re2_source(check: str) -> str | None:
+    r"""Return an RE2 pattern equivalent to check `check`, if there is one.
+
+    Args:
+        check (str): registered check name
+
+    Returns:
+        str | None: pattern for Arrow's regex kernels, or None if the
+            check has to run in Python
+
+    Raises:
+        KeyError: If `check` is not a registered check.
+
+    Examples:
+        >>> from lsre.columns import re2_source
+        >>> re2_source('iso_date')
+        '^\\p{Nd}{4}-(0[0-9]|1[1-2])-([0-2][0-9]|3[0-1])\\n?$'
+        >>> re2_source('email') is None
+        True
+    """
+    source, _ = registry.source(check)
+    if _RE2_UNSUPPORTED.search(source) or not source.endswith('$'):
+        return None
+    source = _POSSESSIVE.sub(r'\1', source[:-1])
+    return source.replace(r'\d', r'\p{Nd}') + r'\n?$'
+
+
+def _is_text(kind: pa.DataType) -> bool:
+    """Return True for Arrow string types."""
+    return (
+        pa.types.is_string(kind)
+        or pa.types.is_large_string(kind)
+        or pa.types.is_string_view(kind)
+    )
+
+
+def _validate_chunk(values: pa.Array, check: str) -> pa.Array:
+    """Run `check` over one Arrow array in Python, keeping its nulls."""
+    texts = values.fill_null('' if _is_text(values.type) else b'')
+    items = texts.to_numpy(zero_copy_only=False).tolist()
+    mask = validate_many(items, check).masks[check]
+    flags = pa.Array.from_buffers(
+        pa.uint8(), len(mask), [None, pa.py_buffer(mask)]
+    ).cast(pa.bool_())
+    if not values.null_count:
+        return flags
+    return pc.if_else(values.is_valid(), flags, None)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _validate_arrow(
+    values: pa.Array | pa.ChunkedArray, check: str
+) -> pa.Array | pa.ChunkedArray:
+    """Validate an Arrow array or chunked array of strings or bytes."""
+    kind = values.type
+    if pa.types.is_null(kind):
+        return pc.cast(values, pa.bool_())
+    if not (
+        _is_text(kind)
+        or pa.types.is_binary(kind)
+        or pa.types.is_large_binary(kind)
+        or pa.types.is_binary_view(kind)
+    ):
+        msg = f"Argument 'values' must hold strings or bytes, got {kind}"
+        raise TypeError(msg)
+    if pa.types.is_string_view(kind):
+        values = values.cast(pa.string())
+    elif pa.types.is_binary_view(kind):
+        values = values.cast(pa.binary())
+    source = re2_source(check) if _is_text(kind) else None
+    if source is not None:
+        ignore_case = bool(registry.source(check)[1] & re.IGNORECASE)
+        return pc.match_substring_regex(  # pyright: ignore[reportAttributeAccessIssue]
+            values, source, ignore_case=ignore_case
+        )
+    if isinstance(values, pa.ChunkedArray):
+        return pa.chunked_array(
+            [_validate_chunk(chunk, check) for chunk in values.chunks],
+            type=pa.bool_(),
+        )
+    return _validate_chunk(values, check)
+
+
+def _to_arrow(
+    values: Any,  # noqa: ANN401
+) -> tuple[pa.Array | pa.ChunkedArray, 'pd.Series | None']:
+    """Return `values` as Arrow data, and the Series it came from."""
+    if isinstance(values, pa.Array | pa.ChunkedArray):
+        return values, None
+    if type(values).__module__.startswith('pandas'):
+        import pandas as pd  # noqa: PLC0415
+
+        if isinstance(values, pd.Series):
+            try:
+                return pa.array(values, from_pandas=True), values
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+                msg = "Argument 'values' must hold only strings or bytes"
+                raise TypeError(msg) from error
+    msg = (
+        "Argument 'values' must be a pyarrow Array, ChunkedArray or "
+        f'pandas Series, got {type(values).__name__}'
+    )
+    raise TypeError(msg)
+
+
+def _to_series(flags: pa.Array | pa.ChunkedArray, like: 'pd.Series') -> Any:  # noqa: ANN401
+    """Return Arrow booleans as a nullable Series indexed like `like`."""
+    import pandas as pd  # noqa: PLC0415
+
+    series = flags.to_pandas(types_mapper={pa.bool_(): pd.BooleanDtype()}.get)
+    return series.set_axis(like.index)
+
+
+def validate_column(values: Column, check: str) -> Column:
+    """Run one check over every value of an array or Series.
+
+    Args:
+        values (Column): `pyarrow.Array`, `pyarrow.ChunkedArray` or
+            `pandas.Series` of strings or bytes, possibly with nulls
+        check (str): check name, e.g. `email`
+
+    Returns:
+        Column: booleans of the same kind and length as `values`, null
+            where the value is null; a Series keeps its index and name
+            and gets the nullable `boolean` dtype
+
+    Raises:
+        TypeError: If `values` is not an array or Series of strings or
+            bytes.
+        ValueError: If the check name is unknown.
+    """
+    (check,) = registry.resolve(check)
+    arrow, series = _to_arrow(values)
+    flags = _validate_arrow(arrow, check)
+    if series is None:
+        return flags
+    return _to_series(flags, series).rename(series.name)
+
+
+def validate_columns(
+    values: Column, checks: Iterable[str] | None = None
+) -> 'pa.Table | pd.DataFrame':
+    """Run several checks over every value, one result column per check.
+
+    Args:
+        values (Column): `pyarrow.Array`, `pyarrow.ChunkedArray` or
+            `pandas.Series` of strings or bytes
+        checks (Iterable[str] | None): check names, defaults to all
+
+    Returns:
+        pa.Table | pd.DataFrame: a DataFrame with the Series' index for
+            pandas input, otherwise an Arrow table; columns are named
+            after the checks
+
+    Raises:
+        TypeError: If `values` is not an array or Series of strings or
+            bytes.
+        ValueError: If any check name is unknown.
+
+    Examples:
+        >>> import pandas as pd
+        >>> from lsre.columns import validate_columns
+        >>> values = pd.Series(['#fff', None, 'my-slug'])
+        >>> validate_columns(values, ['hex_color', 'slug'])
+           hex_color   slug
+        0       True  False
+        1       <NA>   <NA>
+        2      False   True
+    """
+    names = registry.resolve(checks)
+    arrow, series = _to_arrow(values)
+    columns = {name: _validate_arrow(arrow, name) for name in names}
+    if series is None:
+        return pa.table(columns)
+    import pandas as pd  # noqa: PLC0415
+
+    return pd.DataFrame(
+        {name: _to_series(flags, series) for name, flags in columns.items()},
+        index=series.index,
+    )
@@ -0,0 +1,210 @@
+"""Check each distinct value once and copy its results to every repeat.
+
+Batches such as a day of client IPs or sender addresses are mostly
+repeats. Pass `dedup=True` to `validate_many` or
+`lsre.stream.validate_stream` and the checks run once per distinct
+value; the results are then copied back to every position holding it.
+The answers do not change.
+
+A `DedupTable` remembers the results of at most `max_size` values, so
+memory stays bounded however many distinct values go by. Once it is
+full, values it does not hold spill: they are checked one by one, like
+`validate_many` without `dedup`, while values it holds are still
+answered from it. Pass the same table to several calls, as
+`validate_stream` does, to reuse results across batches. A table is
+not meant to be shared between threads.
+
+Each result's `dedup` attribute holds `DedupStats`: how many items were
+checked, the share answered from the table, and an estimate of the
+time that saved.
+
+Examples:
+    >>> from lsre import validate_many
+    >>> result = validate_many(['10.0.0.1'] * 4 + ['x'], 'ipv4', dedup=True)
+    >>> result['ipv4']
+    [True, True, True, True, False]
+    >>> result.dedup.validated, result.dedup.ratio
+    (2, 0.6)
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, cast
+
+from lsre.utils import Text
+
+DEFAULT_MAX_SIZE = 100_000
+"""Most distinct values a table holds the results of."""
+
+_KEY_TYPES = frozenset({str, bytes})
+
+type Validate = Callable[[list[Any]], dict[str, bytearray]]
+"""Function returning one match mask per check for a list of values."""
+
+
+@dataclass(frozen=True)
+class DedupStats:
+    """What deduplication did for one or more batches.
+
+    Attributes:
+        items (int): number of texts in the batches
+        validated (int): number of texts the checks ran on, distinct
+            values added to the table plus spilled texts
+        spilled (int): texts checked one by one because the table was
+            full
+        seconds (float): time spent, checks and bookkeeping included
+        seconds_saved (float): estimated time checking every text would
+            have taken, minus `seconds`; negative when deduplication
+            cost more than it saved
+    """
+
+    items: int = 0
+    validated: int = 0
+    spilled: int = 0
+    seconds: float = 0.0
+    seconds_saved: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        """Share of texts answered without running the checks."""
+        return 1 - self.validated / self.items if self.items else 0.0
+
+    @classmethod
+    def merge(cls, stats: Iterable['DedupStats']) -> 'DedupStats':
+        """Add up the stats of several batches.
+
+        Args:
+            stats (Iterable[DedupStats]): stats to add up
+
+        Returns:
+            DedupStats: totals over every batch
+        """
+        stats = list(stats)
+        return cls(
+            items=sum(s.items for s in stats),
+            validated=sum(s.validated for s in stats),
+            spilled=sum(s.spilled for s in stats),
+            seconds=sum(s.seconds for s in stats),
+            seconds_saved=sum(s.seconds_saved for s in stats),
+        )
+
+
+class DedupTable:
+    """Results of the distinct values seen so far, up to `max_size`.
+
+    Attributes:
+        checks (tuple[str, ...]): names of the checks whose results are
+            kept
+        max_size (int): most values held
+    """
+
+    def __init__(
+        self, checks: tuple[str, ...], max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        """Create an empty table.
+
+        Args:
+            checks (tuple[str, ...]): resolved check names
+            max_size (int): most values held; 0 checks every text
+
+        Raises:
+            ValueError: If `max_size` is negative.
+        """
+        if max_size < 0:
+            msg = f'max_size must be at least 0, got {max_size}'
+            raise ValueError(msg)
+        self.checks = checks
+        self.max_size = max_size
+        self._index: dict[Any, int] = {}
+        self._masks = {name: bytearray() for name in checks}
+        # time and count of checked values, to estimate the time saved
+        self._checked_seconds = 0.0
+        self._checked = 0
+
+    def __len__(self) -> int:
+        """Return the number of values held."""
+        return len(self._index)
+
+    def clear(self) -> None:
+        """Forget every value."""
+        self._index.clear()
+        for mask in self._masks.values():
+            mask.clear()
+
+    def run(
+        self, items: list[Text], validate: Validate
+    ) -> tuple[dict[str, bytearray], DedupStats]:
+        """Return the masks of `items`, validating each new value once.
+
+        Args:
+            items (list[Text]): values to check, either all strings or
+                all bytes-like, as `ensure_text_items` returns them
+            validate (Validate): runs the checks on a list of values
+
+        Returns:
+            tuple[dict[str, bytearray], DedupStats]: one match mask per
+                check, in `checks` order, and what deduplication did
+        """
+        start = time.perf_counter()
+        keys = (
+            items
+            if _KEY_TYPES.issuperset(map(type, items))
+            else [
+                item if isinstance(item, str) else bytes(item)
+                for item in items
+            ]
+        )
+        index = self._index
+        new = [key for key in dict.fromkeys(keys) if key not in index]
+        admitted = new[: max(self.max_size - len(index), 0)]
+        check_seconds = 0.0
+        if admitted:
+            masks, check_seconds = _timed(validate, admitted)
+            for name, column in self._masks.items():
+                column.extend(masks[name])
+            index.update(zip(admitted, count(len(index))))
+        positions = list(map(index.get, keys))
+        spilled = positions.count(None) if len(new) > len(admitted) else 0
+        if spilled == len(items) and items:
+            result, check_seconds = _timed(validate, items)
+        else:
+            where = []
+            rows = cast('list[int]', positions)
+            if spilled:
+                where = [i for i, p in enumerate(positions) if p is None]
+                rows = [p or 0 for p in positions]
+            result = {
+                name: bytearray(map(column.__getitem__, rows))
+                for name, column in self._masks.items()
+            }
+            if where:
+                spill_masks, seconds = _timed(
+                    validate, [items[i] for i in where]
+                )
+                check_seconds += seconds
+                for name, mask in result.items():
+                    for i, flag in zip(where, spill_masks[name], strict=True):
+                        mask[i] = flag
+        validated = len(admitted) + spilled
+        self._checked_seconds += check_seconds
+        self._checked += validated
+        cost = self._checked_seconds / self._checked if self._checked else 0.0
+        seconds = time.perf_counter() - start
+        return result, DedupStats(
+            items=len(items),
+            validated=validated,
+            spilled=spilled,
+            seconds=seconds,
+            seconds_saved=len(items) * cost - seconds,
+        )
+
+
+def _timed(
+    validate: Validate, values: list[Any]
+) -> tuple[dict[str, bytearray], float]:
+    """Return `validate(values)` and the seconds it took."""
+    start = time.perf_counter()
+    masks = validate(values)
+    return masks, time.perf_counter() - start
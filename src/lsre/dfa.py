@@ -0,0 +1,570 @@
+r"""Run the regular checks as table-driven DFAs, in strictly linear time.
+
+The checks in `DFA_CHECKS` use no lookarounds, so their patterns are
+compiled into deterministic automata: a transition table in an `array`
+and a byte table mapping each character to its character class. A run
+reads every character once, with one table lookup each, and stops at
+the first character that rules a match out; no input can make it
+backtrack. Compiling several checks together gives their product
+automaton, which answers all of them in one pass over the text.
+
+The compiler understands literals, `.`, character classes with ranges,
+`\d`, escaped punctuation, groups, `|`, the quantifiers `?`, `*`, `+`
+and `{m,n}`, and `^` and `$` around the whole pattern. It treats
+possessive quantifiers as greedy, which matches the same texts whenever
+giving characters back could never lead to a match; that holds for
+every pattern of `DFA_CHECKS`, and the tests compare each automaton
+with its regex. Anything else raises ValueError.
+
+Like the regexes, the automata ignore a single trailing newline, and
+`\d` also matches non-ASCII decimal digits. Automata are compiled on
+first use and kept.
+
+Examples:
+    >>> from lsre.dfa import compile_checks
+    >>> automaton = compile_checks(['uuid', 'slug', 'ipv4'])
+    >>> automaton.matches('10.0.0.1')
+    ('ipv4',)
+    >>> automaton.matches('my-slug')
+    ('slug',)
+    >>> compile_checks(['hex_color']).accepts('#FFF')
+    True
+"""
+
+import re
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import cache
+from typing import NoReturn
+
+from lsre.registry import registry
+from lsre.utils import Text
+
+DFA_CHECKS = (
+    'alphanumeric',
+    'ipv4',
+    'iso_date',
+    'time',
+    'hex_color',
+    'uuid',
+    'slug',
+)
+"""Checks whose patterns compile to a DFA, in registry order."""
+
+_ASCII = 128
+_DIGIT = 128
+"""Symbol standing for every non-ASCII decimal digit."""
+_OTHER = 129
+"""Symbol standing for every other non-ASCII character."""
+_SYMBOLS = range(130)
+_DIGITS = frozenset([*range(ord('0'), ord('9') + 1), _DIGIT])
+_ANY = frozenset(_SYMBOLS) - {ord('\n')}
+_QUANTIFIERS = '?*+{'
+
+type Node = tuple
+
+
+class _Parser:
+    """Recursive-descent parser from pattern source to a syntax tree.
+
+    Nodes are tuples: `('set', symbols)`, `('cat', nodes)`,
+    `('alt', nodes)` and `('rep', node, low, high)` with `high` None
+    for no upper bound.
+    """
+
+    def __init__(self, source: str, *, ignore_case: bool) -> None:
+        """Parse `source`, a pattern without its `^` and `$` anchors."""
+        self.source = source
+        self.pos = 0
+        self.ignore_case = ignore_case
+
+    def fail(self, message: str) -> NoReturn:
+        """Raise a ValueError pointing at the current position."""
+        msg = f'{message} at position {self.pos}: {self.source!r}'
+        raise ValueError(msg)
+
+    def peek(self) -> str:
+        """Return the next character, or '' at the end."""
+        return self.source[self.pos : self.pos + 1]
+
+    def take(self) -> str:
+        """Consume and return the next character."""
+        char = self.peek()
+        if not char:
+            self.fail('Unexpected end of pattern')
+        self.pos += 1
+        return char
+
+    def parse(self) -> Node:
+        """Return the tree of the whole pattern."""
+        node = self.alternation()
+        if self.pos != len(self.source):
+            self.fail('Unbalanced parenthesis')
+        return node
+
+    def alternation(self) -> Node:
+        """Parse branches separated by `|`."""
+        branches = [self.sequence()]
+        while self.peek() == '|':
+            self.pos += 1
+            branches.append(self.sequence())
+        return branches[0] if len(branches) == 1 else ('alt', branches)
+
+    def sequence(self) -> Node:
+        """Parse quantified atoms up to `|`, `)` or the end."""
+        items = []
+        while self.peek() and self.peek() not in '|)':
+            items.append(self.quantified())
+        return ('cat', items)
+
+    def quantified(self) -> Node:
+        """Parse an atom and the quantifier after it, if any."""
+        node = self.atom()
+        char = self.peek()
+        if not char or char not in _QUANTIFIERS:
+            return node
+        self.pos += 1
+        if char == '{':
+            low, high = self.bounds()
+        else:
+            low, high = {'?': (0, 1), '*': (0, None), '+': (1, None)}[char]
+        if self.peek() == '?':
+            self.fail('Lazy quantifiers are not supported')
+        if self.peek() == '+':  # possessive, treated as greedy
+            self.pos += 1
+        return ('rep', node, low, high)
+
+    def bounds(self) -> tuple[int, int | None]:
+        """Parse the inside of `{m}`, `{m,}` or `{m,n}`."""
+        end = self.source.find('}', self.pos)
+        match = re.fullmatch(r'(\d+)(,(\d*))?', self.source[self.pos : end])
+        if end < 0 or match is None:
+            self.fail('Bad repetition')
+        self.pos = end + 1
+        low = int(match[1])
+        if match[2] is None:
+            return low, low
+        return low, int(match[3]) if match[3] else None
+
+    def atom(self) -> Node:
+        """Parse a group, class, escape, `.` or literal."""
+        char = self.take()
+        if char == '(':
+            if self.source.startswith('?:', self.pos):
+                self.pos += 2
+            elif self.peek() == '?':
+                self.fail('Lookarounds and group flags are not supported')
+            node = self.alternation()
+            self.take()  # the `)` that ended the alternation
+            return node
+        if char == '[':
+            return ('set', self.char_class())
+        if char == '\\':
+            return ('set', self.escape())
+        if char == '.':
+            return ('set', _ANY)
+        if char in '^$':
+            self.fail('Anchors inside the pattern are not supported')
+        if char in '*+?{)|':
+            self.fail('Nothing to repeat')
+        return ('set', self.literal(char))
+
+    def escape(self) -> frozenset[int]:
+        """Parse what follows a backslash."""
+        char = self.take()
+        if char == 'd':
+            return _DIGITS
+        if char.isalnum():
+            self.fail(f'Escape \\{char} is not supported')
+        return self.literal(char)
+
+    def char_class(self) -> frozenset[int]:
+        """Parse the inside of `[...]`."""
+        negate = self.peek() == '^'
+        self.pos += negate
+        symbols: set[int] = set()
+        first = True
+        while (char := self.take()) != ']' or first:
+            first = False
+            if char == '\\':
+                item = self.escape()
+            elif self.peek() == '-' and self.source[self.pos + 1 :][:1] != ']':
+                self.pos += 1
+                end = self.take()
+                if end == '\\':
+                    end = self.take()
+                item = frozenset().union(
+                    *map(
+                        self.literal, map(chr, range(ord(char), ord(end) + 1))
+                    )
+                )
+            else:
+                item = self.literal(char)
+            symbols |= item
+        return frozenset(_SYMBOLS) - symbols if negate else frozenset(symbols)
+
+    def literal(self, char: str) -> frozenset[int]:
+        """Return the symbols matching `char`, in both cases if needed."""
+        if ord(char) >= _ASCII:
+            self.fail('Non-ASCII literals are not supported')
+        if self.ignore_case:
+            return frozenset({ord(char), ord(char.lower()), ord(char.upper())})
+        return frozenset({ord(char)})
+
+
+class _Nfa:
+    """Thompson NFA built from syntax trees, one accepting tag per tree."""
+
+    def __init__(self) -> None:
+        """Start with no states."""
+        self.edges: list[list[tuple[frozenset[int], int]]] = []
+        self.empty: list[list[int]] = []
+        self.tags: dict[int, int] = {}
+
+    def state(self) -> int:
+        """Add a state and return its index."""
+        self.edges.append([])
+        self.empty.append([])
+        return len(self.edges) - 1
+
+    def build(self, node: Node) -> tuple[int, int]:
+        """Add the states of `node` and return its start and end."""
+        kind = node[0]
+        start = self.state()
+        if kind == 'set':
+            end = self.state()
+            self.edges[start].append((node[1], end))
+        elif kind == 'cat':
+            end = start
+            for item in node[1]:
+                first, last = self.build(item)
+                self.empty[end].append(first)
+                end = last
+        elif kind == 'alt':
+            end = self.state()
+            for branch in node[1]:
+                first, last = self.build(branch)
+                self.empty[start].append(first)
+                self.empty[last].append(end)
+        else:
+            _, item, low, high = node
+            end = start
+            for _ in range(low):
+                first, last = self.build(item)
+                self.empty[end].append(first)
+                end = last
+            if high is None:
+                first, last = self.build(item)
+                self.empty[end].append(first)
+                self.empty[last].append(end)
+            else:
+                exits = [end]
+                for _ in range(high - low):
+                    first, last = self.build(item)
+                    self.empty[end].append(first)
+                    end = last
+                    exits.append(end)
+                end = self.state()
+                for state in exits:
+                    self.empty[state].append(end)
+        return start, end
+
+    def closure(self, states: Iterable[int]) -> frozenset[int]:
+        """Return `states` and every state reachable from them for free."""
+        seen = set(states)
+        stack = list(seen)
+        while stack:
+            for target in self.empty[stack.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return frozenset(seen)
+
+
+class Automaton:
+    """Deterministic automaton answering one or more checks at once.
+
+    Attributes:
+        names (tuple[str, ...]): checks answered, bit `i` of a result
+            mask standing for `names[i]`
+        table (array): next state for each state and character class;
+            states are stored as row offsets, the dead state is 0
+        accept (array): mask of the checks accepting at each row offset
+        classes (bytes): character class of each ASCII code
+        start (int): row offset of the start state
+        max_length (int | None): longest text any check accepts, None if
+            unbounded
+    """
+
+    def __init__(self, names: tuple[str, ...], nfa: _Nfa, start: int) -> None:
+        """Build the minimal DFA of `nfa` from its `start` state."""
+        sets = {symbols for edges in nfa.edges for symbols, _ in edges}
+        signatures: dict[tuple[bool, ...], int] = {}
+        symbol_class = [
+            signatures.setdefault(
+                tuple(symbol in symbols for symbols in sets), len(signatures)
+            )
+            for symbol in _SYMBOLS
+        ]
+        count = len(signatures)
+        members = [
+            next(s for s in _SYMBOLS if symbol_class[s] == c)
+            for c in range(count)
+        ]
+        moves, masks = _determinize(nfa, start, members)
+        moves, masks, start_state = _minimize(moves, masks)
+        self.names = names
+        self.classes = bytes(symbol_class[:_ASCII])
+        self._digit = symbol_class[_DIGIT]
+        self._other = symbol_class[_OTHER]
+        # `bytes.translate` table; non-ASCII bytes never reach it
+        self._translation = self.classes + bytes(_ASCII)
+        self._width = count
+        rows = len(moves)
+        self.table = array(
+            'H' if rows * count < 1 << 16 else 'I',
+            [target * count for row in moves for target in row],
+        )
+        self.accept = array('Q', [0]) * (rows * count)
+        for state, mask in enumerate(masks):
+            self.accept[state * count] = mask
+        self.start = start_state * count
+        self.max_length = _longest(moves, masks, start_state)
+        self._limit = (
+            sys.maxsize if self.max_length is None else self.max_length
+        )
+
+    def mask(self, text: Text) -> int:
+        """Return a bit mask of the checks `text` passes.
+
+        Args:
+            text (Text): value to check, a string or UTF-8 bytes
+
+        Returns:
+            int: bit `i` set if `text` passes `names[i]`
+        """
+        if isinstance(text, str):
+            data = text.encode('ascii') if text.isascii() else None
+        else:
+            data = bytes(text)
+            if not data.isascii():
+                text, data = str(data, 'utf-8', 'replace'), None
+        if data is None:
+            data = bytes(map(self._symbol, str(text).removesuffix('\n')))
+        else:
+            data = data.removesuffix(b'\n').translate(self._translation)
+        if len(data) > self._limit:
+            return 0
+        table = self.table
+        state = self.start
+        for symbol in data:
+            state = table[state + symbol]
+            if not state:
+                return 0
+        return self.accept[state]
+
+    def accepts(self, text: Text) -> bool:
+        """Return True if `text` passes any of the checks."""
+        return bool(self.mask(text))
+
+    def matches(self, text: Text) -> tuple[str, ...]:
+        """Return the names of the checks `text` passes, in order."""
+        mask = self.mask(text)
+        return tuple(
+            name for bit, name in enumerate(self.names) if mask >> bit & 1
+        )
+
+    def _symbol(self, char: str) -> int:
+        """Return the character class of one character."""
+        code = ord(char)
+        if code < _ASCII:
+            return self.classes[code]
+        return self._digit if char.isdecimal() else self._other
+
+
+def _determinize(
+    nfa: _Nfa, start: int, members: list[int]
+) -> tuple[list[list[int]], list[int]]:
+    """Run the subset construction, with the dead state first.
+
+    Returns:
+        tuple: next state per state and class, and the mask of accepting
+            tags per state
+    """
+    dead: frozenset[int] = frozenset()
+    states = [dead, nfa.closure([start])]
+    index = {state: i for i, state in enumerate(states)}
+    moves: list[list[int]] = []
+    for current in states:  # grows while iterating
+        row = []
+        for symbol in members:
+            target = nfa.closure(
+                target
+                for state in current
+                for symbols, target in nfa.edges[state]
+                if symbol in symbols
+            )
+            if target not in index:
+                index[target] = len(states)
+                states.append(target)
+            row.append(index[target])
+        moves.append(row)
+    masks = [
+        sum(nfa.tags.get(state, 0) for state in current) for current in states
+    ]
+    return moves, masks
+
+
+def _minimize(
+    moves: list[list[int]], masks: list[int]
+) -> tuple[list[list[int]], list[int], int]:
+    """Merge equivalent states, keeping the dead state at 0.
+
+    Returns:
+        tuple: next state per state and class, accepting mask per state
+            and the new index of state 1, the start
+    """
+    blocks = [masks[state] for state in range(len(moves))]
+    while True:
+        signatures = [
+            (blocks[state], *(blocks[target] for target in moves[state]))
+            for state in range(len(moves))
+        ]
+        numbering: dict[tuple[int, ...], int] = {signatures[0]: 0}
+        refined = [
+            numbering.setdefault(signature, len(numbering))
+            for signature in signatures
+        ]
+        if len(numbering) == len(set(blocks)):
+            break
+        blocks = refined
+    count = len(numbering)
+    new_moves = [[0] * len(moves[0]) for _ in range(count)]
+    new_masks = [0] * count
+    for state, block in enumerate(refined):
+        new_moves[block] = [refined[target] for target in moves[state]]
+        new_masks[block] = masks[state]
+    return new_moves, new_masks, refined[1]
+
+
+def _longest(
+    moves: list[list[int]], masks: list[int], start: int
+) -> int | None:
+    """Return the longest accepted length, None if unbounded."""
+    longest: dict[int, int | None] = {}
+    visiting: set[int] = set()
+
+    def walk(state: int) -> int | None:
+        # longest path from `state` to an accepting state, -1 if none
+        if state in visiting:
+            return None
+        if state not in longest:
+            visiting.add(state)
+            best: int | None = 0 if masks[state] else -1
+            for target in set(moves[state]) - {0}:
+                rest = walk(target)
+                if rest is None:
+                    best = None
+                    break
+                if rest >= 0 and best is not None:
+                    best = max(best, rest + 1)
+            visiting.discard(state)
+            longest[state] = best
+        return longest[state]
+
+    result = walk(start)
+    return None if result is None else max(result, 0)
+
+
+def compile_pattern(source: str, flags: int = 0) -> Automaton:
+    r"""Compile one anchored pattern into an automaton.
+
+    Args:
+        source (str): pattern starting with `^` and ending with `$`
+        flags (int): `re.IGNORECASE` or 0
+
+    Returns:
+        Automaton: automaton answering the pattern, named `pattern`
+
+    Raises:
+        ValueError: If the pattern uses anything the compiler does not
+            support.
+
+    Examples:
+        >>> from lsre.dfa import compile_pattern
+        >>> automaton = compile_pattern(r'^a[0-9]{2}$')
+        >>> automaton.accepts('a12'), automaton.max_length
+        (True, 3)
+    """
+    return _compile([('pattern', source, flags)])
+
+
+def _compile(patterns: list[tuple[str, str, int]]) -> Automaton:
+    """Compile `(name, source, flags)` triples into one automaton."""
+    nfa = _Nfa()
+    start = nfa.state()
+    for bit, (_, source, flags) in enumerate(patterns):
+        if flags & ~re.IGNORECASE:
+            msg = f'Only re.IGNORECASE is supported, got flags {flags}'
+            raise ValueError(msg)
+        if not (source.startswith('^') and source.endswith('$')):
+            msg = f'Pattern must be anchored with ^ and $: {source!r}'
+            raise ValueError(msg)
+        parser = _Parser(source[1:-1], ignore_case=bool(flags & re.IGNORECASE))
+        first, last = nfa.build(parser.parse())
+        nfa.empty[start].append(first)
+        nfa.tags[last] = 1 << bit
+    return Automaton(tuple(name for name, _, _ in patterns), nfa, start)
+
+
+@cache
+def _compile_names(names: tuple[str, ...]) -> Automaton:
+    """Compile the patterns of registered checks, once per tuple."""
+    return _compile([(name, *registry.source(name)) for name in names])
+
+
+def compile_checks(checks: Iterable[str]) -> Automaton:
+    """Return the product automaton of registered checks, compiled once.
+
+    Args:
+        checks (Iterable[str]): names from `DFA_CHECKS`
+
+    Returns:
+        Automaton: automaton answering every check in one pass
+
+    Raises:
+        ValueError: If a check is unknown or has no DFA.
+    """
+    names = registry.resolve(checks)
+    unsupported = [name for name in names if name not in DFA_CHECKS]
+    if unsupported:
+        msg = f'Checks {unsupported} have no DFA, expected any of {DFA_CHECKS}'
+        raise ValueError(msg)
+    return _compile_names(names)
+
+
+class _Checks(Mapping[str, Callable[[str], bool]]):
+    """Check name to its automaton's `accepts`, compiled on first use."""
+
+    def __getitem__(self, name: str) -> Callable[[str], bool]:
+        """Return the DFA function of check `name`.
+
+        Raises:
+            KeyError: If `name` has no DFA.
+        """
+        if name not in DFA_CHECKS:
+            raise KeyError(name)
+        return _compile_names((name,)).accepts
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over `DFA_CHECKS`."""
+        return iter(DFA_CHECKS)
+
+    def __len__(self) -> int:
+        """Return the number of checks with a DFA."""
+        return len(DFA_CHECKS)
+
+
+CHECKS: Mapping[str, Callable[[str], bool]] = _Checks()
+"""Check name to its DFA function, the checks of the `dfa` engine."""
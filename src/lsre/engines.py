@@ -0,0 +1,81 @@
+"""Choose how the validators check text.
+
+Every `is_*` function and `validate_many` take an `engine` argument;
+when it is omitted the process-wide default set with `set_default` is
+used. Available engines:
+
+- `re`: the patterns of `lsre.registry`, the default
+- `fast`: the hand-written functions of `lsre.fastpath` for `ipv4`,
+  `ipv6` and `hex_color`
+- `dfa`: the table-driven automata of `lsre.dfa` for the checks without
+  lookarounds, linear in the length of the text whatever it holds
+
+An engine only replaces the checks it implements; every other check
+still runs its regex, so all engines give the same answers.
+
+Examples:
+    >>> from lsre import engines, is_ipv6
+    >>> is_ipv6('2001:db8::1', engine='fast')
+    True
+    >>> engines.set_default('fast')
+    >>> engines.get_default()
+    'fast'
+    >>> engines.set_default('re')
+"""
+
+from collections.abc import Callable, Mapping
+
+from lsre import dfa, fastpath
+
+ENGINES: dict[str, Mapping[str, Callable[[str], bool]]] = {
+    're': {},
+    'fast': fastpath.CHECKS,
+    'dfa': dfa.CHECKS,
+}
+"""Engine name to the checks it implements without a regex."""
+
+active: Mapping[str, Callable[[str], bool]] = ENGINES['re']
+"""Checks of the default engine, read by the validators on every call."""
+
+_default = 're'
+
+
+def get(engine: str | None) -> Mapping[str, Callable[[str], bool]]:
+    """Return the checks implemented by `engine`.
+
+    Args:
+        engine (str | None): engine name, None for the default
+
+    Returns:
+        Mapping[str, Callable[[str], bool]]: check name to function for
+            the checks that do not use their regex
+
+    Raises:
+        ValueError: If the engine is unknown.
+    """
+    if engine is None:
+        return active
+    checks = ENGINES.get(engine)
+    if checks is None:
+        msg = f'Unknown engine {engine!r}, expected any of {list(ENGINES)}'
+        raise ValueError(msg)
+    return checks
+
+
+def set_default(engine: str) -> None:
+    """Use `engine` whenever a call does not name one.
+
+    Args:
+        engine (str): engine name
+
+    Raises:
+        ValueError: If the engine is unknown.
+    """
+    global _default, active  # noqa: PLW0603
+    active = get(engine)
+    _default = engine
+
+
+def get_default() -> str:
+    """Return the name of the default engine."""
+    return _default
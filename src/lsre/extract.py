@@ -0,0 +1,210 @@
+"""Find emails, IPs, UUIDs, URLs and more anywhere in large files.
+
+The validators answer whether a whole string is a value; the scanners
+here report where values occur inside arbitrary text. They run the
+unanchored `SEARCH_PATTERNS` combined into one pattern over bytes, so a
+file is walked once for all kinds, and files are memory-mapped rather
+than read into Python strings.
+
+Examples:
+    >>> from lsre.extract import scan
+    >>> list(scan(b'from 10.0.0.1 to admin@example.com'))
+    [Span(kind='ipv4', start=5, end=13), Span(kind='email', start=17, end=34)]
+"""
+
+import mmap
+import os
+import re
+from collections.abc import Buffer, Generator, Iterable, Iterator
+from functools import cache
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from lsre.registry import SEARCH_PATTERNS
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+"""Bytes scanned per window."""
+
+OVERLAP = 4096
+"""Bytes a window reaches past its chunk, more than any match can span."""
+
+CONTEXT = 16
+"""Bytes kept before the resume position so lookbehinds still work."""
+
+DEFAULT_KINDS = ('url', 'email', 'uuid', 'ipv6', 'ipv4')
+"""Kinds found by default; long ids can look like phone or card numbers."""
+
+
+class Span(NamedTuple):
+    """Location of one value found in the scanned data.
+
+    Attributes:
+        kind (str): check the value passes, e.g. `email`
+        start (int): offset of the first byte
+        end (int): offset just past the last byte
+    """
+
+    kind: str
+    start: int
+    end: int
+
+
+@cache
+def search_pattern(kinds: tuple[str, ...]) -> re.Pattern[bytes]:
+    """Return the combined bytes pattern finding any of `kinds`.
+
+    Args:
+        kinds (tuple[str, ...]): names from `SEARCH_PATTERNS`, earlier
+            kinds win when two could start at the same offset
+
+    Returns:
+        re.Pattern[bytes]: pattern with one named group per kind
+
+    Raises:
+        ValueError: If a kind has no search pattern.
+    """
+    unknown = [kind for kind in kinds if kind not in SEARCH_PATTERNS]
+    if unknown or not kinds:
+        msg = (
+            f'Unknown kinds {unknown}, expected any of {list(SEARCH_PATTERNS)}'
+        )
+        raise ValueError(msg)
+    source = '|'.join(f'(?P<{k}>{SEARCH_PATTERNS[k]})' for k in kinds)
+    return re.compile(source.encode('ascii'))
+
+
+def _resolve(kinds: Iterable[str] | None) -> re.Pattern[bytes]:
+    """Return the search pattern for `kinds`, defaulting to all."""
+    if kinds is None:
+        return search_pattern(DEFAULT_KINDS)
+    if isinstance(kinds, str):
+        kinds = [kinds]
+    return search_pattern(tuple(dict.fromkeys(kinds)))
+
+
+def _scan_window(  # noqa: PLR0913
+    pattern: re.Pattern[bytes],
+    data: Buffer,
+    pos: int,
+    limit: int,
+    end: int,
+    offset: int = 0,
+) -> Generator[Span, None, int]:
+    """Yield spans starting in `[pos, limit)`, return where to resume.
+
+    Matching may look at bytes up to `end`; because no match spans more
+    than `OVERLAP` bytes, matches starting before `limit` are the same
+    as if the whole data had been searched.
+    """
+    for match in pattern.finditer(data, pos, end):
+        if match.start() >= limit:
+            break
+        kind = match.lastgroup or ''
+        yield Span(kind, offset + match.start(), offset + match.end())
+        pos = match.end()
+    return max(pos, limit)
+
+
+def scan(
+    data: Buffer,
+    kinds: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Span]:
+    """Yield every email, IP, UUID, URL or other kind in `data`, in order.
+
+    `data` is searched in windows of `chunk_size` bytes that reach
+    `OVERLAP` bytes into the next chunk, so values straddling a chunk
+    boundary are reported once and in full.
+
+    Args:
+        data (Buffer): bytes, bytearray, memoryview or mmap to search
+        kinds (Iterable[str] | None): kinds to look for, any of
+            `SEARCH_PATTERNS`; defaults to `DEFAULT_KINDS`
+        chunk_size (int): bytes searched per window
+
+    Yields:
+        Span: kind and byte offsets of each value found
+
+    Raises:
+        ValueError: If a kind is unknown.
+    """
+    pattern = _resolve(kinds)
+    with memoryview(data) as view:
+        size = view.nbytes
+    pos = 0
+    chunk_start = 0
+    while chunk_start < size:
+        chunk_end = min(chunk_start + chunk_size, size)
+        window_end = min(chunk_end + OVERLAP, size)
+        pos = yield from _scan_window(
+            pattern, data, pos, chunk_end, window_end
+        )
+        chunk_start = chunk_end
+
+
+def scan_file(
+    path: str | os.PathLike[str],
+    kinds: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Span]:
+    """Memory-map the file at `path` and `scan` it.
+
+    Args:
+        path (str | os.PathLike[str]): file to search
+        kinds (Iterable[str] | None): kinds to look for, defaults to
+            `DEFAULT_KINDS`
+        chunk_size (int): bytes searched per window
+
+    Yields:
+        Span: kind and byte offsets of each value found
+
+    Raises:
+        ValueError: If a kind is unknown.
+    """
+    with Path(path).open('rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from scan(data, kinds, chunk_size)
+
+
+def scan_stream(
+    stream: BinaryIO,
+    kinds: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Span]:
+    """`scan` a binary stream that cannot be memory-mapped, e.g. a pipe.
+
+    Only the current chunk and a small tail of the previous one are kept
+    in memory.
+
+    Args:
+        stream (BinaryIO): source opened in binary mode
+        kinds (Iterable[str] | None): kinds to look for, defaults to
+            `DEFAULT_KINDS`
+        chunk_size (int): bytes read per window
+
+    Yields:
+        Span: kind and offsets from the start of the stream
+
+    Raises:
+        ValueError: If a kind is unknown.
+    """
+    pattern = _resolve(kinds)
+    buffer = b''
+    offset = 0  # stream offset of buffer[0]
+    pos = 0
+    while True:
+        data = stream.read(chunk_size)
+        buffer += data
+        limit = len(buffer) if not data else len(buffer) - OVERLAP
+        if limit > pos:
+            pos = yield from _scan_window(
+                pattern, buffer, pos, limit, len(buffer), offset
+            )
+        if not data:
+            return
+        cut = max(0, pos - CONTEXT)
+        buffer = buffer[cut:]
+        offset += cut
+        pos -= cut
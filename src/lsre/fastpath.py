@@ -0,0 +1,117 @@
+"""Hand-written versions of fixed-shape checks, without regexes.
+
+IPv4 and IPv6 addresses and hex colours have a fixed layout, so a
+split, a length test and a set lookup answer faster than running a
+pattern with alternations. Each function gives exactly the answer of
+the regex in `lsre.registry.PATTERNS`, quirks included:
+
+- a single trailing newline is ignored, as `$` matches before it
+- `ipv4` accepts leading zeros, e.g. `01.002.3.4`
+- `ipv6` rejects a trailing `::` after other groups, e.g. `fe80::`
+
+UUIDs, times and ISO dates are left to their regexes: those patterns
+have no alternation to backtrack over, and `re` checks them faster than
+the equivalent Python code. The functions take `str` only;
+`lsre.engines` selects them.
+
+`ipv4_octets`, `ipv6_groups` and `hex_color_digits` return the parts
+of a valid text and None for any other, and the checks are written on
+top of them, so `lsre.parse` converts exactly the texts they accept.
+
+Examples:
+    >>> from lsre.fastpath import CHECKS
+    >>> CHECKS['ipv4']('192.168.0.1'), CHECKS['hex_color']('#ggg')
+    (True, False)
+"""
+
+from collections.abc import Callable
+
+_HEX = '0123456789abcdefABCDEF'
+OCTETS = {
+    f'{value:0{width}}': value for width in (1, 2, 3) for value in range(256)
+}
+"""Every spelling of an octet `ipv4` accepts, to its value."""
+_OCTET_SET = frozenset(OCTETS)
+_IPV4_PARTS = 4
+_IPV6_GROUPS = 8
+_GROUP_SIZE = 4
+_COLOR_SIZES = (4, 7)
+
+
+def _hex_groups(part: str) -> list[str] | None:
+    """Return the `:`-separated hex groups of `part`, or None."""
+    groups = part.split(':')
+    for group in groups:
+        if not group or len(group) > _GROUP_SIZE or group.strip(_HEX):
+            return None
+    return groups
+
+
+def ipv4_octets(text: str) -> list[str] | None:
+    """Return the four octets of an `ipv4` text, else None."""
+    if text[-1:] == '\n':
+        text = text[:-1]
+    parts = text.split('.')
+    if len(parts) == _IPV4_PARTS and _OCTET_SET.issuperset(parts):
+        return parts
+    return None
+
+
+def ipv6_groups(text: str) -> list[str] | None:
+    """Return the eight hex groups of an `ipv6` text, else None.
+
+    Groups elided by `::` come back as `'0'`.
+    """
+    if text[-1:] == '\n':
+        text = text[:-1]
+    head, compressed, tail = text.partition('::')
+    if not compressed:
+        groups = _hex_groups(text)
+        if groups is None or len(groups) != _IPV6_GROUPS:
+            return None
+        return groups
+    left = _hex_groups(head) if head else []
+    right = _hex_groups(tail) if tail else []
+    # `::` may end the text only when nothing comes before it
+    if (
+        left is None
+        or right is None
+        or (left and not right)
+        or len(left) + len(right) >= _IPV6_GROUPS
+    ):
+        return None
+    return [*left, *['0'] * (_IPV6_GROUPS - len(left) - len(right)), *right]
+
+
+def hex_color_digits(text: str) -> str | None:
+    """Return the three or six digits of a `hex_color` text, else None."""
+    if text[-1:] == '\n':
+        text = text[:-1]
+    if len(text) in _COLOR_SIZES and text[0] == '#':
+        digits = text[1:]
+        if not digits.strip(_HEX):
+            return digits
+    return None
+
+
+def is_ipv4(text: str) -> bool:
+    """Return True if `text` is four dot-separated octets in decimal."""
+    return ipv4_octets(text) is not None
+
+
+def is_ipv6(text: str) -> bool:
+    """Return True if `text` is an IPv6 address the regex accepts."""
+    return ipv6_groups(text) is not None
+
+
+def is_hex_color(text: str) -> bool:
+    """Return True if `text` is `#` and three or six hex digits."""
+    return hex_color_digits(text) is not None
+
+
+CHECKS: dict[str, Callable[[str], bool]] = {
+    'ipv4': is_ipv4,
+    'ipv6': is_ipv6,
+    'hex_color': is_hex_color,
+}
+"""Check name to its hand-written function."""
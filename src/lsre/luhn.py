@@ -0,0 +1,212 @@
+"""Luhn checksums of card numbers, one at a time or a whole array at once.
+
+The regex of `is_credit_card` only checks the shape of a number. Pass
+`luhn=True` to have it verify the Luhn checksum of the digits as well,
+and `extended=True` to accept every length cards are issued in, 13 to
+19 digits, in groups separated by spaces or by hyphens.
+
+For batches, `validate_cards` gives the answer of `is_credit_card` with
+`luhn=True` for every number, and `luhn_valid_many` computes just the
+checksums. The numbers become a matrix of character codes, with a
+column per number, and the checksums come out of a few arithmetic
+passes and sums over that matrix, with no Python-level loop per number.
+Both need `numpy`, which is imported on first use.
+
+Examples:
+    >>> from lsre.luhn import luhn_valid, luhn_valid_many, validate_cards
+    >>> luhn_valid('4111 1111 1111 1111'), luhn_valid('4111 1111 1111 1112')
+    (True, False)
+    >>> luhn_valid_many(['4111-1111-1111-1111', '378282246310005', '12'])
+    array([ True,  True, False])
+    >>> validate_cards(['4111-1111-1111-1111', '4222222222222'])
+    array([False, False])
+    >>> validate_cards(['4111-1111-1111-1111', '4222222222222'], extended=True)
+    array([ True,  True])
+"""
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from lsre.batch import validate_many
+from lsre.utils import Text, ensure_text_items
+
+if TYPE_CHECKING:
+    import numpy as np
+
+EXTENDED_PATTERN = (
+    r'^(?=(?:[^0-9\n]*+[0-9]){13,19}$)'
+    r'[0-9]++(?:([ -])[0-9]++(?:\1[0-9]++)*+)?$'
+)
+"""Card number of 13 to 19 digits in groups split by ` ` or `-`.
+
+Every separator is a single character and all are the same, so
+`4111-1111-1111-1111` and `4111 1111 1111 1111` match but
+`4111-1111 1111-1111` and `4111  1111 1111 1111` do not.
+"""
+
+_extended = re.compile(EXTENDED_PATTERN)
+_extended_bytes = re.compile(EXTENDED_PATTERN.encode('ascii'))
+
+_DIGITS = b'0123456789'
+_NOT_DIGITS = bytes(sorted(set(range(256)) - set(_DIGITS)))
+_VALUE = bytes.maketrans(_DIGITS, bytes(range(10)))
+"""Maps an ASCII digit to its value."""
+_DOUBLED = bytes.maketrans(_DIGITS, bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+"""Maps an ASCII digit to the sum of the digits of twice its value."""
+
+_BLOCK = 1 << 16
+"""Numbers checked per block by `luhn_valid_many`, to bound memory."""
+
+
+def match_extended(text: Text) -> bool:
+    """Return True if `text` has the shape of `EXTENDED_PATTERN`.
+
+    Args:
+        text (Text): value to check, as a string or bytes-like
+
+    Returns:
+        bool: True if `text` is 13 to 19 digits in separated groups
+    """
+    if isinstance(text, str):
+        return _extended.match(text) is not None
+    return _extended_bytes.match(text) is not None
+
+
+def luhn_valid(number: Text) -> bool:
+    """Return True if the digits of `number` pass the Luhn checksum.
+
+    Every character but the ASCII digits is ignored, so separators can
+    be left in.
+
+    Args:
+        number (Text): card number, as a string or bytes-like
+
+    Returns:
+        bool: True if `number` has digits and their checksum is valid
+
+    Examples:
+        >>> from lsre.luhn import luhn_valid
+        >>> luhn_valid('4012888888881881'), luhn_valid('4012888888881882')
+        (True, False)
+    """
+    data = (
+        number.encode('ascii', 'ignore')
+        if isinstance(number, str)
+        else bytes(number)
+    ).translate(None, _NOT_DIGITS)
+    total = sum(data[-1::-2].translate(_VALUE)) + sum(
+        data[-2::-2].translate(_DOUBLED)
+    )
+    return bool(data) and total % 10 == 0
+
+
+def luhn_valid_many(numbers: Any) -> 'np.ndarray':  # noqa: ANN401
+    """Return whether each number passes the Luhn checksum, vectorized.
+
+    Gives the answer of `luhn_valid` for every number. The array is
+    read in place when it already holds `str` or `bytes`, so pass one
+    to skip the conversion of a list.
+
+    Args:
+        numbers (Any): sequence of strings or of bytes, or a NumPy
+            array of dtype `U` or `S`
+
+    Returns:
+        np.ndarray: one boolean per number
+
+    Raises:
+        TypeError: If `numbers` holds anything but strings or bytes, or
+            mixes the two.
+
+    Examples:
+        >>> from lsre.luhn import luhn_valid_many
+        >>> luhn_valid_many([b'4111111111111111', b'4111111111111112'])
+        array([ True, False])
+    """
+    import numpy as np  # noqa: PLC0415
+
+    array = np.asarray(numbers)
+    if array.size == 0:
+        return np.zeros(array.shape, dtype=bool)
+    if array.dtype.kind not in 'SU':
+        msg = f'Expected strings or bytes, got an array of {array.dtype}'
+        raise TypeError(msg)
+    array = np.ascontiguousarray(array.ravel())
+    # one row of character codes per number, 4 bytes per character for
+    # `U` and 1 for `S`
+    wide = array.dtype.kind == 'U'
+    width = array.dtype.itemsize // (4 if wide else 1)
+    codes = array.view(np.uint32 if wide else np.uint8).reshape(-1, width)
+    result = np.empty(len(array), dtype=bool)
+    for start in range(0, len(array), _BLOCK):
+        # one row per character position and one column per number, so
+        # that every step below is a plain loop over contiguous memory;
+        # codes below '0' wrap around, so only digits give values < 10
+        offset = codes[start : start + _BLOCK].T - np.uint8(ord('0'))
+        digits = offset < 10  # noqa: PLR2004
+        value = offset.astype(np.uint8) * digits
+        # digits up to each position; a digit is doubled when an odd
+        # number of digits follow it, and as only the parity of `count`
+        # and `total` is used, wrapping around in uint8 is harmless
+        count = np.cumsum(digits, axis=0, dtype=np.uint8)
+        total = count[-1]
+        double = (count ^ total) & 1
+        # 2v - 9 for v > 4: the sum of the digits of 2v, in uint8 whose
+        # wrapping around cancels out
+        value += double * (value - (value > 4) * np.uint8(9))  # noqa: PLR2004
+        sums = value.sum(axis=0, dtype=np.uint32)
+        result[start : start + _BLOCK] = (sums % 10 == 0) & digits.any(axis=0)
+    return result
+
+
+def validate_cards(
+    numbers: Any,  # noqa: ANN401
+    *,
+    extended: bool = False,
+    engine: str | None = None,
+) -> 'np.ndarray':
+    """Return whether each number is a Luhn-valid card number.
+
+    Gives the answer of `is_credit_card(number, luhn=True)` for every
+    number: the shapes are checked by `validate_many`, or by
+    `EXTENDED_PATTERN`, and the checksums by `luhn_valid_many`.
+
+    Args:
+        numbers (Any): sequence of strings or bytes-like, or a NumPy
+            array of dtype `U` or `S`
+        extended (bool): accept 13 to 19 digits grouped by spaces or
+            hyphens, as `is_credit_card` does with `extended=True`
+        engine (str | None): name from `lsre.engines` for the shape
+            check, defaults to the engine set with
+            `lsre.engines.set_default`; the extended pattern always
+            runs on `re`
+
+    Returns:
+        np.ndarray: one boolean per number
+
+    Raises:
+        TypeError: If any number is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    is_array = isinstance(numbers, np.ndarray)
+    items = ensure_text_items(numbers.tolist() if is_array else numbers)
+    if extended:
+        shape = bytearray(map(match_extended, items))
+    else:
+        shape = validate_many(items, 'credit_card', engine=engine).masks[
+            'credit_card'
+        ]
+    if is_array and numbers.dtype.kind in 'SU':
+        checksum = luhn_valid_many(numbers)
+    else:
+        # NumPy makes a list of `bytearray` or `memoryview` a matrix of
+        # uint8, so hand it `bytes`
+        checksum = luhn_valid_many(
+            [
+                item if isinstance(item, str | bytes) else bytes(item)
+                for item in items
+            ]
+        )
+    return np.frombuffer(shape, dtype=bool) & checksum
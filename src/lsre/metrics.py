@@ -0,0 +1,228 @@
+"""Opt-in call counts, match ratios and latency histograms.
+
+Metrics are off by default; while disabled each instrumented call pays
+a single flag check. Enable them around the code you want to observe
+and read the numbers back with `snapshot`, `to_json` or
+`to_prometheus`.
+
+Examples:
+    >>> from lsre import is_ipv4, metrics
+    >>> metrics.enable()
+    >>> is_ipv4('10.0.0.1'), is_ipv4('nope')
+    (True, False)
+    >>> stats = metrics.snapshot()['ipv4']
+    >>> stats['calls'], stats['matches'], stats['match_ratio']
+    (2, 1, 0.5)
+    >>> metrics.disable()
+    >>> metrics.reset()
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any
+
+BUCKET_BOUNDS_NS: tuple[int, ...] = (
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    25_000,
+    50_000,
+    100_000,
+    250_000,
+    1_000_000,
+    10_000_000,
+)
+"""Upper bounds of the latency histogram buckets, in nanoseconds."""
+
+
+@dataclass
+class ValidatorStats:
+    """Counters kept for one validator.
+
+    Attributes:
+        calls (int): number of texts checked
+        matches (int): number of texts that passed
+        total_ns (int): total time spent checking, in nanoseconds
+        buckets (list[int]): per-bucket call counts, one more than
+            `BUCKET_BOUNDS_NS` for calls slower than the last bound
+    """
+
+    calls: int = 0
+    matches: int = 0
+    total_ns: int = 0
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(BUCKET_BOUNDS_NS) + 1)
+    )
+
+
+_enabled = False
+_lock = threading.Lock()
+_stats: dict[str, ValidatorStats] = {}
+
+
+def enable() -> None:
+    """Start recording metrics."""
+    global _enabled  # noqa: PLW0603
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording metrics, keeping what was recorded so far."""
+    global _enabled  # noqa: PLW0603
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True if metrics are being recorded."""
+    return _enabled
+
+
+def reset() -> None:
+    """Drop every recorded metric."""
+    with _lock:
+        _stats.clear()
+
+
+def record(name: str, calls: int, matches: int, elapsed_ns: int) -> None:
+    """Add `calls` checks by validator `name` to the metrics.
+
+    Batch callers pass the whole batch at once; its latency is spread
+    evenly over the calls when filling the histogram.
+
+    Args:
+        name (str): validator name, e.g. `email`
+        calls (int): number of texts checked
+        matches (int): number of texts that passed
+        elapsed_ns (int): time taken for all of them, in nanoseconds
+    """
+    if not calls:
+        return
+    bucket = bisect_left(BUCKET_BOUNDS_NS, elapsed_ns // calls)
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = ValidatorStats()
+        stats.calls += calls
+        stats.matches += matches
+        stats.total_ns += elapsed_ns
+        stats.buckets[bucket] += calls
+
+
+def track(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Record metrics for every call of a validator while enabled.
+
+    Args:
+        name (str): validator name to record under
+
+    Returns:
+        Callable: decorator for a validator; a truthy return value
+            counts as a match
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            result = func(*args, **kwargs)
+            record(name, 1, bool(result), time.perf_counter_ns() - start)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Return a JSON-serialisable copy of the recorded metrics.
+
+    Returns:
+        dict[str, dict[str, Any]]: validator name to its `calls`,
+            `matches`, `match_ratio`, `total_seconds` and cumulative
+            `latency_buckets` as `[upper bound in seconds, count]` pairs,
+            the last bound being `'+Inf'`
+    """
+    bounds: list[float | str] = [b / 1e9 for b in BUCKET_BOUNDS_NS]
+    bounds.append('+Inf')
+    with _lock:
+        items = [
+            (
+                name,
+                stats.calls,
+                stats.matches,
+                stats.total_ns,
+                list(stats.buckets),
+            )
+            for name, stats in _stats.items()
+        ]
+    result = {}
+    for name, calls, matches, total_ns, buckets in sorted(items):
+        cumulative = 0
+        latency_buckets = []
+        for bound, count in zip(bounds, buckets, strict=True):
+            cumulative += count
+            latency_buckets.append([bound, cumulative])
+        result[name] = {
+            'calls': calls,
+            'matches': matches,
+            'match_ratio': matches / calls,
+            'total_seconds': total_ns / 1e9,
+            'latency_buckets': latency_buckets,
+        }
+    return result
+
+
+def to_json() -> str:
+    """Return `snapshot` as a JSON document."""
+    return json.dumps(snapshot())
+
+
+def to_prometheus() -> str:
+    """Return the metrics in the Prometheus text exposition format.
+
+    Returns:
+        str: `lsre_validator_calls_total`, `lsre_validator_matches_total`
+            counters and the `lsre_validator_latency_seconds` histogram,
+            labelled by validator
+    """
+    stats = snapshot()
+    lines = [
+        '# HELP lsre_validator_calls_total Texts checked by the validator.',
+        '# TYPE lsre_validator_calls_total counter',
+    ]
+    lines.extend(
+        f'lsre_validator_calls_total{{validator="{name}"}} {s["calls"]}'
+        for name, s in stats.items()
+    )
+    lines += [
+        '# HELP lsre_validator_matches_total Texts that passed the validator.',
+        '# TYPE lsre_validator_matches_total counter',
+    ]
+    lines.extend(
+        f'lsre_validator_matches_total{{validator="{name}"}} {s["matches"]}'
+        for name, s in stats.items()
+    )
+    lines += [
+        '# HELP lsre_validator_latency_seconds Time spent per check.',
+        '# TYPE lsre_validator_latency_seconds histogram',
+    ]
+    for name, s in stats.items():
+        prefix = 'lsre_validator_latency_seconds'
+        for bound, count in s['latency_buckets']:
+            lines.append(
+                f'{prefix}_bucket{{validator="{name}",le="{bound}"}} {count}'
+            )
+        lines.append(
+            f'{prefix}_sum{{validator="{name}"}} {s["total_seconds"]}'
+        )
+        lines.append(f'{prefix}_count{{validator="{name}"}} {s["calls"]}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,168 @@
+"""Validate large inputs on several cores with a process or thread pool.
+
+Processes sidestep the GIL but pickle every chunk and its results.
+Threads share the texts directly, and on a free-threaded build (such as
+`python3.13t`) they run the checks truly in parallel. The batch path
+keeps threads from contending: each chunk reads the compiled patterns
+and the prefilter table without locking and takes the metrics lock once,
+and the loguru call it makes per chunk is thread-safe. The `is_*`
+result cache is not used by batches.
+"""
+
+import os
+import sys
+from collections import deque
+from collections.abc import Generator, Iterable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import chain
+
+from lsre._log import logger
+from lsre.batch import BatchResult, validate_many
+from lsre.registry import registry
+from lsre.stream import DEFAULT_CHUNK_SIZE, read_lines
+from lsre.utils import chunked
+
+POOLS = ('process', 'thread')
+"""Kinds of worker pool `imap_validate` can use."""
+
+
+def _warm_up(checks: tuple[str, ...]) -> None:
+    """Compile the patterns of `checks` once when a worker starts."""
+    for name in checks:
+        registry[name]
+
+
+def gil_enabled() -> bool:
+    """Return False on a free-threaded build running without the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def _start_pool(
+    pool: str | None, workers: int, checks: tuple[str, ...]
+) -> Executor:
+    """Return a pool of `workers` with the patterns of `checks` compiled.
+
+    Raises:
+        ValueError: If the pool kind is unknown.
+    """
+    if pool is None:
+        pool = 'process' if gil_enabled() else 'thread'
+    if pool == 'thread':
+        # threads share the registry, so compile once before they start
+        _warm_up(checks)
+        return ThreadPoolExecutor(max_workers=workers)
+    if pool == 'process':
+        return ProcessPoolExecutor(
+            max_workers=workers, initializer=_warm_up, initargs=(checks,)
+        )
+    msg = f'Unknown pool {pool!r}, expected any of {list(POOLS)}'
+    raise ValueError(msg)
+
+
+def imap_validate(  # noqa: PLR0913
+    texts: Iterable[str] | os.PathLike[str],
+    checks: Iterable[str] | None = None,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int | None = None,
+    pool: str | None = None,
+) -> Generator[tuple[list[str], BatchResult]]:
+    """Validate `texts` in a worker pool, yielding chunks in order.
+
+    Chunks are handed to a pool of processes or threads, with the
+    patterns compiled once before any chunk runs. At most `max_pending`
+    chunks are in flight; the next chunk is only read once the oldest
+    result has been consumed, so memory stays bounded for inputs of any
+    size. Closing the generator early cancels the chunks still queued.
+
+    Args:
+        texts (Iterable[str] | os.PathLike[str]): values to check, or a
+            path to a file whose lines are checked
+        checks (Iterable[str] | None): check names, defaults to all
+        workers (int | None): worker processes or threads, defaults to
+            the CPU count
+        chunk_size (int): number of texts sent to a worker at a time
+        max_pending (int | None): chunks in flight, defaults to twice the
+            number of workers
+        pool (str | None): `process` or `thread`, defaults to threads on
+            a free-threaded build without the GIL and processes
+            otherwise
+
+    Yields:
+        tuple[list[str], BatchResult]: a chunk of texts and its results,
+            in input order, as `lsre.stream.validate_stream` does
+
+    Raises:
+        TypeError: If any item of `texts` is not a string.
+        ValueError: If any check name or the pool kind is unknown.
+    """
+    names = registry.resolve(checks)
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    if isinstance(texts, os.PathLike):
+        texts = read_lines([texts])
+    executor = _start_pool(pool, workers, names)
+    logger.debug(
+        'Validating with {} workers in a {}', workers, type(executor).__name__
+    )
+    pending: deque[tuple[list[str], Future[BatchResult]]] = deque()
+    try:
+        for chunk in chunked(texts, chunk_size):
+            future = executor.submit(validate_many, chunk, names)
+            pending.append((chunk, future))
+            if len(pending) >= max_pending:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def validate_parallel(
+    texts: Iterable[str] | os.PathLike[str],
+    checks: Iterable[str] | None = None,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pool: str | None = None,
+) -> BatchResult:
+    """Validate `texts` in a worker pool and return all results.
+
+    Same answers as `lsre.validate_many`, computed on several cores. Use
+    `imap_validate` instead when the results do not fit in memory.
+
+    Args:
+        texts (Iterable[str] | os.PathLike[str]): values to check, or a
+            path to a file whose lines are checked
+        checks (Iterable[str] | None): check names, defaults to all
+        workers (int | None): worker processes or threads, defaults to
+            the CPU count
+        chunk_size (int): number of texts sent to a worker at a time
+        pool (str | None): `process` or `thread`, defaults to threads on
+            a free-threaded build without the GIL and processes
+            otherwise
+
+    Returns:
+        BatchResult: one match mask per check, in input order
+
+    Raises:
+        TypeError: If any item of `texts` is not a string.
+        ValueError: If any check name or the pool kind is unknown.
+    """
+    names = registry.resolve(checks)
+    chunks = imap_validate(
+        texts, names, workers=workers, chunk_size=chunk_size, pool=pool
+    )
+    # an empty result up front keeps every check in the output, even
+    # when there are no texts at all
+    results = chain([validate_many([], names)], (r for _, r in chunks))
+    return BatchResult.merge(results)
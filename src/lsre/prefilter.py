@@ -0,0 +1,248 @@
+"""Skip checks a text cannot pass before running their patterns.
+
+Most checks can be ruled out from a few facts about the text: its
+length (a UUID has exactly 36 characters, an IPv4 address at most 15),
+whether it contains `@`, `:`, `#`, `.`, `-` or `/`, and whether it is
+ASCII or ASCII letters and digits only. `fingerprint` packs those facts
+into a tuple with a handful of C-level scans, and `CONSTRAINTS` states
+which facts each check needs. `validate_many`, `classify` and
+`classify_many` look the fingerprint up in a table of the checks it
+allows and only run those; the answers do not change. Screening costs
+about as much as one regex call per text, so they only screen when
+running at least `MIN_CHECKS` checks.
+
+Facts are taken from the text without a single trailing newline, as `$`
+matches before one. The table of allowed checks holds one entry per
+distinct fingerprint seen, at most 65,536.
+
+Examples:
+    >>> from lsre.prefilter import candidates
+    >>> candidates('10.0.0.1')
+    ('ipv4', 'strong_password')
+    >>> candidates('#fff', checks=['hex_color', 'uuid'])
+    ('hex_color',)
+"""
+
+from collections.abc import Callable, Iterable
+from itertools import compress, repeat
+from operator import itemgetter
+from typing import Any, NamedTuple, cast
+
+from lsre.registry import registry
+from lsre.utils import Text
+
+SIGNALS = '@:#.-/'
+"""Characters whose presence is part of the fingerprint."""
+
+LENGTH_CAP = 255
+"""Longest length told apart; longer texts share this length."""
+
+MIN_CHECKS = 5
+"""Fewest checks per text for screening to cost less than it saves."""
+
+FACTS = (*SIGNALS, 'ascii', 'alnum')
+"""Fact names, in the order of their flags in a fingerprint."""
+
+type Fingerprint = tuple[int, bool, bool, bool, bool, bool, bool, bool, bool]
+
+
+class Constraint(NamedTuple):
+    """Facts every text passing a check has.
+
+    Attributes:
+        min_length (int): fewest characters
+        max_length (int | None): most characters, None if unbounded
+        required (tuple[str, ...]): names from `FACTS` that must hold
+        forbidden (tuple[str, ...]): names from `FACTS` that must not
+            hold
+    """
+
+    min_length: int = 0
+    max_length: int | None = None
+    required: tuple[str, ...] = ()
+    forbidden: tuple[str, ...] = ()
+
+    def allows(self, fingerprint: Fingerprint) -> bool:
+        """Return whether a text with `fingerprint` may pass the check."""
+        length, *flags = fingerprint
+        if length < self.min_length:
+            return False
+        if self.max_length is not None and length > self.max_length:
+            return False
+        facts = set(compress(FACTS, flags))
+        return facts.issuperset(self.required) and facts.isdisjoint(
+            self.forbidden
+        )
+
+
+CONSTRAINTS: dict[str, Constraint] = {
+    'alphanumeric': Constraint(1, required=('ascii', 'alnum')),
+    'email': Constraint(
+        6, 254, required=('@', '.', 'ascii'), forbidden=(':', '#', '/')
+    ),
+    'url': Constraint(7, required=(':', '/')),
+    'ipv4': Constraint(
+        7, 15, required=('.', 'ascii'), forbidden=('@', ':', '#', '-', '/')
+    ),
+    'ipv6': Constraint(
+        2, 39, required=(':', 'ascii'), forbidden=('@', '#', '.', '-', '/')
+    ),
+    'phone_number': Constraint(7, 32, forbidden=('@', ':', '#', '.', '/')),
+    'credit_card': Constraint(
+        15, 32, forbidden=('@', ':', '#', '.', '-', '/')
+    ),
+    'iso_date': Constraint(
+        10, 10, required=('-',), forbidden=('@', ':', '#', '.', '/')
+    ),
+    'time': Constraint(
+        5, 8, required=(':', 'ascii'), forbidden=('@', '#', '.', '-', '/')
+    ),
+    'hex_color': Constraint(
+        4, 7, required=('#', 'ascii'), forbidden=('@', ':', '.', '-', '/')
+    ),
+    'uuid': Constraint(
+        36, 36, required=('-', 'ascii'), forbidden=('@', ':', '#', '.', '/')
+    ),
+    'slug': Constraint(
+        1, required=('ascii',), forbidden=('@', ':', '#', '.', '/')
+    ),
+    'strong_password': Constraint(8),
+}
+"""Check name to the facts its pattern implies; other checks always run."""
+
+_ALWAYS = Constraint()
+_NEVER = repeat(0)
+
+
+def fingerprint(text: Text) -> Fingerprint:
+    """Return the length of `text` and which of `FACTS` hold for it.
+
+    Args:
+        text (Text): value to describe, a string or bytes-like
+
+    Returns:
+        Fingerprint: length capped at `LENGTH_CAP`, then one flag per
+            name in `FACTS`
+    """
+    if isinstance(text, str):
+        return _fingerprint_str(text)
+    return _fingerprint_bytes(text)
+
+
+def _fingerprint_str(text: str) -> Fingerprint:
+    """Return the fingerprint of a string."""
+    text = text.removesuffix('\n')
+    length = len(text)
+    return (
+        min(length, LENGTH_CAP),
+        '@' in text,
+        ':' in text,
+        '#' in text,
+        '.' in text,
+        '-' in text,
+        '/' in text,
+        text.isascii(),
+        text.isalnum(),
+    )
+
+
+def _fingerprint_bytes(text: bytes | bytearray | memoryview) -> Fingerprint:
+    """Return the fingerprint of a bytes-like object."""
+    if isinstance(text, memoryview):
+        text = text.tobytes()
+    text = text.removesuffix(b'\n')
+    length = len(text)
+    return (
+        min(length, LENGTH_CAP),
+        b'@' in text,
+        b':' in text,
+        b'#' in text,
+        b'.' in text,
+        b'-' in text,
+        b'/' in text,
+        text.isascii(),
+        text.isalnum(),
+    )
+
+
+class _Table(dict[Fingerprint, bytes]):
+    """Fingerprint to one flag per registered check, filled on demand."""
+
+    def __missing__(self, key: Fingerprint) -> bytes:
+        """Work out which checks a text with fingerprint `key` may pass."""
+        flags = bytes(
+            CONSTRAINTS.get(name, _ALWAYS).allows(key) for name in registry
+        )
+        self[key] = flags
+        return flags
+
+
+table = _Table()
+"""Fingerprint to one flag per check in registry order, `1` if allowed."""
+_INDEX = {name: index for index, name in enumerate(registry)}
+
+
+def screen(items: Iterable[Text]) -> list[bytes]:
+    """Return, for each item, one flag per check in registry order.
+
+    Args:
+        items (Iterable[Text]): values to screen, either all strings or
+            all bytes-like, as `ensure_text_items` returns them
+
+    Returns:
+        list[bytes]: `1` where the check may pass the item, else `0`
+    """
+    items = items if isinstance(items, list) else list(items)
+    if items and isinstance(items[0], str):
+        fingerprints = map(_fingerprint_str, cast('list[str]', items))
+    else:
+        fingerprints = map(fingerprint, items)
+    return list(map(table.__getitem__, fingerprints))
+
+
+def run_allowed(
+    check: Callable[[Any], object],
+    name: str,
+    items: list[Any],
+    screens: list[bytes],
+) -> bytearray:
+    """Run `check` on the items whose screen allows check `name`.
+
+    Args:
+        check (Callable[[Any], object]): truthy for passing items
+        name (str): registered check name
+        items (list[Any]): values to check
+        screens (list[bytes]): `screen(items)`
+
+    Returns:
+        bytearray: `1` at every item that passed, else `0`
+    """
+    allowed = bytes(map(itemgetter(_INDEX[name]), screens))
+    results = map(bool, map(check, compress(items, allowed)))
+    # each allowed position takes the next result, the others False
+    return bytearray(map(next, map((_NEVER, results).__getitem__, allowed)))
+
+
+def select(names: tuple[str, ...], flags: bytes) -> tuple[str, ...]:
+    """Return the `names` that `flags` from `screen` allow, in order."""
+    return tuple(name for name in names if flags[_INDEX[name]])
+
+
+def candidates(
+    text: Text, checks: Iterable[str] | None = None
+) -> tuple[str, ...]:
+    """Return the checks `text` may pass; all others certainly fail.
+
+    Args:
+        text (Text): value to screen, a string or bytes-like
+        checks (Iterable[str] | None): check names to consider, defaults
+            to all built-in checks
+
+    Returns:
+        tuple[str, ...]: names of the checks not ruled out, in check
+            order
+
+    Raises:
+        ValueError: If any check name is unknown.
+    """
+    return select(registry.resolve(checks), table[fingerprint(text)])
@@ -0,0 +1,290 @@
+"""Scrub emails, phone numbers and card numbers from text and logs.
+
+A `Redactor` finds values with the unanchored `SEARCH_PATTERNS` of
+`lsre.registry`, so every value it replaces passes the `is_*` check of
+its kind, and replaces each with a mask:
+
+- `full`: the kind in brackets, e.g. `[EMAIL]`
+- `partial`: the first character and domain of an email, e.g.
+  `j***@example.com`; for other kinds every letter and digit but the
+  last four, e.g. `**** **** **** 1111`
+- `hash`: the kind and a keyed BLAKE2 digest of the value, e.g.
+  `[EMAIL:2c8f0a1b9d3e]`, equal for equal values so redacted logs can
+  still be joined; emails are lowercased and numbers reduced to their
+  digits first. Without a secret `key` the digest of a phone number can
+  be found by hashing every number, so pass one.
+
+Any function from the matched bytes to their replacement works as a
+mask too. Streams and files are read in chunks and searched in windows
+that overlap by `lsre.extract.OVERLAP` bytes, like `lsre.extract`, and
+output is written as each chunk is done, so memory stays flat however
+large the input.
+
+Examples:
+    >>> from lsre.redact import Redactor
+    >>> Redactor().redact('mail jane@example.com or call +1-800-555-1212')
+    'mail [EMAIL] or call [PHONE_NUMBER]'
+    >>> Redactor(mask='partial').redact('card 4111 1111 1111 1111')
+    'card **** **** **** 1111'
+"""
+
+import hashlib
+import os
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO, overload
+
+from lsre.extract import CONTEXT, DEFAULT_CHUNK_SIZE, OVERLAP, search_pattern
+
+DEFAULT_KINDS = ('email', 'credit_card', 'phone_number')
+"""Kinds redacted by default; cards come first so they win over phones."""
+
+MASKS = ('full', 'partial', 'hash')
+"""Names of the built-in masks."""
+
+type Mask = str | Callable[[bytes], bytes]
+"""Name from `MASKS` or a function from a value to its replacement."""
+
+_KEEP = 4
+"""Characters left visible at the end by the `partial` mask."""
+_HIDDEN = bytes.maketrans(
+    b'0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    b'*' * 62,
+)
+_LAST_ALNUM = re.compile(rb'(?:[0-9A-Za-z][^0-9A-Za-z]*+){%d}$' % _KEEP)
+_NOT_DIGIT = re.compile(rb'[^0-9]')
+
+
+def _full(kind: str) -> Callable[[bytes], bytes]:
+    """Return the mask replacing a value with its kind."""
+    token = f'[{kind.upper()}]'.encode('ascii')
+    return lambda value: token  # noqa: ARG005
+
+
+def _partial(kind: str) -> Callable[[bytes], bytes]:
+    """Return the mask hiding all but the ends of a value."""
+    if kind == 'email':
+        return _partial_email
+    return _partial_tail
+
+
+def _partial_email(value: bytes) -> bytes:
+    """Keep the first character of the local part and the domain."""
+    local, _, domain = value.rpartition(b'@')
+    return local[:1] + b'***@' + domain
+
+
+def _partial_tail(value: bytes) -> bytes:
+    """Hide every letter and digit but the last four."""
+    match = _LAST_ALNUM.search(value)
+    cut = match.start() if match else len(value)
+    return value[:cut].translate(_HIDDEN) + value[cut:]
+
+
+def _hash(kind: str, key: bytes) -> Callable[[bytes], bytes]:
+    """Return the mask replacing a value with a keyed digest of it."""
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        msg = f'key must be at most 64 bytes, got {len(key)}'
+        raise ValueError(msg)
+    prefix = f'[{kind.upper()}:'.encode('ascii')
+    if kind == 'email':
+        normalize: Callable[[bytes], bytes] = bytes.lower
+    elif kind in {'credit_card', 'phone_number'}:
+        normalize = partial(_NOT_DIGIT.sub, b'')
+    else:
+        normalize = bytes
+
+    def mask(value: bytes) -> bytes:
+        digest = hashlib.blake2b(normalize(value), digest_size=6, key=key)
+        return prefix + digest.hexdigest().encode('ascii') + b']'
+
+    return mask
+
+
+def _bind(kind: str, mask: Mask, key: bytes) -> Callable[[bytes], bytes]:
+    """Return the replacement function of `mask` for `kind`."""
+    if callable(mask):
+        return mask
+    if mask == 'full':
+        return _full(kind)
+    if mask == 'partial':
+        return _partial(kind)
+    if mask == 'hash':
+        return _hash(kind, key)
+    msg = f'Unknown mask {mask!r}, expected any of {list(MASKS)} or a function'
+    raise ValueError(msg)
+
+
+class Redactor:
+    """Replace values of some kinds in text, bytes, streams and files.
+
+    Attributes:
+        kinds (tuple[str, ...]): kinds replaced, earlier kinds win when
+            two could start at the same offset
+        chunk_size (int): bytes read from streams at a time
+    """
+
+    def __init__(
+        self,
+        kinds: Iterable[str] | None = None,
+        mask: Mask | Mapping[str, Mask] = 'full',
+        *,
+        key: bytes = b'',
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Compile the search pattern and masks.
+
+        Args:
+            kinds (Iterable[str] | None): names from `SEARCH_PATTERNS`,
+                defaults to `DEFAULT_KINDS`
+            mask (Mask | Mapping[str, Mask]): mask for every kind, or
+                kind to mask with `full` for the kinds left out
+            key (bytes): secret of the `hash` mask, at most 64 bytes
+            chunk_size (int): bytes read from streams at a time
+
+        Raises:
+            ValueError: If a kind or mask is unknown, or a mask is given
+                for a kind not redacted.
+        """
+        if isinstance(kinds, str):
+            kinds = [kinds]
+        self.kinds = (
+            DEFAULT_KINDS if kinds is None else tuple(dict.fromkeys(kinds))
+        )
+        self.chunk_size = chunk_size
+        self._pattern = search_pattern(self.kinds)
+        masks = (
+            mask
+            if isinstance(mask, Mapping)
+            else dict.fromkeys(self.kinds, mask)
+        )
+        extra = [kind for kind in masks if kind not in self.kinds]
+        if extra:
+            msg = f'Masks given for {extra}, which are not in {self.kinds}'
+            raise ValueError(msg)
+        self._masks = {
+            kind: _bind(kind, masks.get(kind, 'full'), key)
+            for kind in self.kinds
+        }
+
+    @overload
+    def redact(self, text: str) -> str: ...
+
+    @overload
+    def redact(self, text: bytes | bytearray | memoryview) -> bytes: ...
+
+    def redact(
+        self, text: str | bytes | bytearray | memoryview
+    ) -> str | bytes:
+        """Return `text` with every value replaced by its mask.
+
+        Args:
+            text (str | bytes | bytearray | memoryview): text to scrub;
+                strings are matched as UTF-8
+
+        Returns:
+            str | bytes: scrubbed text, a string for a string
+        """
+        if isinstance(text, str):
+            return self._pattern.sub(self._replace, text.encode()).decode()
+        return self._pattern.sub(self._replace, bytes(text))
+
+    def redact_stream(
+        self, source: BinaryIO, target: BinaryIO
+    ) -> Counter[str]:
+        """Copy `source` to `target` with every value replaced.
+
+        Only the current chunk and a small tail of the previous one are
+        held in memory; output is written once per chunk.
+
+        Args:
+            source (BinaryIO): stream opened in binary mode
+            target (BinaryIO): stream written in binary mode
+
+        Returns:
+            Counter[str]: number of values replaced per kind
+        """
+        counts: Counter[str] = Counter()
+        masks = self._masks
+        finditer = self._pattern.finditer
+        buffer = b''
+        pos = 0  # where the next search starts; everything before is written
+        while True:
+            data = source.read(self.chunk_size)
+            buffer += data
+            limit = len(buffer) if not data else len(buffer) - OVERLAP
+            if limit > pos:
+                pieces = []
+                for match in finditer(buffer, pos, len(buffer)):
+                    start = match.start()
+                    if start >= limit:
+                        break
+                    kind = match.lastgroup or ''
+                    counts[kind] += 1
+                    pieces.append(buffer[pos:start])
+                    pieces.append(masks[kind](match.group()))
+                    pos = match.end()
+                end = max(pos, limit)
+                pieces.append(buffer[pos:end])
+                target.write(b''.join(pieces))
+                pos = end
+            if not data:
+                return counts
+            cut = max(0, pos - CONTEXT)
+            buffer = buffer[cut:]
+            pos -= cut
+
+    def redact_file(
+        self,
+        path: str | os.PathLike[str],
+        target: str | os.PathLike[str],
+    ) -> Counter[str]:
+        """Write a scrubbed copy of the file at `path` to `target`.
+
+        Args:
+            path (str | os.PathLike[str]): file to read
+            target (str | os.PathLike[str]): file to write
+
+        Returns:
+            Counter[str]: number of values replaced per kind
+        """
+        with Path(path).open('rb') as source, Path(target).open('wb') as out:
+            return self.redact_stream(source, out)
+
+    def _replace(self, match: re.Match[bytes]) -> bytes:
+        """Return the mask of one match."""
+        return self._masks[match.lastgroup or ''](match.group())
+
+
+def redact(
+    text: str,
+    kinds: Iterable[str] | None = None,
+    mask: Mask | Mapping[str, Mask] = 'full',
+    *,
+    key: bytes = b'',
+) -> str:
+    """Return `text` with every email, phone and card number masked.
+
+    Args:
+        text (str): text to scrub
+        kinds (Iterable[str] | None): names from `SEARCH_PATTERNS`,
+            defaults to `DEFAULT_KINDS`
+        mask (Mask | Mapping[str, Mask]): mask for every kind, or kind
+            to mask
+        key (bytes): secret of the `hash` mask
+
+    Returns:
+        str: scrubbed text
+
+    Raises:
+        ValueError: If a kind or mask is unknown.
+
+    Examples:
+        >>> from lsre.redact import redact
+        >>> redact('from jane@example.com', mask='partial')
+        'from j***@example.com'
+    """
+    return Redactor(kinds, mask, key=key).redact(text)
@@ -1,14 +1,51 @@
 """Simple Regular Expressions Functions."""
 
-import re
-
-from loguru import logger
-
-from lsre.utils import enforce_str_arg
-
-
-@enforce_str_arg
-def is_alphanumeric(text: str) -> bool:
+from collections.abc import Callable
+
+from lsre import engines
+from lsre.cache import memoize
+from lsre.luhn import luhn_valid, match_extended
+from lsre.metrics import track
+from lsre.registry import registry
+from lsre.utils import Text, enforce_text_arg
+
+_match_alphanumeric = registry['alphanumeric'].match
+_match_alphanumeric_bytes = registry.binary('alphanumeric').match
+_match_email = registry['email'].match
+_match_email_bytes = registry.binary('email').match
+_match_url = registry['url'].match
+_match_url_bytes = registry.binary('url').match
+_match_ipv4 = registry['ipv4'].match
+_match_ipv4_bytes = registry.binary('ipv4').match
+_match_ipv6 = registry['ipv6'].match
+_match_ipv6_bytes = registry.binary('ipv6').match
+_match_phone_number = registry['phone_number'].match
+_match_phone_number_bytes = registry.binary('phone_number').match
+_match_credit_card = registry['credit_card'].match
+_match_credit_card_bytes = registry.binary('credit_card').match
+_match_iso_date = registry['iso_date'].match
+_match_iso_date_bytes = registry.binary('iso_date').match
+_match_time = registry['time'].match
+_match_time_bytes = registry.binary('time').match
+_match_hex_color = registry['hex_color'].match
+_match_hex_color_bytes = registry.binary('hex_color').match
+_match_uuid = registry['uuid'].match
+_match_uuid_bytes = registry.binary('uuid').match
+_match_slug = registry['slug'].match
+_match_slug_bytes = registry.binary('slug').match
+_match_strong_password = registry['strong_password'].match
+_match_strong_password_bytes = registry.binary('strong_password').match
+
+
+def _run(check: Callable[[str], bool], text: Text) -> bool:
+    """Answer with an engine's own `check` instead of the regex."""
+    return check(text if isinstance(text, str) else str(text, 'ascii'))
+
+
+@track('alphanumeric')
+@memoize('alphanumeric')
+@enforce_text_arg
+def is_alphanumeric(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is a alphanumeric string.
 
     Alphanumeric string has:
@@ -17,13 +54,16 @@ def is_alphanumeric(text: str) -> bool:
     - Eg. `abc123`, `A1B2c3`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` is alphanumeric
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_alphanumeric
@@ -32,15 +72,21 @@ def is_alphanumeric(text: str) -> bool:
         >>> is_alphanumeric('123@')
         False
     """
-    logger.debug(f'Checking if {text} is alphanumeric')
-    pattern = r'^[a-zA-Z0-9]+$'
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
+    check = engines.get(engine).get('alphanumeric')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_alphanumeric(text)
+        if isinstance(text, str)
+        else _match_alphanumeric_bytes(text)
+    )
     return match is not None
 
 
-@enforce_str_arg
-def is_email(text: str) -> bool:
+@track('email')
+@memoize('email')
+@enforce_text_arg
+def is_email(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is an email address.
 
     Email contains following parts:
@@ -57,17 +103,20 @@ def is_email(text: str) -> bool:
     - **TLD**:
         - last label at least 2 chars
         - letters only
-    - Final email is local-part@domain.tld
+    - Final email is local-part@domain.tld, at most 254 chars
     - Eg. `user@example.com`, `user.name+tag@sub.domain.co`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches an email pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_email
@@ -75,24 +124,22 @@ def is_email(text: str) -> bool:
         True
         >>> is_email('invalid-email')
         False
-
-    Warning:
-        - Overall length limits are not strictly enforced by regex here.
     """
-    logger.debug(f'Checking if {text} is an email')
-    pattern = (
-        r'^(?!\.)(?!.*\.\.)[a-zA-Z0-9\._%\+-]{1,64}(?<!\.)'  # local-part
-        r'@'  # @
-        r'((?!(-|.*\-\.))[a-zA-Z0-9-]{1,63}\.)+'  # domain
-        r'[a-zA-Z]{2,}$'  # TLD
+    check = engines.get(engine).get('email')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_email(text)
+        if isinstance(text, str)
+        else _match_email_bytes(text)
     )
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
     return match is not None
 
 
-@enforce_str_arg
-def is_url(text: str) -> bool:
+@track('url')
+@memoize('url')
+@enforce_text_arg
+def is_url(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is a URL.
 
     URL contains following parts:
@@ -103,16 +150,20 @@ def is_url(text: str) -> bool:
     - **host**: domain name (labels like domain.tld) or IPv4 address;
     - **port**: optional :<1-5 digits>
     - **path/query/fragment**: optional, may contain any non-space characters.
+    - at most 2048 chars in total
     - Eg. `https://example.com/path?query=1`, `ftp://ftp.example.org`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches a URL pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_url
@@ -122,22 +173,21 @@ def is_url(text: str) -> bool:
         False
 
     Warning:
-        - Overall length limits are not strictly enforced by regex here.
         - IDN/unicode domains are not considered here.
     """
-    logger.debug(f'Checking if {text} is a url')
-    pattern = (
-        r'(http|https|ftp)://'  # scheme
-        r'(\w+:\w+@)?[a-z0-9]+(\.[a-z0-9])*'  # authority and host
-        r'(\:\d+)?(/\w+)?'  # port and path
+    check = engines.get(engine).get('url')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_url(text) if isinstance(text, str) else _match_url_bytes(text)
     )
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
     return match is not None
 
 
-@enforce_str_arg
-def is_ipv4(text: str) -> bool:
+@track('ipv4')
+@memoize('ipv4')
+@enforce_text_arg
+def is_ipv4(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is an IPv4 address.
 
     IPv4 address has:
@@ -147,13 +197,16 @@ def is_ipv4(text: str) -> bool:
     - Eg. `192.168.0.1`, `255.255.255.255`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches an IPv4 pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_ipv4
@@ -161,24 +214,27 @@ def is_ipv4(text: str) -> bool:
         True
         >>> is_ipv4('invalid-ip')
         False
+        >>> is_ipv4(memoryview(b'src=192.168.0.1')[4:])
+        True
+        >>> is_ipv4('192.168.0.1', engine='fast')
+        True
 
     Warning:
         - no leading zeros constraints (e.g. '01') are relaxed
     """
-    logger.debug(f'Checking if {text} is an IPv4 address')
-    pattern = (
-        r'^([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])\.'
-        r'([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])\.'
-        r'([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])\.'
-        r'([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])$'
+    check = engines.get(engine).get('ipv4')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_ipv4(text) if isinstance(text, str) else _match_ipv4_bytes(text)
     )
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
     return match is not None
 
 
-@enforce_str_arg
-def is_ipv6(text: str) -> bool:
+@track('ipv6')
+@memoize('ipv6')
+@enforce_text_arg
+def is_ipv6(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is an IPv6 address.
 
     IPv6 address has:
@@ -190,13 +246,16 @@ def is_ipv6(text: str) -> bool:
     - Eg. `::1`, `2001:0db8:85a3:0000:0000:8a2e:0370:7334`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches an IPv6 pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_ipv6
@@ -205,26 +264,19 @@ def is_ipv6(text: str) -> bool:
         >>> is_ipv6('invalid-ipv6')
         False
     """
-    logger.debug(f'Checking if {text} is an IPv6 address')
-    pattern = (
-        r'^('
-        r'([0-9A-Fa-f]{1,4}:){7}[0-9A-Fa-f]{1,4}|'
-        r'([0-9A-Fa-f]{1,4}:){1,6}(:[0-9A-Fa-f]{1,4}){1}|'
-        r'([0-9A-Fa-f]{1,4}:){1,5}(:[0-9A-Fa-f]{1,4}){1,2}|'
-        r'([0-9A-Fa-f]{1,4}:){1,4}(:[0-9A-Fa-f]{1,4}){1,3}|'
-        r'([0-9A-Fa-f]{1,4}:){1,3}(:[0-9A-Fa-f]{1,4}){1,4}|'
-        r'([0-9A-Fa-f]{1,4}:){1,2}(:[0-9A-Fa-f]{1,4}){1,5}|'
-        r'([0-9A-Fa-f]{1,4}:)(:[0-9A-Fa-f]{1,4}){1,6}|'
-        r':((:[0-9A-Fa-f]{1,4}){1,7}|:)'
-        r')$'
+    check = engines.get(engine).get('ipv6')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_ipv6(text) if isinstance(text, str) else _match_ipv6_bytes(text)
     )
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
     return match is not None
 
 
-@enforce_str_arg
-def is_phone_number(text: str) -> bool:
+@track('phone_number')
+@memoize('phone_number')
+@enforce_text_arg
+def is_phone_number(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is a phone number.
 
     Phone number has:
@@ -233,16 +285,20 @@ def is_phone_number(text: str) -> bool:
     - allow separators: spaces, hyphens, dots
     - allow optional parentheses around area code
     - require total of 7-15 digits (counting only digits)
+    - at most 32 chars in total
     - Eg. `+1-800-555-1212`, `8005551212`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches a phone number pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_phone_number
@@ -254,32 +310,58 @@ def is_phone_number(text: str) -> bool:
     Warning:
         - Doesn't check for separators consistency, only their presence
     """
-    logger.debug(f'Checking if {text} is a phone number')
-    pattern = r'^\+?(?=(?:.*\d){7,})(?!(?:.*\d){16,})[\d\-\(\)\s]+$'
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
+    check = engines.get(engine).get('phone_number')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_phone_number(text)
+        if isinstance(text, str)
+        else _match_phone_number_bytes(text)
+    )
     return match is not None
 
 
-@enforce_str_arg
-def is_credit_card(text: str) -> bool:
+@track('credit_card')
+@memoize('credit_card')
+@enforce_text_arg
+def is_credit_card(
+    text: Text,
+    engine: str | None = None,
+    *,
+    luhn: bool = False,
+    extended: bool = False,
+) -> bool:
     """Check if `text` is a credit card number.
 
     Credit card number has:
 
     - 15 to 16 digits in total
     - allow groups separated by spaces
+    - at most 32 chars in total
     - Eg. `4111 1111 1111 1111`, `4012888888881881`
 
+    With `extended=True` it has instead:
+
+    - 13 to 19 digits in total
+    - allow groups separated by single spaces or single hyphens, the
+      same one throughout
+    - Eg. `4222222222222`, `6011-0009-9013-9424`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`; the extended
+            pattern always runs on `re`
+        luhn (bool): also require the digits to pass the Luhn checksum
+        extended (bool): accept the lengths and separators above,
+            see `lsre.luhn.EXTENDED_PATTERN`
 
     Returns:
         bool: True if `text` matches a credit card pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_credit_card
@@ -287,21 +369,37 @@ def is_credit_card(text: str) -> bool:
         True
         >>> is_credit_card('invalid-credit-card')
         False
+        >>> is_credit_card('4111 1111 1111 1112', luhn=True)
+        False
+        >>> is_credit_card('4222-2222-22222', extended=True, luhn=True)
+        True
 
     Warning:
-        - Doesn't support uncommon card numbers 13-14 or 17-19 digits
-        - Luhn checksum is not validated
-        - Hyphenated formats are not supported
+        - Without `extended`, doesn't support uncommon card numbers
+          13-14 or 17-19 digits, nor hyphenated formats
+        - Without `luhn`, the checksum is not validated; see
+          `lsre.luhn.luhn_valid_many` for batches
     """
-    logger.debug(f'Checking if {text} is a credit card')
-    pattern = r'^(?=(?:.*\d){15,16}$)[0-9\s]+$'
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
-    return match is not None
-
-
-@enforce_str_arg
-def is_iso_date(text: str) -> bool:
+    check = engines.get(engine).get('credit_card')
+    if extended:
+        match = match_extended(text)
+    elif check is not None:
+        match = _run(check, text)
+    else:
+        match = (
+            _match_credit_card(text)
+            if isinstance(text, str)
+            else _match_credit_card_bytes(text)
+        ) is not None
+    if match and luhn:
+        match = luhn_valid(text)
+    return match
+
+
+@track('iso_date')
+@memoize('iso_date')
+@enforce_text_arg
+def is_iso_date(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is an ISO date.
 
     ISO date is format is:
@@ -313,13 +411,16 @@ def is_iso_date(text: str) -> bool:
     - Eg. ``2025-08-22``, ``1999-12-31``
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches an ISO date pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_iso_date
@@ -332,15 +433,21 @@ def is_iso_date(text: str) -> bool:
         - This simple regex does not fully validate month/day combinations
         - It does not validate leap years
     """
-    logger.debug(f'Checking if {text} is an ISO date')
-    pattern = r'^\d{4}-(0[0-9]|1[1-2])-([0-2][0-9]|3[0-1])$'
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
+    check = engines.get(engine).get('iso_date')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_iso_date(text)
+        if isinstance(text, str)
+        else _match_iso_date_bytes(text)
+    )
     return match is not None
 
 
-@enforce_str_arg
-def is_time(text: str) -> bool:
+@track('time')
+@memoize('time')
+@enforce_text_arg
+def is_time(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is a time string.
 
     Time format is:
@@ -352,13 +459,16 @@ def is_time(text: str) -> bool:
     - Eg. `23:59`, `00:00:00`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches a time pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_time
@@ -367,16 +477,19 @@ def is_time(text: str) -> bool:
         >>> is_time('24:00')
         False
     """
-    logger.debug(f'Checking if {text} is a time')
-
-    pattern = r'^([0-1][0-9]|2[0-3]):([0-5][0-9])(\:[0-5][0-9])?$'
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
+    check = engines.get(engine).get('time')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_time(text) if isinstance(text, str) else _match_time_bytes(text)
+    )
     return match is not None
 
 
-@enforce_str_arg
-def is_hex_color(text: str) -> bool:
+@track('hex_color')
+@memoize('hex_color')
+@enforce_text_arg
+def is_hex_color(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is a hex color.
 
     Hex color is a:
@@ -387,13 +500,16 @@ def is_hex_color(text: str) -> bool:
     - Eg. #FFF, #123456
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches a hex color pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_hex_color
@@ -402,15 +518,21 @@ def is_hex_color(text: str) -> bool:
         >>> is_hex_color('invalid-hex')
         False
     """
-    logger.debug(f'Checking if {text} is a hex color')
-    pattern = r'^#([0-9a-f]{3}|[0-9a-f]{6})$'
-    match = re.match(pattern=pattern, string=text, flags=re.IGNORECASE)
-    logger.debug(f'Match result: {match}')
+    check = engines.get(engine).get('hex_color')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_hex_color(text)
+        if isinstance(text, str)
+        else _match_hex_color_bytes(text)
+    )
     return match is not None
 
 
-@enforce_str_arg
-def is_uuid(text: str) -> bool:
+@track('uuid')
+@memoize('uuid')
+@enforce_text_arg
+def is_uuid(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is a UUID.
 
     UUIDs are:
@@ -420,13 +542,16 @@ def is_uuid(text: str) -> bool:
     - Eg. `123e4567-e89b-12d3-a456-426614174000`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches a UUID pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_uuid
@@ -435,15 +560,19 @@ def is_uuid(text: str) -> bool:
         >>> is_uuid('invalid-uuid')
         False
     """
-    logger.debug(f'Checking if {text} is a uuid')
-    pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
+    check = engines.get(engine).get('uuid')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_uuid(text) if isinstance(text, str) else _match_uuid_bytes(text)
+    )
     return match is not None
 
 
-@enforce_str_arg
-def is_slug(text: str) -> bool:
+@track('slug')
+@memoize('slug')
+@enforce_text_arg
+def is_slug(text: Text, engine: str | None = None) -> bool:
     """Check if `text` is a URL slug.
 
     Slugs are:
@@ -456,13 +585,16 @@ def is_slug(text: str) -> bool:
     Eg. `my-slug`, `another-slug-123`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches a slug pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_slug
@@ -471,15 +603,19 @@ def is_slug(text: str) -> bool:
         >>> is_slug('invalid_slug')
         False
     """
-    logger.debug(f'Checking if {text} is a slug')
-    pattern = r'^[a-z0-9]+(\-[a-z0-9]+)*$'
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
+    check = engines.get(engine).get('slug')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_slug(text) if isinstance(text, str) else _match_slug_bytes(text)
+    )
     return match is not None
 
 
-@enforce_str_arg
-def is_strong_password(text: str) -> bool:
+@track('strong_password')
+@memoize('strong_password')
+@enforce_text_arg
+def is_strong_password(text: Text, engine: str | None = None) -> bool:
     """Check if text meets a strong password policy.
 
     A strong password has:
@@ -490,13 +626,16 @@ def is_strong_password(text: str) -> bool:
     - Eg. `Aa1!aaaa`, `Str0ng#Pass`
 
     Args:
-        text (str): value to check
+        text (Text): value to check, as a string or UTF-8 bytes
+        engine (str | None): name from `lsre.engines`, defaults to the
+            engine set with `lsre.engines.set_default`
 
     Returns:
         bool: True if `text` matches a strong password pattern
 
     Raises:
-        TypeError: If the `text` is not a string.
+        TypeError: If the `text` is neither a string nor bytes-like.
+        ValueError: If the engine is unknown.
 
     Examples:
         >>> from lsre import is_strong_password
@@ -505,11 +644,12 @@ def is_strong_password(text: str) -> bool:
         >>> is_strong_password('invalid_password')
         False
     """
-    logger.debug(f'Checking if {text} is a strong password')
-    pattern = (
-        r'^(?=(?:.*[a-z]))(?=(?:.*[A-Z]))(?=(?:.*[0-9]))(?=(?:.*[!@#$%&]))'
-        r'.{8,}$'
+    check = engines.get(engine).get('strong_password')
+    if check is not None:
+        return _run(check, text)
+    match = (
+        _match_strong_password(text)
+        if isinstance(text, str)
+        else _match_strong_password_bytes(text)
     )
-    match = re.match(pattern=pattern, string=text)
-    logger.debug(f'Match result: {match}')
     return match is not None
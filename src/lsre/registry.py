@@ -0,0 +1,328 @@
+"""Registry of precompiled validator patterns."""
+
+import re
+from collections.abc import Iterable, Iterator, Mapping
+
+PATTERNS: dict[str, tuple[str, int]] = {
+    'alphanumeric': (r'^[a-zA-Z0-9]++$', 0),
+    'email': (
+        r'^(?=[\s\S]{0,254}$)'  # at most 254 characters
+        r'(?=[a-zA-Z0-9\._%\+-]{1,64}@)'  # local-part of 1-64 characters
+        r'[a-zA-Z0-9_%\+-]++(?:\.[a-zA-Z0-9_%\+-]++)*+'  # local-part
+        r'@'  # @
+        r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)++'  # domain
+        r'[a-zA-Z]{2,}+$',  # TLD
+        0,
+    ),
+    'url': (
+        r'(?=[\s\S]{0,2048}$)'  # at most 2048 characters
+        r'(http|https|ftp)://'  # scheme
+        r'(\w+:\w+@)?[a-z0-9]+(\.[a-z0-9])*'  # authority and host
+        r'(\:\d+)?(/\w+)?',  # port and path
+        0,
+    ),
+    'ipv4': (
+        r'^([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])\.'
+        r'([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])\.'
+        r'([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])\.'
+        r'([0-1]?[0-9]?[0-9]|2[0-4][0-9]|25[0-5])$',
+        0,
+    ),
+    'ipv6': (
+        r'^('
+        r'([0-9A-Fa-f]{1,4}:){7}[0-9A-Fa-f]{1,4}|'
+        r'([0-9A-Fa-f]{1,4}:){1,6}(:[0-9A-Fa-f]{1,4}){1}|'
+        r'([0-9A-Fa-f]{1,4}:){1,5}(:[0-9A-Fa-f]{1,4}){1,2}|'
+        r'([0-9A-Fa-f]{1,4}:){1,4}(:[0-9A-Fa-f]{1,4}){1,3}|'
+        r'([0-9A-Fa-f]{1,4}:){1,3}(:[0-9A-Fa-f]{1,4}){1,4}|'
+        r'([0-9A-Fa-f]{1,4}:){1,2}(:[0-9A-Fa-f]{1,4}){1,5}|'
+        r'([0-9A-Fa-f]{1,4}:)(:[0-9A-Fa-f]{1,4}){1,6}|'
+        r':((:[0-9A-Fa-f]{1,4}){1,7}|:)'
+        r')$',
+        0,
+    ),
+    'phone_number': (
+        r'^(?=[\s\S]{0,32}$)'  # at most 32 characters
+        r'\+?+(?=(?:[^\d\n]*+\d){7})(?!(?:[^\d\n]*+\d){16})'  # 7-15 digits
+        r'[\d\-\(\)\s]++$',
+        0,
+    ),
+    'credit_card': (
+        r'^(?=[\s\S]{0,32}$)'  # at most 32 characters
+        r'(?=(?:[^\d\n]*+\d){15,16}$)'  # 15-16 digits, ending in one
+        r'[0-9\s]++$',
+        0,
+    ),
+    'iso_date': (r'^\d{4}-(0[0-9]|1[1-2])-([0-2][0-9]|3[0-1])$', 0),
+    'time': (r'^([0-1][0-9]|2[0-3]):([0-5][0-9])(\:[0-5][0-9])?$', 0),
+    'hex_color': (r'^#([0-9a-f]{3}|[0-9a-f]{6})$', re.IGNORECASE),
+    'uuid': (
+        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+        0,
+    ),
+    'slug': (r'^[a-z0-9]++(?:\-[a-z0-9]++)*+$', 0),
+    'strong_password': (
+        r'^(?=[^a-z\n]*+[a-z])(?=[^A-Z\n]*+[A-Z])'  # lower and upper case
+        r'(?=[^0-9\n]*+[0-9])(?=[^!@#$%&\n]*+[!@#$%&])'  # digit and symbol
+        r'.{8,}+$',
+        0,
+    ),
+}
+"""Check name to the `(source, flags)` of its pattern.
+
+Every pattern runs in time linear in the length of the text: no group
+can match the same text in two ways, quantifiers that never need to
+give characters back are possessive, and the free-form checks start
+with a lookahead that rejects texts over a length ceiling, not counting
+a trailing newline.
+"""
+
+SEARCH_PATTERNS: dict[str, str] = {
+    'url': (
+        r'(?<![a-zA-Z0-9])(?:http|https|ftp)://'  # scheme
+        r'(?:\w{1,64}:\w{1,64}@)?[a-z0-9]{1,253}(?:\.[a-z0-9]){0,253}'  # host
+        r'(?:\:\d{1,5})?(?:/\w{1,255})?'  # port and path
+        r'[^\s<>"\'\x00-\x1f\x7f]{0,2048}'  # rest of the url
+    ),
+    'email': (
+        r'(?<![a-zA-Z0-9\._%\+-])(?=[a-zA-Z0-9\._%\+-]{1,64}@)'
+        r'[a-zA-Z0-9_%\+-]{1,64}(?:\.[a-zA-Z0-9_%\+-]{1,63}){0,31}'  # local
+        r'@'  # @
+        r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.){1,16}'  # domain
+        r'[a-zA-Z]{2,63}(?![a-zA-Z0-9-])'  # TLD
+    ),
+    'uuid': (
+        r'(?<![0-9a-zA-Z-])'
+        r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+        r'(?![0-9a-zA-Z-])'
+    ),
+    'ipv6': (
+        r'(?<![0-9A-Fa-f:])(?=[0-9A-Fa-f]{0,4}:)(?:'  # cheap reject first
+        r'(?:[0-9A-Fa-f]{1,4}:){7}[0-9A-Fa-f]{1,4}|'
+        r'(?:[0-9A-Fa-f]{1,4}:){1,6}(?::[0-9A-Fa-f]{1,4}){1}|'
+        r'(?:[0-9A-Fa-f]{1,4}:){1,5}(?::[0-9A-Fa-f]{1,4}){1,2}|'
+        r'(?:[0-9A-Fa-f]{1,4}:){1,4}(?::[0-9A-Fa-f]{1,4}){1,3}|'
+        r'(?:[0-9A-Fa-f]{1,4}:){1,3}(?::[0-9A-Fa-f]{1,4}){1,4}|'
+        r'(?:[0-9A-Fa-f]{1,4}:){1,2}(?::[0-9A-Fa-f]{1,4}){1,5}|'
+        r'(?:[0-9A-Fa-f]{1,4}:)(?::[0-9A-Fa-f]{1,4}){1,6}|'
+        r':(?:(?::[0-9A-Fa-f]{1,4}){1,7}|:)'
+        r')(?![0-9A-Fa-f:\.])'
+    ),
+    'ipv4': (
+        r'(?<![0-9\.])(?=[0-9]{1,3}\.)'  # cheap reject first
+        r'(?:(?:25[0-5]|2[0-4][0-9]|[0-1]?[0-9]?[0-9])\.){3}'
+        r'(?:25[0-5]|2[0-4][0-9]|[0-1]?[0-9]?[0-9])'
+        r'(?![0-9]|\.[0-9])'
+    ),
+    'credit_card': (
+        r'(?<![\w-])(?<![0-9][ -])'  # not inside a word or longer number
+        r'[0-9](?:(?: ?[0-9]){14,15}|(?:-?[0-9]){14,15})'  # 15-16 digits,
+        r'(?!\w|[ -][0-9])'  # single spaces or single hyphens between
+    ),
+    'phone_number': (
+        r'(?<![\w+()-])'  # not inside a word or another number
+        r'(?:(?=\+)|(?<![0-9] ))'  # nor right after one, unless it has +
+        r'(?=\+?(?:[ ()-]*+[0-9]){7})'  # at least 7 digits
+        r'(?!\+?(?:[ ()-]*+[0-9]){16})'  # at most 15 digits
+        r'(?:'
+        r'\+[0-9][0-9() -]{5,29}[0-9)]|'  # +44 20 7946 0958, at most 32
+        r'(?:1[ -])?(?:\([0-9]{3}\) ?|[0-9]{3}[ -])'  # (555) 123-4567 or
+        r'[0-9]{3}[ -][0-9]{4}'  # 555-123-4567, never a date or time
+        r')'
+        r'(?![ ()-]*+[0-9])(?!\w)'  # and every digit of the run
+    ),
+}
+"""Unanchored, length-bounded variants of some checks for searching text.
+
+Every match is a substring that passes the check of the same name, and
+no match is longer than a few KB, so scanners can work in windows.
+Hyphenated card numbers are searched for too, so `credit_card` matches
+pass `is_credit_card(text, extended=True)`. `phone_number` only finds
+numbers written with a `+`, an area code in parentheses or in 3-3-4
+digit groups, never bare runs of digits, dates or times.
+"""
+
+
+def _to_bytes(source: str) -> bytes:
+    r"""Translate a str pattern source into an equivalent bytes source.
+
+    In str patterns `\s` also matches the ASCII separators `\x1c` to
+    `\x1f`, which bytes patterns do not, so it is spelled out. Every
+    `\s` in `PATTERNS` sits inside a character class.
+    """
+    return source.replace(r'\s', r'\t-\r\x1c-\x20').encode('ascii')
+
+
+class PatternRegistry(Mapping[str, re.Pattern[str]]):
+    """Read-only mapping of check names to compiled patterns.
+
+    Each pattern is compiled the first time it is requested and the
+    compiled object is kept for the lifetime of the registry, so lookups
+    never go through the `re` module cache.
+
+    Args:
+        patterns (Mapping[str, tuple[str, int]]): check name to
+            `(source, flags)` pairs
+
+    Examples:
+        >>> from lsre.registry import registry
+        >>> registry['ipv4'].match('192.168.0.1') is not None
+        True
+        >>> registry['ipv4'] is registry['ipv4']
+        True
+    """
+
+    def __init__(self, patterns: Mapping[str, tuple[str, int]]) -> None:
+        """Store pattern sources, compilation is deferred to lookup."""
+        self._sources = dict(patterns)
+        self._compiled: dict[str, re.Pattern[str]] = {}
+        self._binary: dict[str, re.Pattern[bytes]] = {}
+        self._combined: dict[tuple[str, ...], re.Pattern[str]] = {}
+        self._combined_binary: dict[tuple[str, ...], re.Pattern[bytes]] = {}
+
+    def __getitem__(self, name: str) -> re.Pattern[str]:
+        """Return the compiled pattern for check `name`.
+
+        Raises:
+            KeyError: If `name` is not a registered check.
+        """
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            source, flags = self._sources[name]
+            compiled = self._compiled[name] = re.compile(source, flags)
+        return compiled
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over check names in registration order."""
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        """Return the number of registered checks."""
+        return len(self._sources)
+
+    def binary(self, name: str) -> re.Pattern[bytes]:
+        """Return the pattern for check `name` compiled for bytes input.
+
+        On ASCII input it gives the same answers as the str pattern, so
+        ASCII bytes can be checked without decoding them.
+
+        Raises:
+            KeyError: If `name` is not a registered check.
+
+        Examples:
+            >>> from lsre.registry import registry
+            >>> registry.binary('ipv4').match(b'192.168.0.1') is not None
+            True
+        """
+        compiled = self._binary.get(name)
+        if compiled is None:
+            source, flags = self._sources[name]
+            compiled = self._binary[name] = re.compile(
+                _to_bytes(source), flags
+            )
+        return compiled
+
+    def source(self, name: str) -> tuple[str, int]:
+        """Return the `(source, flags)` pair check `name` was built from.
+
+        Args:
+            name (str): registered check name
+
+        Returns:
+            tuple[str, int]: uncompiled pattern and its `re` flags
+
+        Raises:
+            KeyError: If `name` is not a registered check.
+        """
+        return self._sources[name]
+
+    def resolve(self, checks: Iterable[str] | None) -> tuple[str, ...]:
+        """Validate check names, defaulting to every registered check.
+
+        Args:
+            checks (Iterable[str] | None): requested check names, or a
+                single name
+
+        Returns:
+            tuple[str, ...]: check names in request order, without
+                duplicates
+
+        Raises:
+            ValueError: If any name is not a registered check.
+        """
+        if checks is None:
+            return tuple(self._sources)
+        if isinstance(checks, str):
+            checks = [checks]
+        names = tuple(dict.fromkeys(checks))
+        unknown = [name for name in names if name not in self._sources]
+        if unknown:
+            msg = f'Unknown checks {unknown}, expected any of {list(self)}'
+            raise ValueError(msg)
+        return names
+
+    def combined(self, checks: Iterable[str] | None = None) -> re.Pattern[str]:
+        """Return one pattern that evaluates several checks in one call.
+
+        Every check becomes an optional lookahead holding a named group,
+        so a single `match` reports every check that passed: the group
+        named after a check is not None exactly when that check's own
+        pattern matches.
+
+        Args:
+            checks (Iterable[str] | None): check names, defaults to all
+
+        Returns:
+            re.Pattern[str]: combined pattern, compiled once per set of
+                checks
+
+        Raises:
+            ValueError: If any name is not a registered check.
+
+        Examples:
+            >>> from lsre.registry import registry
+            >>> match = registry.combined(['slug', 'uuid']).match('abc-1')
+            >>> match.group('slug'), match.group('uuid')
+            ('abc-1', None)
+        """
+        names = self.resolve(checks)
+        compiled = self._combined.get(names)
+        if compiled is None:
+            source = self._combined_source(names)
+            compiled = self._combined[names] = re.compile(source)
+        return compiled
+
+    def combined_binary(
+        self, checks: Iterable[str] | None = None
+    ) -> re.Pattern[bytes]:
+        """Return the `combined` pattern compiled for bytes input.
+
+        Args:
+            checks (Iterable[str] | None): check names, defaults to all
+
+        Returns:
+            re.Pattern[bytes]: combined pattern, compiled once per set of
+                checks
+
+        Raises:
+            ValueError: If any name is not a registered check.
+        """
+        names = self.resolve(checks)
+        compiled = self._combined_binary.get(names)
+        if compiled is None:
+            source = _to_bytes(self._combined_source(names))
+            compiled = self._combined_binary[names] = re.compile(source)
+        return compiled
+
+    def _combined_source(self, names: tuple[str, ...]) -> str:
+        """Join the sources of `names` into optional named lookaheads."""
+        parts = []
+        for name in names:
+            source, flags = self._sources[name]
+            if flags & re.IGNORECASE:
+                source = f'(?i:{source})'
+            parts.append(f'(?:(?=(?P<{name}>{source})))?')
+        return ''.join(parts)
+
+
+registry = PatternRegistry(PATTERNS)
@@ -0,0 +1,248 @@
+"""Validate dict records field by field against a compiled schema.
+
+A `Schema` maps field names to checks and is compiled once into a plan
+holding each field's bound matcher. Validating a batch of records then
+runs column by column: each field's values are pulled out of every
+record and matched in one pass, without looking up a validator per row.
+
+Examples:
+    >>> from lsre.schema import Schema
+    >>> schema = Schema({'email': 'email', 'ip': 'ipv4'})
+    >>> result = schema.validate(
+    ...     [
+    ...         {'email': 'a@b.co', 'ip': '10.0.0.1'},
+    ...         {'email': 'nope', 'ip': '10.0.0.1'},
+    ...         {'email': 'a@b.co'},
+    ...     ]
+    ... )
+    >>> result['email'], result['ip']
+    ([False, True, False], [False, False, True])
+    >>> result.passed()
+    [True, False, False]
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from lsre import engines, metrics, regex_functions
+from lsre.registry import registry
+from lsre.utils import chunked
+
+type Validator = str | Callable[[str], object]
+type Record = Mapping[str, Any]
+
+_FLIP = bytes([1, 0]) + bytes(254)
+"""Translation table turning a pass mask into a failure mask."""
+
+_STR_ONLY = frozenset({str})
+"""Value types a column may hold to be matched without per-item checks."""
+
+
+class FieldPlan(NamedTuple):
+    """How one field of a `Schema` is checked.
+
+    Attributes:
+        field (str): record key
+        name (str): check name, or the function name of a custom check
+        match (Callable[[str], object]): truthy for passing strings
+        builtin (bool): whether `name` is a registered check, counted in
+            `lsre.metrics`
+    """
+
+    field: str
+    name: str
+    match: Callable[[str], object]
+    builtin: bool
+
+
+@dataclass(frozen=True)
+class SchemaResult:
+    """Failure masks produced by `Schema.validate`.
+
+    Attributes:
+        size (int): number of records
+        failures (dict[str, bytearray]): field name to a mask holding
+            `1` at every record whose field failed its check, else `0`
+    """
+
+    size: int
+    failures: dict[str, bytearray]
+
+    def __getitem__(self, field: str) -> list[bool]:
+        """Return which records failed `field` as a list of booleans.
+
+        Raises:
+            KeyError: If `field` is not in the schema.
+        """
+        return [bool(flag) for flag in self.failures[field]]
+
+    def passed(self) -> list[bool]:
+        """Return which records passed every field."""
+        failed = bytearray(self.size)
+        for mask in self.failures.values():
+            failed = bytearray(
+                a | b for a, b in zip(failed, mask, strict=True)
+            )
+        return [not flag for flag in failed]
+
+    def row(self, index: int) -> dict[str, bool]:
+        """Return the failing flag of every field for the record at `index`.
+
+        Args:
+            index (int): position of the record in the batch
+
+        Returns:
+            dict[str, bool]: field name to True if the field failed
+        """
+        return {
+            field: bool(mask[index]) for field, mask in self.failures.items()
+        }
+
+    @classmethod
+    def merge(cls, results: Iterable['SchemaResult']) -> 'SchemaResult':
+        """Concatenate results of consecutive batches, in order.
+
+        Args:
+            results (Iterable[SchemaResult]): results of the same schema
+
+        Returns:
+            SchemaResult: one result covering every batch
+        """
+        size = 0
+        failures: dict[str, bytearray] = {}
+        for result in results:
+            size += result.size
+            for field, mask in result.failures.items():
+                failures.setdefault(field, bytearray()).extend(mask)
+        return cls(size=size, failures=failures)
+
+
+class Schema:
+    """Field names mapped to checks, compiled once for bulk validation.
+
+    A field fails when it is missing, None, neither a string nor
+    bytes-like, or does not pass its check; fields listed in `optional`
+    may also be missing or None. Bytes are decoded as UTF-8, replacing
+    invalid sequences, as the `is_*` functions do.
+
+    Attributes:
+        plan (tuple[FieldPlan, ...]): how each field is checked, in
+            schema order
+        optional (frozenset[str]): fields that may be missing or None
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, Validator],
+        *,
+        optional: Iterable[str] = (),
+        engine: str | None = None,
+    ) -> None:
+        """Compile `fields` into a plan.
+
+        Args:
+            fields (Mapping[str, Validator]): record key to a check name
+                such as `email` or `is_email`, a built-in `is_*`
+                function, or any function of a string returning a truthy
+                value for valid text
+            optional (Iterable[str]): fields that may be missing or None
+            engine (str | None): name from `lsre.engines`, defaults to
+                the default engine when the schema is created
+
+        Raises:
+            ValueError: If a check name, the engine or an optional field
+                is unknown.
+        """
+        own_checks = engines.get(engine)
+        plan = []
+        for field, validator in fields.items():
+            if isinstance(validator, str):
+                name = validator.removeprefix('is_')
+                registry.resolve([name])
+            else:
+                name = _builtin_name(validator)
+                if name is None:
+                    label = getattr(validator, '__name__', repr(validator))
+                    plan.append(
+                        FieldPlan(field, label, validator, builtin=False)
+                    )
+                    continue
+            match = own_checks.get(name) or registry[name].match
+            plan.append(FieldPlan(field, name, match, builtin=True))
+        self.plan = tuple(plan)
+        self.optional = frozenset(optional)
+        unknown = self.optional - set(fields)
+        if unknown:
+            msg = f'Optional fields {sorted(unknown)} are not in the schema'
+            raise ValueError(msg)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names, in schema order."""
+        return tuple(step.field for step in self.plan)
+
+    def validate(self, records: Iterable[Record]) -> SchemaResult:
+        """Check every field of every record.
+
+        Args:
+            records (Iterable[Record]): dicts or other mappings
+
+        Returns:
+            SchemaResult: one failure mask per field
+        """
+        rows = records if isinstance(records, list) else list(records)
+        failures = {}
+        for step in self.plan:
+            start = time.perf_counter_ns()
+            values = [row.get(step.field) for row in rows]
+            if _STR_ONLY.issuperset(map(type, values)):
+                passed = bytearray(map(bool, map(step.match, values)))
+            else:
+                passed = self._check_mixed(step, values)
+            failures[step.field] = passed.translate(_FLIP)
+            if step.builtin and metrics.is_enabled():
+                elapsed = time.perf_counter_ns() - start
+                metrics.record(
+                    step.name, len(values), passed.count(1), elapsed
+                )
+        return SchemaResult(size=len(rows), failures=failures)
+
+    def validate_stream(
+        self, records: Iterable[Record], chunk_size: int = 10_000
+    ) -> Iterator[tuple[list[Record], SchemaResult]]:
+        """Check records chunk by chunk, holding one chunk at a time.
+
+        Args:
+            records (Iterable[Record]): dicts or other mappings
+            chunk_size (int): number of records per chunk
+
+        Yields:
+            tuple[list[Record], SchemaResult]: a chunk of records and its
+                failure masks
+        """
+        for chunk in chunked(records, chunk_size):
+            yield chunk, self.validate(chunk)
+
+    def _check_mixed(self, step: FieldPlan, values: list[Any]) -> bytearray:
+        """Check a column holding something other than strings."""
+        allow_none = step.field in self.optional
+        passed = bytearray(len(values))
+        for index, value in enumerate(values):
+            if isinstance(value, str):
+                passed[index] = bool(step.match(value))
+            elif isinstance(value, (bytes, bytearray, memoryview)):
+                text = str(value, 'utf-8', 'replace')
+                passed[index] = bool(step.match(text))
+            else:
+                passed[index] = value is None and allow_none
+        return passed
+
+
+def _builtin_name(validator: Callable[[str], object]) -> str | None:
+    """Return the check name if `validator` is a built-in `is_*` function."""
+    name = getattr(validator, '__name__', '').removeprefix('is_')
+    if getattr(regex_functions, f'is_{name}', None) is validator:
+        return name
+    return None
@@ -0,0 +1,447 @@
+"""HTTP validation service on asyncio, batching concurrent requests.
+
+`POST /validate` takes a JSON object with `texts`, a list of strings,
+and optionally `checks`, a list of check names defaulting to all, and
+answers `{"results": {check: [bool, ...]}}` in the order of `texts`.
+
+Requests for the same checks arriving within `max_delay` seconds of
+each other, or in the same turn of the event loop by default, are
+validated together in one `lsre.aio.validate_many` call of up to
+`max_batch` texts, so many small requests share the batch engine
+instead of each paying its per-call overhead. Every pattern is compiled
+when the server starts.
+
+`GET /metrics` serves the server counters and, when `lsre.metrics` is
+enabled as `python -m lsre.server` does, the validator metrics in the
+Prometheus text format. `GET /health` answers `{"status": "ok"}`.
+
+Examples:
+    `python -m lsre.server --port 8080`, then
+    `curl -d '{"texts": ["a@b.co"]}' localhost:8080/validate`
+"""
+
+import argparse
+import asyncio
+import json
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from lsre import aio, metrics
+from lsre.registry import registry
+
+DEFAULT_MAX_BATCH = 10_000
+"""Most texts validated together before a batch is run right away."""
+
+DEFAULT_MAX_DELAY = 0.0
+"""Seconds the first request of a batch waits for others to join.
+
+At 0, the requests read in the same turn of the event loop are batched
+together, which under load beats waiting any longer.
+"""
+
+DEFAULT_MAX_BODY = 16 * 1024 * 1024
+"""Largest request body accepted, in bytes."""
+
+DEFAULT_MAX_HEADERS = 100
+"""Most header lines accepted in one request."""
+
+type Masks = dict[str, list[bool]]
+
+
+class RequestError(Exception):
+    """A request that gets an error status instead of results."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        """Keep the status to answer with.
+
+        Args:
+            status (HTTPStatus): response status
+            message (str): explanation sent to the client
+        """
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class _Pending:
+    """Requests waiting to be validated together."""
+
+    texts: list[str]
+    futures: list[tuple[int, asyncio.Future[Masks]]]
+    timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher:
+    """Merge concurrent validation requests into shared batches.
+
+    Requests for the same checks wait at most `max_delay` seconds for
+    others to join, and a batch is run as soon as it holds `max_batch`
+    texts. Each batch goes through `lsre.aio.validate_many`, which
+    yields to the event loop between chunks.
+
+    Attributes:
+        requests (int): requests answered
+        batches (int): batches run
+        texts (int): texts validated
+    """
+
+    def __init__(
+        self,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        """Create an empty batcher.
+
+        Args:
+            max_batch (int): texts that trigger a batch right away
+            max_delay (float): seconds a request waits for others
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.requests = 0
+        self.batches = 0
+        self.texts = 0
+        self._pending: dict[tuple[str, ...], _Pending] = {}
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def validate(
+        self, texts: list[str], checks: tuple[str, ...]
+    ) -> Masks:
+        """Validate `texts` in the next batch for `checks`.
+
+        Args:
+            texts (list[str]): values to check
+            checks (tuple[str, ...]): resolved check names
+
+        Returns:
+            Masks: check name to one result per text
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Masks] = loop.create_future()
+        pending = self._pending.get(checks)
+        if pending is None:
+            pending = self._pending[checks] = _Pending([], [])
+            pending.timer = loop.call_later(
+                self.max_delay, self._flush, checks
+            )
+        pending.futures.append((len(pending.texts), future))
+        pending.texts += texts
+        if len(pending.texts) >= self.max_batch:
+            self._flush(checks)
+        return await future
+
+    def _flush(self, checks: tuple[str, ...]) -> None:
+        """Start validating the pending batch for `checks`."""
+        pending = self._pending.pop(checks)
+        if pending.timer is not None:
+            pending.timer.cancel()
+        task = asyncio.create_task(self._run(checks, pending))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, checks: tuple[str, ...], pending: _Pending) -> None:
+        """Validate one batch and hand every request its slice."""
+        try:
+            result = await aio.validate_many(pending.texts, checks)
+        except Exception as error:  # noqa: BLE001
+            for _, future in pending.futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        self.batches += 1
+        self.requests += len(pending.futures)
+        self.texts += result.size
+        ends = [start for start, _ in pending.futures[1:]] + [result.size]
+        for (start, future), end in zip(pending.futures, ends, strict=True):
+            # a request whose client went away has its future cancelled
+            if future.done():
+                continue
+            future.set_result(
+                {
+                    name: [bool(flag) for flag in mask[start:end]]
+                    for name, mask in result.masks.items()
+                }
+            )
+
+
+class ValidationServer:
+    """HTTP/1.1 front end of a `MicroBatcher`.
+
+    Connections are kept alive unless the client asks otherwise, so a
+    client can send many requests over one connection.
+    """
+
+    def __init__(
+        self,
+        batcher: MicroBatcher | None = None,
+        max_body: int = DEFAULT_MAX_BODY,
+        max_headers: int = DEFAULT_MAX_HEADERS,
+    ) -> None:
+        """Create a server, compiling every pattern up front.
+
+        Lines of the request head are limited to the 64 KiB buffer of
+        `asyncio.StreamReader`.
+
+        Args:
+            batcher (MicroBatcher | None): batcher to validate with,
+                defaults to one with the default limits
+            max_body (int): largest request body accepted, in bytes
+            max_headers (int): most header lines accepted per request
+        """
+        self.batcher = batcher or MicroBatcher()
+        self.max_body = max_body
+        self.max_headers = max_headers
+        for name in registry:
+            registry[name]
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        """Start listening, use port 0 to pick a free port.
+
+        Args:
+            host (str): address to bind
+            port (int): port to bind
+
+        Returns:
+            asyncio.Server: the listening server
+        """
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection until it closes.
+
+        A request that cannot be read gets an error and the connection
+        is closed, since the rest of the stream cannot be trusted. Any
+        other error is answered and the connection stays open.
+        """
+        try:
+            while True:
+                try:
+                    request = await self._read(reader)
+                except RequestError as error:
+                    writer.write(_error(error, keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get('connection') != 'close'
+                try:
+                    status, kind, payload = await self._route(
+                        method, path, body
+                    )
+                except RequestError as error:
+                    writer.write(_error(error, keep_alive=keep_alive))
+                except Exception as error:  # noqa: BLE001
+                    internal = RequestError(
+                        HTTPStatus.INTERNAL_SERVER_ERROR, repr(error)
+                    )
+                    writer.write(_error(internal, keep_alive=keep_alive))
+                else:
+                    writer.write(
+                        _response(status, kind, payload, keep_alive=keep_alive)
+                    )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _read(
+        self, reader: asyncio.StreamReader
+    ) -> tuple[str, str, dict[str, str], bytes] | None:
+        """Read one request, or return None at the end of the stream."""
+        line = await _read_line(reader, HTTPStatus.BAD_REQUEST)
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode('latin-1').split()
+        except ValueError:
+            msg = 'Malformed request line'
+            raise RequestError(HTTPStatus.BAD_REQUEST, msg) from None
+        headers = {}
+        too_large = HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+        for _ in range(self.max_headers + 1):
+            line = await _read_line(reader, too_large)
+            if line in {b'\r\n', b'\n', b''}:
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip().lower()
+        else:
+            msg = f'More than {self.max_headers} headers'
+            raise RequestError(too_large, msg)
+        if 'transfer-encoding' in headers:
+            msg = 'Transfer-Encoding is not supported, send Content-Length'
+            raise RequestError(HTTPStatus.NOT_IMPLEMENTED, msg)
+        length = headers.get('content-length', '0')
+        if not (length.isascii() and length.isdigit()):
+            msg = f'Bad Content-Length {length!r}'
+            raise RequestError(HTTPStatus.BAD_REQUEST, msg)
+        if int(length) > self.max_body:
+            msg = f'Body over {self.max_body} bytes'
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, msg)
+        body = await reader.readexactly(int(length))
+        return method, target.partition('?')[0], headers, body
+
+    async def _route(
+        self, method: str, path: str, body: bytes
+    ) -> tuple[HTTPStatus, str, bytes]:
+        """Return the status, content type and body answering a request."""
+        routes = {'/validate': 'POST', '/metrics': 'GET', '/health': 'GET'}
+        if path not in routes:
+            raise RequestError(HTTPStatus.NOT_FOUND, f'No route {path}')
+        if method != routes[path]:
+            msg = f'{path} only accepts {routes[path]}'
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, msg)
+        if path == '/metrics':
+            text = self.prometheus()
+            return HTTPStatus.OK, 'text/plain; version=0.0.4', text.encode()
+        if path == '/health':
+            return HTTPStatus.OK, 'application/json', b'{"status": "ok"}'
+        texts, checks = _parse_validate(body)
+        masks = await self.batcher.validate(texts, checks)
+        payload = json.dumps({'results': masks}).encode()
+        return HTTPStatus.OK, 'application/json', payload
+
+    def prometheus(self) -> str:
+        """Return the server counters and validator metrics.
+
+        Returns:
+            str: Prometheus text exposition format
+        """
+        lines = []
+        for name, value, help_text in (
+            ('requests', self.batcher.requests, 'Validation requests.'),
+            ('batches', self.batcher.batches, 'Batches validated.'),
+            ('texts', self.batcher.texts, 'Texts validated.'),
+        ):
+            lines += [
+                f'# HELP lsre_server_{name}_total {help_text}',
+                f'# TYPE lsre_server_{name}_total counter',
+                f'lsre_server_{name}_total {value}',
+            ]
+        text = '\n'.join(lines) + '\n'
+        if metrics.is_enabled():
+            text += metrics.to_prometheus()
+        return text
+
+
+async def _read_line(
+    reader: asyncio.StreamReader, status: HTTPStatus
+) -> bytes:
+    """Read one line of a request head, answering `status` if too long."""
+    try:
+        return await reader.readline()
+    except ValueError:
+        # `readline` raises this when a line overruns the reader's limit
+        msg = 'Line too long'
+        raise RequestError(status, msg) from None
+
+
+def _parse_validate(body: bytes) -> tuple[list[str], tuple[str, ...]]:
+    """Return the texts and resolved checks of a `/validate` body."""
+    try:
+        request = json.loads(body)
+    except ValueError as error:
+        msg = f'Body is not JSON: {error}'
+        raise RequestError(HTTPStatus.BAD_REQUEST, msg) from None
+    if not isinstance(request, dict):
+        msg = "Body must be an object with 'texts' and 'checks'"
+        raise RequestError(HTTPStatus.BAD_REQUEST, msg)
+    texts = request.get('texts')
+    if not isinstance(texts, list) or not all(
+        isinstance(text, str) for text in texts
+    ):
+        msg = "'texts' must be a list of strings"
+        raise RequestError(HTTPStatus.BAD_REQUEST, msg)
+    try:
+        checks = registry.resolve(request.get('checks'))
+    except ValueError as error:
+        raise RequestError(HTTPStatus.BAD_REQUEST, str(error)) from None
+    return texts, checks
+
+
+def _response(
+    status: HTTPStatus, kind: str, body: bytes, *, keep_alive: bool
+) -> bytes:
+    """Return a complete HTTP/1.1 response."""
+    head = (
+        f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+        f'Content-Type: {kind}\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+    )
+    return head.encode('latin-1') + body
+
+
+def _error(error: RequestError, *, keep_alive: bool) -> bytes:
+    """Return the JSON response reporting `error`."""
+    body = json.dumps({'error': str(error)}).encode()
+    return _response(
+        error.status, 'application/json', body, keep_alive=keep_alive
+    )
+
+
+async def serve(
+    host: str, port: int, server: ValidationServer | None = None
+) -> None:
+    """Serve until cancelled, printing the address once listening.
+
+    Args:
+        host (str): address to bind
+        port (int): port to bind, 0 picks a free one
+        server (ValidationServer | None): server to run, defaults to one
+            with the default limits
+    """
+    server = server or ValidationServer()
+    listener = await server.start(host, port)
+    bound = listener.sockets[0].getsockname()[1]
+    print(f'Serving on http://{host}:{bound}', flush=True)  # noqa: T201
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `lsre-server` command.
+
+    Args:
+        argv (Sequence[str] | None): arguments, defaults to `sys.argv`
+
+    Returns:
+        int: process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog='lsre-server', description='Serve lsre checks over HTTP.'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument(
+        '--max-batch',
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        help=f'texts that start a batch (default: {DEFAULT_MAX_BATCH})',
+    )
+    parser.add_argument(
+        '--max-delay-ms',
+        type=float,
+        default=DEFAULT_MAX_DELAY * 1e3,
+        help='ms a request waits for others to join its batch '
+        f'(default: {DEFAULT_MAX_DELAY * 1e3:g})',
+    )
+    args = parser.parse_args(argv)
+    batcher = MicroBatcher(args.max_batch, args.max_delay_ms / 1e3)
+    metrics.enable()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, ValidationServer(batcher)))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+"""Validate line streams in fixed-size chunks with constant memory."""
+
+import csv
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TextIO
+
+from lsre._log import logger
+from lsre.batch import BatchResult, validate_many
+from lsre.dedup import DedupTable
+from lsre.registry import registry
+from lsre.utils import chunked
+
+DEFAULT_CHUNK_SIZE = 10_000
+"""Number of lines validated per `validate_many` call."""
+
+
+def read_lines(
+    paths: Iterable[str | os.PathLike[str]] = ('-',),
+) -> Iterator[str]:
+    """Yield lines from files one at a time, without line endings.
+
+    Args:
+        paths (Iterable[str | os.PathLike[str]]): files to read in
+            order, `-` reads standard input
+
+    Yields:
+        str: next line, with the trailing newline removed
+    """
+    for path in paths:
+        if str(path) == '-':
+            logger.debug('Reading lines from stdin')
+            yield from (line.removesuffix('\n') for line in sys.stdin)
+            continue
+        logger.debug('Reading lines from {}', path)
+        with Path(path).open(encoding='utf-8', errors='replace') as f:
+            yield from (line.removesuffix('\n') for line in f)
+
+
+def validate_stream(
+    lines: Iterable[str],
+    checks: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    dedup: bool | DedupTable = False,
+) -> Iterator[tuple[list[str], BatchResult]]:
+    """Validate `lines` chunk by chunk.
+
+    Only one chunk is held in memory at a time, so arbitrarily large
+    inputs can be processed as long as the consumer does not keep the
+    chunks around. With `dedup`, one bounded `lsre.dedup.DedupTable`
+    serves every chunk, so a value is checked once per stream rather
+    than once per chunk while the table has room.
+
+    Args:
+        lines (Iterable[str]): values to check
+        checks (Iterable[str] | None): check names, defaults to all
+        chunk_size (int): number of lines per chunk
+        dedup (bool | DedupTable): check each distinct value once, in a
+            new table if True; each result's `dedup` holds its stats
+
+    Yields:
+        tuple[list[str], BatchResult]: a chunk of lines and its results
+
+    Raises:
+        ValueError: If any check name is unknown.
+
+    Examples:
+        >>> from lsre.stream import validate_stream
+        >>> for texts, result in validate_stream(['a', '-'], ['slug']):
+        ...     print(texts, result['slug'])
+        ['a', '-'] [True, False]
+    """
+    names = registry.resolve(checks)
+    table = DedupTable(names) if dedup is True else dedup
+    for chunk in chunked(lines, chunk_size):
+        yield chunk, validate_many(chunk, names, dedup=table)
+
+
+def write_jsonl(
+    chunks: Iterable[tuple[list[str], BatchResult]], out: TextIO
+) -> int:
+    """Write one JSON object per line: the text and every check result.
+
+    Args:
+        chunks (Iterable[tuple[list[str], BatchResult]]): output of
+            `validate_stream`
+        out (TextIO): destination
+
+    Returns:
+        int: number of rows written
+
+    Examples:
+        >>> import sys
+        >>> from lsre.stream import validate_stream, write_jsonl
+        >>> write_jsonl(validate_stream(['a'], ['slug', 'uuid']), sys.stdout)
+        {"text": "a", "slug": true, "uuid": false}
+        1
+    """
+    rows = 0
+    dumps = json.dumps
+    for texts, result in chunks:
+        fields = [
+            [f', "{name}": false', f', "{name}": true']
+            for name in result.masks
+        ]
+        columns = [
+            [field[flag] for flag in mask]
+            for field, mask in zip(fields, result.masks.values(), strict=True)
+        ]
+        out.writelines(
+            '{"text": ' + dumps(text) + ''.join(values) + '}\n'
+            for text, values in zip(
+                texts, zip(*columns, strict=True), strict=True
+            )
+        )
+        rows += len(texts)
+    return rows
+
+
+def write_csv(
+    chunks: Iterable[tuple[list[str], BatchResult]],
+    out: TextIO,
+    checks: Iterable[str] | None = None,
+) -> int:
+    """Write a CSV with a `text` column and a 0/1 column per check.
+
+    Args:
+        chunks (Iterable[tuple[list[str], BatchResult]]): output of
+            `validate_stream`
+        out (TextIO): destination, opened with `newline=''`
+        checks (Iterable[str] | None): checks used for the stream, in
+            order; defaults to all
+
+    Returns:
+        int: number of rows written, excluding the header
+
+    Examples:
+        >>> import sys
+        >>> from lsre.stream import validate_stream, write_csv
+        >>> chunks = validate_stream(['a,b'], ['slug'])
+        >>> write_csv(chunks, sys.stdout, ['slug'])
+        text,slug
+        "a,b",0
+        1
+    """
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(['text', *registry.resolve(checks)])
+    rows = 0
+    for texts, result in chunks:
+        writer.writerows(zip(texts, *result.masks.values(), strict=True))
+        rows += len(texts)
+    return rows
@@ -1,7 +1,16 @@
 """Utils for regex functions."""
 
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Iterable, Iterator
 from functools import wraps
+from itertools import islice
+from typing import Any
+
+type Text = str | bytes | bytearray | memoryview
+"""Values the validators accept: strings or UTF-8 encoded bytes."""
+
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+_NON_ASCII = re.compile(rb'[^\x00-\x7f]')
 
 
 def enforce_str_arg(func: Callable) -> Callable:
@@ -15,13 +24,131 @@ def enforce_str_arg(func: Callable) -> Callable:
     """
 
     @wraps(func)
-    def wrapper(text: str) -> bool:
+    def wrapper(text: str, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
         if not isinstance(text, str):
             msg = (
                 "Argument 'text' must be of type str, "
                 f'got {type(text).__name__}'
             )
             raise TypeError(msg)
-        return func(text)
+        return func(text, *args, **kwargs)
+
+    return wrapper
+
+
+def is_ascii(data: bytes | bytearray | memoryview) -> bool:
+    """Return True if every byte of `data` is below 128.
+
+    Examples:
+        >>> from lsre.utils import is_ascii
+        >>> is_ascii(b'abc'), is_ascii(memoryview('é'.encode()))
+        (True, False)
+    """
+    if isinstance(data, memoryview):
+        return _NON_ASCII.search(data) is None
+    return data.isascii()
+
+
+def enforce_text_arg(func: Callable) -> Callable:
+    """Enforce input arg to func is a string or bytes-like object.
+
+    ASCII `bytes`, `bytearray` and `memoryview` arguments are passed on
+    as they are, so they can be matched without being decoded or copied.
+    Other bytes are decoded as UTF-8 first: a bytes pattern would count
+    a multi-byte character as several characters and never treat it as
+    a letter, digit or space, so it could answer differently than for
+    the decoded string.
+
+    Args:
+        func (Callable): function to decorate
+
+    Raises:
+        TypeError: If the input arg `text` is neither a string nor
+            bytes-like.
+    """
+
+    @wraps(func)
+    def wrapper(text: Text, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if isinstance(text, str):
+            return func(text, *args, **kwargs)
+        if isinstance(text, bytes | bytearray):
+            ascii_only = text.isascii()
+        elif isinstance(text, memoryview):
+            ascii_only = _NON_ASCII.search(text) is None
+        else:
+            msg = (
+                "Argument 'text' must be of type str, bytes, bytearray or "
+                f'memoryview, got {type(text).__name__}'
+            )
+            raise TypeError(msg)
+        if not ascii_only:
+            text = str(text, 'utf-8', 'replace')
+        return func(text, *args, **kwargs)
 
     return wrapper
+
+
+def ensure_text_items(texts: Iterable[Text]) -> list[Text]:
+    """Collect `texts` into a list of strings or of ASCII bytes.
+
+    The type check looks at the distinct item types rather than each
+    item. A batch of ASCII bytes-like items is returned as is, so it can
+    be matched with bytes patterns; any other batch holding bytes is
+    decoded to strings, so one kind of pattern serves the whole batch.
+
+    Args:
+        texts (Iterable[Text]): values to check
+
+    Returns:
+        list[Text]: `texts` as a list, either all strings or all
+            bytes-like
+
+    Raises:
+        TypeError: If any item of `texts` is neither a string nor
+            bytes-like.
+    """
+    items = list(texts)
+    kinds = set(map(type, items))
+    for kind in kinds:
+        if not issubclass(kind, (str, *_BYTES_TYPES)):
+            index = next(i for i, t in enumerate(items) if type(t) is kind)
+            msg = (
+                "Argument 'texts' must contain only str or bytes-like "
+                f'objects, got {kind.__name__} at index {index}'
+            )
+            raise TypeError(msg)
+    if all(issubclass(kind, str) for kind in kinds):
+        return items
+    binary = [item for item in items if not isinstance(item, str)]
+    if len(binary) == len(items) and all(map(is_ascii, binary)):
+        return items
+    return [
+        item if isinstance(item, str) else str(item, 'utf-8', 'replace')
+        for item in items
+    ]
+
+
+def chunked[T](items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split `items` into lists of at most `size` items, lazily.
+
+    Args:
+        items (Iterable[T]): values to split
+        size (int): maximum chunk length
+
+    Yields:
+        list[T]: next chunk, only the last one may be shorter than `size`
+
+    Raises:
+        ValueError: If `size` is less than 1.
+
+    Examples:
+        >>> from lsre.utils import chunked
+        >>> list(chunked(range(5), 2))
+        [[0, 1], [2, 3], [4]]
+    """
+    if size < 1:
+        msg = f'Chunk size must be at least 1, got {size}'
+        raise ValueError(msg)
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
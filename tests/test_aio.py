@@ -0,0 +1,138 @@
+"""Test the asyncio validation API."""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+import lsre
+from lsre import aio, batch
+from tests.data import TEXTS
+
+
+async def _aiter(items: list[Any]) -> AsyncIterator[Any]:
+    """Yield `items` asynchronously."""
+    for item in items:
+        yield item
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts the chunks submitted to it."""
+
+    def __init__(self) -> None:
+        """Start a one-thread pool with no submissions."""
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        /,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Future[Any]:
+        """Count the call and submit it to the pool."""
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_validate_many_matches_batch() -> None:
+    """Sync and async inputs give the answers of `lsre.validate_many`."""
+    expected = lsre.validate_many(TEXTS * 3)
+    for texts in (TEXTS * 3, iter(TEXTS * 3), _aiter(TEXTS * 3)):
+        result = asyncio.run(aio.validate_many(texts, chunk_size=4))
+        assert result == expected
+
+
+def test_validate_many_empty() -> None:
+    """Empty input still reports every requested check."""
+    result = asyncio.run(aio.validate_many(_aiter([]), ['ipv4', 'uuid']))
+    assert result.size == 0
+    assert result.checks == ('ipv4', 'uuid')
+
+
+def test_validate_stream_chunks_in_order() -> None:
+    """Chunks come back in input order with their results."""
+
+    async def collect() -> list[tuple[list[Any], list[bool]]]:
+        chunks = aio.validate_stream(_aiter(TEXTS), 'email', chunk_size=4)
+        return [(texts, result['email']) async for texts, result in chunks]
+
+    chunks = asyncio.run(collect())
+    assert [text for texts, _ in chunks for text in texts] == TEXTS
+    assert [len(texts) for texts, _ in chunks] == [4, 4, 4, 3]
+    assert chunks[0][1] == [False, True, False, False]
+
+
+def test_loop_runs_between_chunks() -> None:
+    """Other tasks get to run while a batch is validated."""
+    ticks: list[int] = []
+
+    async def ticker() -> None:
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main() -> int:
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        before = len(ticks)
+        await aio.validate_many(TEXTS * 4, chunk_size=5)
+        task.cancel()
+        return len(ticks) - before
+
+    assert asyncio.run(main()) >= len(TEXTS * 4) // 5 - 1
+
+
+def test_offload_large_batches() -> None:
+    """Batches over `offload_above` run their chunks in the executor."""
+    with CountingExecutor() as executor:
+        small = aio.validate_many(
+            TEXTS, chunk_size=5, executor=executor, offload_above=len(TEXTS)
+        )
+        asyncio.run(small)
+        assert executor.submitted == 0
+        large = aio.validate_many(
+            TEXTS, chunk_size=5, executor=executor, offload_above=14
+        )
+        assert asyncio.run(large) == lsre.validate_many(TEXTS)
+        assert executor.submitted == 3  # noqa: PLR2004
+
+
+def test_offload_unsized_from_threshold() -> None:
+    """Async iterables are offloaded once the count passes the limit."""
+    with CountingExecutor() as executor:
+        result = aio.validate_many(
+            _aiter(TEXTS), chunk_size=4, executor=executor, offload_above=6
+        )
+        assert asyncio.run(result) == lsre.validate_many(TEXTS)
+        assert executor.submitted == 3  # noqa: PLR2004
+
+
+def test_offload_to_default_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without an executor, chunks run in the loop's default pool."""
+    threads: set[int] = set()
+    validate = batch.validate_many
+
+    def record(*args: Any, **kwargs: Any) -> batch.BatchResult:  # noqa: ANN401
+        threads.add(threading.get_ident())
+        return validate(*args, **kwargs)
+
+    monkeypatch.setattr(batch, 'validate_many', record)
+    result = asyncio.run(aio.validate_many(TEXTS, 'uuid', offload_above=0))
+    assert result['uuid'] == lsre.validate_many(TEXTS, 'uuid')['uuid']
+    assert len(threads) == 2  # noqa: PLR2004
+    assert threading.get_ident() in threads
+
+
+def test_errors() -> None:
+    """Bad checks, items and chunk sizes raise as in the sync API."""
+    with pytest.raises(ValueError, match='Unknown check'):
+        asyncio.run(aio.validate_many(TEXTS, ['nope']))
+    with pytest.raises(TypeError, match='index 1'):
+        asyncio.run(aio.validate_many(_aiter(['a', 1])))
+    with pytest.raises(ValueError, match='at least 1'):
+        asyncio.run(aio.validate_many(_aiter(TEXTS), chunk_size=0))
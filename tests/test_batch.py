@@ -0,0 +1,64 @@
+"""Test the batch validation API."""
+
+from typing import Any
+
+import pytest
+
+import lsre
+from lsre.registry import registry
+from tests.data import TEXTS
+
+
+def test_validate_many_matches_scalar_functions() -> None:
+    """Batch results equal calling each `is_*` function per item."""
+    result = lsre.validate_many(TEXTS)
+    assert result.size == len(TEXTS)
+    assert result.checks == tuple(registry)
+    for name in registry:
+        func = getattr(lsre, f'is_{name}')
+        assert result[name] == [func(text) for text in TEXTS]
+
+
+@pytest.mark.parametrize('kind', [bytes, bytearray, memoryview])
+def test_validate_many_bytes(kind: type) -> None:
+    """ASCII bytes batches give the same masks as the decoded strings."""
+    texts = [kind(text.encode()) for text in TEXTS]
+    assert lsre.validate_many(texts) == lsre.validate_many(TEXTS)
+
+
+def test_validate_many_mixed_and_non_ascii() -> None:
+    """Mixed and non-ASCII batches are decoded, not matched as bytes."""
+    texts: list[Any] = ['abc123', b'10.0.0.1', 'caf\u00e9'.encode()]
+    result = lsre.validate_many(texts, ['alphanumeric', 'ipv4'])
+    assert result == lsre.validate_many(
+        ['abc123', '10.0.0.1', 'caf\u00e9'], ['alphanumeric', 'ipv4']
+    )
+    assert result['ipv4'] == [False, True, False]
+
+
+def test_validate_many_selected_checks() -> None:
+    """Only the requested checks are run, in request order."""
+    result = lsre.validate_many(iter(TEXTS), checks=['uuid', 'email'])
+    assert result.checks == ('uuid', 'email')
+    assert result.row(1) == {'uuid': False, 'email': True}
+    assert result.masks['uuid'][10] == 1
+
+
+def test_validate_many_empty() -> None:
+    """Empty input gives empty masks."""
+    result = lsre.validate_many([], checks='ipv4')
+    assert result.size == 0
+    assert result['ipv4'] == []
+
+
+def test_validate_many_rejects_non_str() -> None:
+    """Non-string items raise TypeError naming the first offender."""
+    texts: list[Any] = ['a', 1, 2]
+    with pytest.raises(TypeError, match='int at index 1'):
+        lsre.validate_many(texts)
+
+
+def test_validate_many_unknown_check() -> None:
+    """Unknown check names raise ValueError."""
+    with pytest.raises(ValueError, match='nope'):
+        lsre.validate_many(['a'], checks=['nope'])
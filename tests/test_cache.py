@@ -0,0 +1,215 @@
+"""Test the opt-in validator result cache."""
+
+import os
+import random
+import subprocess
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+import lsre
+from lsre import cache, metrics
+from lsre.registry import registry
+
+TEXTS = [
+    'abc123',
+    'user@example.com',
+    'http://example.com',
+    '192.168.0.1',
+    '::1',
+    '2025-11-30',
+    '23:59:59',
+    '#1a2b3c',
+    '123e4567-e89b-12d3-a456-426614174000',
+    'my-slug-123',
+    'Aa1!aaaa',
+    '',
+    'not valid at all',
+]
+
+
+@pytest.fixture(autouse=True)
+def no_cache() -> Iterator[None]:
+    """Start and end every test with caching disabled."""
+    cache.disable()
+    yield
+    cache.disable()
+
+
+def test_disabled_by_default() -> None:
+    """Nothing is cached until caching is enabled."""
+    assert not cache.is_enabled()
+    lsre.is_email('user@example.com')
+    assert cache.snapshot() == {}
+
+
+def test_enable_before_first_call() -> None:
+    """Enabling in a fresh interpreter caches every validator."""
+    code = (
+        'from lsre import cache\n'
+        'cache.enable()\n'
+        'print(cache.is_enabled(), len(cache.snapshot()))\n'
+    )
+    env = {k: v for k, v in os.environ.items() if not k.startswith('COV_')}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    assert result.stdout == f'True {len(registry)}\n'
+
+
+@pytest.mark.parametrize('name', list(registry))
+def test_cached_answers_match(name: str) -> None:
+    """Cached validators give the uncached answers, twice over."""
+    func = getattr(lsre, f'is_{name}')
+    expected = [func(text) for text in TEXTS]
+    cache.enable()
+    assert cache.is_enabled()
+    assert [func(text) for text in TEXTS * 2] == expected * 2
+    stats = cache.snapshot()[name]
+    assert (stats['hits'], stats['misses']) == (len(TEXTS), len(TEXTS))
+    assert stats['hit_ratio'] == pytest.approx(0.5)
+    assert stats['size'] == len(TEXTS)
+
+
+def test_stats_per_validator() -> None:
+    """Each validator counts only its own lookups."""
+    cache.enable(maxsize=8)
+    lsre.is_ipv4('10.0.0.1')
+    lsre.is_ipv4('10.0.0.1')
+    lsre.is_uuid('nope')
+    stats = cache.snapshot()
+    assert stats['ipv4'] == {
+        'hits': 1,
+        'misses': 1,
+        'hit_ratio': 0.5,
+        'size': 1,
+        'maxsize': 8,
+    }
+    assert (stats['uuid']['hits'], stats['uuid']['misses']) == (0, 1)
+    assert stats['email']['hit_ratio'] == 0.0
+    assert set(stats) == set(registry)
+
+
+def test_least_recently_used_is_evicted() -> None:
+    """The table never grows past `maxsize`, dropping the oldest use."""
+    cache.enable(maxsize=2)
+    for text in ['a', 'b', 'a', 'c', 'a', 'b']:
+        lsre.is_slug(text)
+    stats = cache.snapshot()['slug']
+    assert (stats['hits'], stats['misses'], stats['size']) == (2, 4, 2)
+
+
+def test_bytes_are_cached_separately() -> None:
+    """Bytes keys are cached; mutable buffers are always checked again."""
+    cache.enable()
+    values: list[Any] = [
+        b'10.0.0.1',
+        b'10.0.0.1',
+        bytearray(b'10.0.0.1'),
+        memoryview(b'10.0.0.1'),
+        '10.0.0.1',
+    ]
+    assert all(lsre.is_ipv4(value) for value in values)
+    stats = cache.snapshot()['ipv4']
+    assert (stats['hits'], stats['misses']) == (1, 2)
+
+
+def test_engine_calls_bypass_cache() -> None:
+    """Passing `engine` skips the table, so bad names still raise."""
+    cache.enable()
+    assert lsre.is_ipv4('10.0.0.1', engine='fast')
+    assert lsre.is_ipv4('10.0.0.1', 'fast')
+    with pytest.raises(ValueError, match='Unknown engine'):
+        lsre.is_ipv4('10.0.0.1', engine='nope')
+    assert cache.snapshot()['ipv4']['size'] == 0
+
+
+@pytest.mark.parametrize('bad_value', [123, None, ['a']])
+def test_bad_values_still_raise(bad_value: Any) -> None:  # noqa: ANN401
+    """Non-text arguments are type-checked as without the cache."""
+    cache.enable()
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            lsre.is_email(bad_value)
+
+
+def test_clear_and_enable_again() -> None:
+    """`clear` zeroes the tables; `enable` again replaces them."""
+    cache.enable(maxsize=4)
+    lsre.is_slug('a')
+    lsre.is_slug('a')
+    cache.clear()
+    assert cache.snapshot()['slug']['hits'] == 0
+    lsre.is_slug('a')
+    cache.enable(maxsize=16)
+    assert cache.snapshot()['slug'] == {
+        'hits': 0,
+        'misses': 0,
+        'hit_ratio': 0.0,
+        'size': 0,
+        'maxsize': 16,
+    }
+    cache.disable()
+    assert not cache.is_enabled()
+    assert cache.snapshot() == {}
+
+
+def test_metrics_count_cached_calls() -> None:
+    """Cache hits are still calls for the metrics."""
+    cache.enable()
+    metrics.reset()
+    metrics.enable()
+    try:
+        lsre.is_uuid('nope')
+        lsre.is_uuid('nope')
+        assert metrics.snapshot()['uuid']['calls'] == 2  # noqa: PLR2004
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+
+def test_cached_call_site() -> None:
+    """`cached` gives one call site its own table."""
+    check = cache.cached(lsre.is_email, maxsize=2)
+    assert check('user@example.com')
+    assert check('user@example.com')
+    assert not check(b'nope')
+    assert check.func is lsre.is_email
+    assert check.info()['hits'] == 1
+    assert cache.snapshot() == {}
+    check.clear()
+    assert check.info()['size'] == 0
+
+
+@pytest.mark.parametrize('maxsize', [0, -1])
+def test_rejects_bad_maxsize(maxsize: int) -> None:
+    """Caches must hold at least one result."""
+    with pytest.raises(ValueError, match="'maxsize'"):
+        cache.enable(maxsize)
+    with pytest.raises(ValueError, match="'maxsize'"):
+        cache.cached(lsre.is_email, maxsize)
+    assert not cache.is_enabled()
+
+
+def test_shared_between_threads() -> None:
+    """Concurrent callers get correct answers and exact counts."""
+    expected = {text: lsre.is_ipv6(text) for text in TEXTS}
+    cache.enable(maxsize=4)
+    rng = random.Random(0)  # noqa: S311
+    work = [rng.choices(TEXTS, k=2_000) for _ in range(8)]
+
+    def run(texts: list[str]) -> bool:
+        return all(lsre.is_ipv6(text) == expected[text] for text in texts)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(run, work))
+    stats = cache.snapshot()['ipv6']
+    assert stats['hits'] + stats['misses'] == sum(map(len, work))
+    assert stats['size'] == 4  # noqa: PLR2004
@@ -0,0 +1,132 @@
+"""Test the CIDR prefix index."""
+
+import ipaddress
+import random
+from array import array
+
+import pytest
+
+from lsre.cidr import CidrIndex
+from lsre.parse import parse_ipv4_many, parse_ipv6_many
+
+
+def _random_prefixes(
+    rng: random.Random, version: int, count: int
+) -> list[str]:
+    """Return `count` prefixes, many of them nested in a few roots."""
+    bits = 32 if version == 4 else 128  # noqa: PLR2004
+    roots = [rng.getrandbits(bits) for _ in range(4)]
+    prefixes = []
+    for _ in range(count):
+        length = rng.randint(0, bits)
+        value = rng.choice(roots) ^ rng.getrandbits(max(bits - 4, 0)) * (
+            rng.random() < 0.3  # noqa: PLR2004
+        )
+        network = ipaddress.ip_network((value, length), strict=False)
+        prefixes.append(str(network))
+    return prefixes
+
+
+def _longest(
+    networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network],
+    address: ipaddress.IPv4Address | ipaddress.IPv6Address,
+) -> int:
+    """Return the position of the longest network holding `address`."""
+    best = -1
+    for position, network in enumerate(networks):
+        if address in network and (
+            best < 0 or network.prefixlen > networks[best].prefixlen
+        ):
+            best = position
+    return best
+
+
+def test_longest_prefix_matches_linear_search() -> None:
+    """Lookups agree with testing every `ipaddress` network in turn."""
+    rng = random.Random(0)  # noqa: S311
+    prefixes = _random_prefixes(rng, 4, 300) + _random_prefixes(rng, 6, 300)
+    index = CidrIndex(prefixes)
+    networks = [ipaddress.ip_network(prefix) for prefix in prefixes]
+    addresses = []
+    for network in networks:
+        addresses += [
+            network.network_address,
+            network.broadcast_address,
+            network.network_address + rng.randrange(network.num_addresses),
+        ]
+        if int(network.network_address) > 0:
+            addresses.append(network.network_address - 1)
+    for address in addresses:
+        expected = _longest(networks, address)
+        assert index.position(str(address)) == expected, address
+        assert index.lookup(str(address)) == (
+            prefixes[expected] if expected >= 0 else None
+        )
+    ipv4 = [str(a) for a in addresses if a.version == 4]  # noqa: PLR2004
+    ipv6 = [a.exploded for a in addresses if a.version == 6]  # noqa: PLR2004
+    assert index.lookup_many(parse_ipv4_many(ipv4)).tolist() == [
+        index.position(a) for a in ipv4
+    ]
+    assert index.lookup_many(parse_ipv6_many(ipv6)).tolist() == [
+        index.position(a) for a in ipv6
+    ]
+
+
+def test_prefix_forms() -> None:
+    """Host bits are cleared; bare addresses are full-length prefixes."""
+    index = CidrIndex(
+        ['10.1.2.3/8', '192.168.0.1', '2001:db8::/32', '::1', '0.0.0.0/0']
+    )
+    assert index.lookup('10.200.0.1') == '10.1.2.3/8'
+    assert index.lookup('192.168.0.1') == '192.168.0.1'
+    assert index.lookup('192.168.0.2') == '0.0.0.0/0'
+    assert index.lookup('2001:db8:ffff::1') == '2001:db8::/32'
+    assert index.lookup('::1') == '::1'
+    assert index.lookup('::2') is None
+    assert len(index) == 5  # noqa: PLR2004
+
+
+def test_repeated_and_full_space_prefixes() -> None:
+    """The first of equal prefixes wins; `/0` covers every address."""
+    index = CidrIndex(['10.0.0.0/8', '::/0', '10.0.0.0/8', '0.0.0.0/0'])
+    assert index.position('10.0.0.1') == 0
+    assert index.position('11.0.0.1') == 3  # noqa: PLR2004
+    assert index.position('255.255.255.255') == 3  # noqa: PLR2004
+    assert index.position('ffff::1') == 1
+    assert CidrIndex([]).lookup('10.0.0.1') is None
+
+
+def test_batch_lookup_inputs() -> None:
+    """Invalid texts give -1; plain `array('I')` input works too."""
+    index = CidrIndex(['10.0.0.0/8', '2001:db8::/32'])
+    packed = parse_ipv4_many(['10.0.0.1', 'nope', '9.0.0.0', '11.0.0.1'])
+    assert index.lookup_many(packed) == array('i', [0, -1, -1, -1])
+    assert index.lookup_many(array('I', [0x0A000001, 0])).tolist() == [0, -1]
+    packed = parse_ipv6_many(['2001:db8::1', 'nope', '::1'])
+    assert index.lookup_many(packed).tolist() == [1, -1, -1]
+
+
+def test_membership() -> None:
+    """`in` works as an allow or block list test, false for non-addresses."""
+    blocklist = CidrIndex(['203.0.113.0/24'])
+    assert '203.0.113.9' in blocklist
+    assert '203.0.114.9' not in blocklist
+    assert 0xCB007109 not in blocklist  # noqa: PLR2004
+    assert 'foo' not in blocklist
+    assert '1.2.3' not in blocklist
+
+
+@pytest.mark.parametrize(
+    'prefix',
+    ['10.0.0.0/33', '10.0.0.0/', '10.0.0.0/-1', '10.0.0/8', '::/129', 'x'],
+)
+def test_bad_prefix(prefix: str) -> None:
+    """Malformed prefixes raise ValueError naming the prefix."""
+    with pytest.raises(ValueError, match='Expected a CIDR prefix'):
+        CidrIndex(['10.0.0.0/8', prefix])
+
+
+def test_bad_address() -> None:
+    """Lookups of texts that are not addresses raise ValueError."""
+    with pytest.raises(ValueError, match='Expected an IPv4 or IPv6'):
+        CidrIndex(['10.0.0.0/8']).lookup('10.0.0')
@@ -0,0 +1,58 @@
+"""Test single-pass classification."""
+
+from typing import Any
+
+import pytest
+
+import lsre
+from lsre.registry import registry
+from tests.data import EDGE_TEXTS, TEXTS
+
+
+@pytest.mark.parametrize('text', TEXTS + EDGE_TEXTS)
+def test_classify_matches_scalar_functions(text: str) -> None:
+    """`classify` reports exactly the checks whose `is_*` returns True."""
+    expected = tuple(
+        name for name in registry if getattr(lsre, f'is_{name}')(text)
+    )
+    assert lsre.classify(text) == expected
+
+
+def test_classify_bytes() -> None:
+    """Bytes input is classified like the decoded string."""
+    texts = TEXTS + EDGE_TEXTS
+    encoded = [text.encode() for text in texts]
+    expected = lsre.classify_many(texts)
+    assert [lsre.classify(text) for text in encoded] == expected
+    assert lsre.classify_many(map(memoryview, encoded)) == expected
+
+
+def test_classify_selected_checks() -> None:
+    """Only the requested checks are considered."""
+    assert lsre.classify('my-slug', checks=['uuid', 'slug']) == ('slug',)
+    assert lsre.classify('my-slug', checks='uuid') == ()
+
+
+def test_classify_many() -> None:
+    """The batch variant equals calling `classify` per item."""
+    texts = TEXTS + EDGE_TEXTS
+    assert lsre.classify_many(iter(texts)) == [
+        lsre.classify(text) for text in texts
+    ]
+
+
+def test_classify_rejects_non_str() -> None:
+    """Non-string input raises TypeError."""
+    text: Any = 123
+    with pytest.raises(TypeError):
+        lsre.classify(text)
+    texts: list[Any] = ['abc', None]
+    with pytest.raises(TypeError):
+        lsre.classify_many(texts)
+
+
+def test_combined_pattern_is_cached() -> None:
+    """The combined pattern is compiled once per set of checks."""
+    assert registry.combined(['slug', 'uuid']) is registry.combined(
+        ('slug', 'uuid')
+    )
@@ -0,0 +1,78 @@
+"""Test the command line interface."""
+
+import io
+import json
+import runpy
+from pathlib import Path
+
+import pytest
+
+from lsre.cli import main
+
+
+def test_cli_jsonl_to_stdout(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """By default stdin is validated against every check as JSONL."""
+    monkeypatch.setattr('sys.stdin', io.StringIO('10.0.0.1\nabc\n'))
+    assert main([]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)['ipv4'] for line in lines] == [True, False]
+
+
+def test_cli_csv_to_file(tmp_path: Path) -> None:
+    """Files can be validated against selected checks into a CSV."""
+    source = tmp_path / 'in.txt'
+    source.write_text('my-slug\n#fff\n', encoding='utf-8')
+    target = tmp_path / 'out.csv'
+    argv = [str(source), '-c', 'slug', 'hex_color', '-f', 'csv']
+    assert main([*argv, '-o', str(target), '--chunk-size', '1']) == 0
+    assert target.read_text(encoding='utf-8').splitlines() == [
+        'text,slug,hex_color',
+        'my-slug,1,0',
+        '#fff,0,1',
+    ]
+
+
+def test_cli_dedup(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Deduplicated runs write the same rows."""
+    monkeypatch.setattr('sys.stdin', io.StringIO('a\n-\na\na\n'))
+    assert main(['-c', 'slug', '--dedup', '--chunk-size', '2']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)['slug'] for line in lines] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_cli_rejects_unknown_check() -> None:
+    """Unknown check names are an argument error."""
+    with pytest.raises(SystemExit):
+        main(['-c', 'nope'])
+
+
+@pytest.mark.parametrize('chunk_size', ['0', '-1', 'x'])
+def test_cli_rejects_bad_chunk_size(
+    chunk_size: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Chunk sizes below 1 are an argument error, not a traceback."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--chunk-size', chunk_size])
+    assert exc_info.value.code == 2  # noqa: PLR2004
+    assert 'expected a positive integer' in capsys.readouterr().err
+
+
+def test_module_entry_point(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """`python -m lsre` runs the CLI."""
+    monkeypatch.setattr('sys.argv', ['lsre', '-c', 'uuid'])
+    monkeypatch.setattr('sys.stdin', io.StringIO('x\n'))
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module('lsre', run_name='__main__')
+    assert exc_info.value.code == 0
+    assert json.loads(capsys.readouterr().out) == {'text': 'x', 'uuid': False}
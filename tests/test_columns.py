@@ -0,0 +1,201 @@
+"""Test validation of Arrow arrays and pandas Series."""
+
+import re
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import lsre
+from lsre.columns import re2_source, validate_column, validate_columns
+from lsre.registry import registry
+
+TEXTS = [
+    'abc123',
+    'user@example.com',
+    'http://example.com',
+    '192.168.0.1',
+    '192.168.0.1\n',
+    '192.168.0.1\n\n',
+    '::1',
+    'fe80::',
+    '+1-800-555-1212',
+    '4111 1111 1111 1111',
+    '2025-11-30',
+    '\u0662\u0660\u0662\u0665-11-30',
+    '2025-11-30\n',
+    '23:59:59',
+    '#1a2b3c',
+    '#1A2B3C',
+    '123E4567-E89B-12D3-A456-426614174000',
+    '123e4567-e89b-12d3-a456-426614174000',
+    'my-slug-123',
+    'Aa1!aaaa',
+    '',
+    '\n',
+    'not valid at all',
+]
+
+KERNEL_CHECKS = [name for name in registry if re2_source(name) is not None]
+
+BMP = [chr(code) for code in range(0x10000) if not 0xD800 <= code < 0xE000]  # noqa: PLR2004
+"""Every character Arrow can hold in the Basic Multilingual Plane."""
+
+
+def expected(name: str, texts: list[Any]) -> list[bool | None]:
+    """Return the scalar answers, None for missing values."""
+    func = getattr(lsre, f'is_{name}')
+    return [None if text is None else func(text) for text in texts]
+
+
+def test_kernel_covers_fixed_shape_checks() -> None:
+    r"""Checks without lookarounds or `\w` run in Arrow's kernel."""
+    assert {'ipv4', 'ipv6', 'uuid', 'hex_color', 'iso_date'} <= set(
+        KERNEL_CHECKS
+    )
+    assert re2_source('email') is None
+
+
+@pytest.mark.parametrize('name', list(registry))
+def test_matches_scalar_functions(name: str) -> None:
+    """Every check gives the answers of its `is_*` function."""
+    texts: list[Any] = [*TEXTS, None]
+    flags = validate_column(pa.array(texts), name)
+    assert flags.type == pa.bool_()
+    assert flags.to_pylist() == expected(name, texts)
+
+
+@pytest.mark.parametrize('name', KERNEL_CHECKS)
+def test_kernel_every_character(name: str) -> None:
+    """Translated patterns agree with `re` for every BMP character."""
+    pattern = registry[name]
+    samples = [text for text in TEXTS if pattern.match(text)] or ['a']
+    for sample in samples:
+        for position in (0, len(sample) // 2, len(sample)):
+            texts = [
+                sample[:position] + char + sample[position + 1 :]
+                for char in BMP
+            ]
+            flags = validate_column(pa.array(texts), name).to_pylist()
+            assert flags == [bool(pattern.match(text)) for text in texts]
+
+
+@pytest.mark.parametrize(
+    'kind', [pa.string(), pa.large_string(), pa.string_view()]
+)
+def test_string_types(kind: pa.DataType) -> None:
+    """Every Arrow string type is accepted."""
+    texts: list[Any] = ['10.0.0.1', None, 'nope']
+    values = pa.array(texts, type=kind)
+    assert validate_column(values, 'ipv4').to_pylist() == [True, None, False]
+    assert validate_column(values, 'email').to_pylist() == [False, None, False]
+
+
+@pytest.mark.parametrize(
+    'kind', [pa.binary(), pa.large_binary(), pa.binary_view()]
+)
+def test_binary_types(kind: pa.DataType) -> None:
+    """Binary arrays match like bytes given to the `is_*` functions."""
+    texts: list[Any] = [b'10.0.0.1', None, 'caf\u00e9'.encode(), b'a@b.co']
+    values = pa.array(texts, type=kind)
+    for name in ['ipv4', 'email', 'alphanumeric']:
+        assert validate_column(values, name).to_pylist() == expected(
+            name, texts
+        )
+
+
+def test_chunked_array() -> None:
+    """Chunked input gives chunked output with the same answers."""
+    values = pa.chunked_array([['10.0.0.1', None], [], ['a@b.co']])
+    for name in ['ipv4', 'email']:
+        flags = validate_column(values, name)
+        assert isinstance(flags, pa.ChunkedArray)
+        assert flags.to_pylist() == expected(name, values.to_pylist())
+
+
+def test_null_array() -> None:
+    """An all-null array gives all-null booleans."""
+    flags = validate_column(pa.nulls(3), 'email')
+    assert flags.type == pa.bool_()
+    assert flags.to_pylist() == [None, None, None]
+
+
+def test_series() -> None:
+    """Series results keep the index and name and use `boolean` dtype."""
+    values = pd.Series(
+        ['a@b.co', None, float('nan'), 'nope'],
+        index=['w', 'x', 'y', 'z'],
+        name='contact',
+    )
+    flags = validate_column(values, 'email')
+    assert isinstance(flags, pd.Series)
+    assert flags.dtype == pd.BooleanDtype()
+    assert flags.name == 'contact'
+    assert flags.index.tolist() == ['w', 'x', 'y', 'z']
+    assert flags.tolist() == [True, pd.NA, pd.NA, False]
+
+
+@pytest.mark.parametrize('dtype', ['string[python]', 'string[pyarrow]'])
+def test_series_string_dtypes(dtype: str) -> None:
+    """Pandas string dtypes are accepted."""
+    values = pd.Series(['#fff', None, '#ggg'], dtype=dtype)
+    flags = validate_column(values, 'hex_color')
+    assert flags.tolist() == [True, pd.NA, False]
+
+
+def test_validate_columns_table() -> None:
+    """Arrow input gives a table with one column per check."""
+    values = pa.array(['10.0.0.1', 'my-slug'])
+    table = validate_columns(values, ['ipv4', 'slug'])
+    assert isinstance(table, pa.Table)
+    assert table.to_pydict() == {
+        'ipv4': [True, False],
+        'slug': [False, True],
+    }
+    assert validate_columns(values).column_names == list(registry)
+
+
+def test_validate_columns_frame() -> None:
+    """Series input gives a DataFrame with the Series' index."""
+    values = pd.Series(['10.0.0.1', None], index=[5, 7])
+    frame = validate_columns(values, ['ipv4', 'email'])
+    assert isinstance(frame, pd.DataFrame)
+    assert frame.index.tolist() == [5, 7]
+    assert (frame.dtypes == pd.BooleanDtype()).all()
+    assert frame.to_dict('list') == {
+        'ipv4': [True, None],
+        'email': [False, None],
+    }
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        pa.array([1, 2]),
+        pd.Series([1, 2]),
+        pd.Series(['a', 1]),
+        pd.DataFrame({'a': ['x']}),
+        ['a@b.co'],
+        'a@b.co',
+    ],
+)
+def test_rejects_other_values(values: Any) -> None:  # noqa: ANN401
+    """Only arrays and Series of strings or bytes are accepted."""
+    with pytest.raises(TypeError, match="Argument 'values'"):
+        validate_column(values, 'email')
+
+
+def test_unknown_check() -> None:
+    """Unknown check names raise ValueError."""
+    with pytest.raises(ValueError, match='Unknown check'):
+        validate_column(pa.array(['a']), 'nope')
+
+
+def test_re2_source_translation() -> None:
+    """Translated sources allow a trailing newline and Unicode digits."""
+    source = re2_source('iso_date')
+    assert source is not None
+    assert source.endswith(r'\n?$')
+    assert r'\d' not in source
+    assert re.search(r'\\[wsb]|\(\?[=!<]', registry.source('email')[0])
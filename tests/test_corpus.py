@@ -0,0 +1,65 @@
+"""Test the benchmark corpus generator and baseline comparison."""
+
+import pytest
+
+import lsre
+from benchmarks import corpus
+from benchmarks.bench_suite import compare
+from lsre.registry import registry
+
+
+def test_every_check_has_a_generator() -> None:
+    """All built-in checks can be benchmarked."""
+    assert set(corpus.VALID) == set(registry)
+
+
+@pytest.mark.parametrize('name', list(registry))
+def test_kinds_get_the_expected_answer(name: str) -> None:
+    """Valid values pass the check, near misses and garbage do not."""
+    func = getattr(lsre, f'is_{name}')
+    for kind, value in corpus.generate(name, 90):
+        assert func(value) is (kind == 'valid'), (kind, value)
+
+
+def test_seeded_and_balanced() -> None:
+    """The same seed gives the same corpus, with kinds taking turns."""
+    first = corpus.generate('email', 10, seed=3)
+    assert first == corpus.generate('email', 10, seed=3)
+    assert first != corpus.generate('email', 10, seed=4)
+    assert [kind for kind, _ in first] == [*corpus.KINDS * 4][:10]
+
+
+def test_large_corpora_repeat_the_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Past `POOL_SIZE` values per kind, the pool is sampled again."""
+    monkeypatch.setattr(corpus, 'POOL_SIZE', 5)
+    values = corpus.generate('slug', 60)
+    assert len(values) == 60  # noqa: PLR2004
+    assert len(set(values)) <= 15  # noqa: PLR2004
+
+
+def test_unknown_kind() -> None:
+    """Kinds other than `KINDS` raise ValueError."""
+    with pytest.raises(ValueError, match='Unknown kind'):
+        corpus.pool('slug', 'nope', 1)
+
+
+def test_compare_directions() -> None:
+    """Slower latency and lower throughput are regressions."""
+    baseline = {
+        'latency_ns': {'ipv4': {'valid': 100.0, 'garbage': 100.0}},
+        'throughput': {'ipv4': {'1000': 1000.0, '10000': 1000.0}},
+    }
+    current = {
+        'latency_ns': {
+            'ipv4': {'valid': 90.0, 'garbage': 150.0},
+            'email': {'valid': 1.0},
+        },
+        'throughput': {'ipv4': {'1000': 500.0, '10000': 2000.0, '5': 1.0}},
+    }
+    assert compare(current, baseline, threshold=0.2) == [
+        ('latency_ns/ipv4/garbage', 100.0, 150.0, 0.5),
+        ('throughput/ipv4/1000', 1000.0, 500.0, 1.0),
+    ]
+    assert compare(current, baseline, threshold=1.0) == []
@@ -0,0 +1,103 @@
+"""Test deduplicated validation."""
+
+import random
+
+import pytest
+
+import lsre
+from lsre import metrics
+from lsre.dedup import DedupStats, DedupTable
+from lsre.registry import registry
+from lsre.stream import validate_stream
+from tests.data import TEXTS
+
+
+def _repeats(size: int, distinct: int) -> list[str]:
+    """Return `size` texts drawn from the first `distinct` of TEXTS."""
+    rng = random.Random(0)  # noqa: S311
+    return rng.choices(TEXTS[:distinct], k=size)
+
+
+@pytest.mark.parametrize('engine', ['re', 'fast', 'dfa'])
+def test_answers_do_not_change(engine: str) -> None:
+    """Deduplicated masks equal plain ones, for str and bytes."""
+    texts = _repeats(500, 8)
+    for batch in (texts, [text.encode() for text in texts]):
+        expected = lsre.validate_many(batch, engine=engine)
+        result = lsre.validate_many(batch, engine=engine, dedup=True)
+        assert result == expected
+        assert expected.dedup is None
+    mixed = [b'a', bytearray(b'a'), memoryview(b'-'), b'a']
+    assert lsre.validate_many(mixed, dedup=True) == lsre.validate_many(mixed)
+
+
+def test_stats() -> None:
+    """Stats count items, checked values and the share of repeats."""
+    result = lsre.validate_many(_repeats(1_000, 5), 'ipv4', dedup=True)
+    stats = result.dedup
+    assert stats is not None
+    assert (stats.items, stats.validated, stats.spilled) == (1_000, 5, 0)
+    assert stats.ratio == pytest.approx(0.995)
+    assert stats.seconds > 0
+    assert DedupStats().ratio == 0.0
+    empty = lsre.validate_many([], dedup=True)
+    assert empty.masks == {name: bytearray() for name in registry}
+    assert empty.dedup is not None
+    assert (empty.dedup.items, empty.dedup.validated) == (0, 0)
+
+
+def test_full_table_spills() -> None:
+    """Once full, the table still answers what it holds; others spill."""
+    table = DedupTable(registry.resolve(['slug']), max_size=2)
+    first = lsre.validate_many(['a', 'a', 'b'], 'slug', dedup=table)
+    assert first.dedup is not None
+    assert (first.dedup.validated, len(table)) == (2, 2)
+    second = lsre.validate_many(['a', '-', 'c', '-', 'b'], 'slug', dedup=table)
+    assert second['slug'] == [True, False, True, False, True]
+    assert second.dedup is not None
+    assert (second.dedup.validated, second.dedup.spilled) == (3, 3)
+    table.clear()
+    assert len(table) == 0
+    empty = DedupTable(registry.resolve(['slug']), max_size=0)
+    third = lsre.validate_many(['a', '-', 'a'], 'slug', dedup=empty)
+    assert third['slug'] == [True, False, True]
+    assert third.dedup is not None
+    assert third.dedup.spilled == 3  # noqa: PLR2004
+
+
+def test_bad_tables() -> None:
+    """Tables reject negative sizes and batches of other checks."""
+    with pytest.raises(ValueError, match='at least 0'):
+        DedupTable(('slug',), max_size=-1)
+    table = DedupTable(registry.resolve(['slug']))
+    with pytest.raises(ValueError, match='holds checks'):
+        lsre.validate_many(['a'], 'uuid', dedup=table)
+
+
+def test_stream_shares_one_table() -> None:
+    """Values seen in an earlier chunk are not checked again."""
+    lines = ['a', 'b', 'a', 'b', '-', 'a']
+    chunks = list(validate_stream(lines, ['slug'], chunk_size=2, dedup=True))
+    stats = [result.dedup for _, result in chunks]
+    assert [s.validated for s in stats if s is not None] == [2, 0, 1]
+    merged = lsre.BatchResult.merge(result for _, result in chunks)
+    assert merged == lsre.validate_many(lines, 'slug')
+    assert merged.dedup is not None
+    assert (merged.dedup.items, merged.dedup.validated) == (6, 3)
+    plain = lsre.BatchResult.merge(
+        result for _, result in validate_stream(lines, ['slug'])
+    )
+    assert plain.dedup is None
+
+
+def test_metrics_count_checked_values() -> None:
+    """Metrics count the values the checks ran on, once each."""
+    metrics.reset()
+    metrics.enable()
+    try:
+        lsre.validate_many(['a'] * 10, 'slug', dedup=True)
+        snapshot = metrics.snapshot()
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert snapshot['slug']['calls'] == 1
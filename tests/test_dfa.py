@@ -0,0 +1,122 @@
+"""Test the table-driven DFA engine."""
+
+import random
+import re
+
+import pytest
+
+from benchmarks.corpus import generate
+from lsre import dfa
+from lsre.registry import registry
+from tests.data import EDGE_TEXTS, TEXTS
+
+
+def _corpus() -> list[str]:
+    """Return corpus values, random strings and their newline variants."""
+    rng = random.Random(0)  # noqa: S311
+    alphabet = 'aFfgz09:-#. /\n٣é'
+    texts = [value for name in registry for _, value in generate(name, 300)]
+    texts += [
+        ''.join(rng.choices(alphabet, k=rng.randint(0, 40)))
+        for _ in range(5_000)
+    ]
+    texts += [*TEXTS, *EDGE_TEXTS, '٢٠٢٤-01-05', '#ABCDEF', '0' * 10_000]
+    return texts + [f'{text}\n' for text in texts]
+
+
+CORPUS = _corpus()
+
+
+@pytest.mark.parametrize('name', dfa.DFA_CHECKS)
+def test_automata_agree_with_regexes(name: str) -> None:
+    """Each automaton accepts exactly what its regex matches.
+
+    Non-ASCII bytes are decoded first, as every check does.
+    """
+    accepts = dfa.compile_checks([name]).accepts
+    assert dfa.CHECKS[name] == accepts
+    match = registry[name].match
+    for text in CORPUS:
+        assert accepts(text) == bool(match(text)), text
+        assert accepts(text.encode()) == bool(match(text)), text
+
+
+def test_product_answers_every_check() -> None:
+    """One pass of the product automaton gives every check's answer."""
+    automaton = dfa.compile_checks(dfa.DFA_CHECKS)
+    assert automaton.names == dfa.DFA_CHECKS
+    assert dfa.compile_checks(iter(dfa.DFA_CHECKS)) is automaton
+    for text in CORPUS:
+        expected = tuple(
+            name for name in dfa.DFA_CHECKS if registry[name].match(text)
+        )
+        assert automaton.matches(text) == expected, text
+    assert automaton.matches(bytearray(b'10.0.0.1')) == ('ipv4',)
+    assert automaton.matches(memoryview(b'\xff')) == ()
+
+
+def test_tables() -> None:
+    """Tables are compact arrays with the dead state at row 0."""
+    automaton = dfa.compile_checks(['uuid'])
+    assert automaton.table.typecode == 'H'
+    assert not any(automaton.table[: automaton.start][:1])
+    assert len(automaton.classes) == 128  # noqa: PLR2004
+    assert automaton.max_length == 36  # noqa: PLR2004
+    assert dfa.compile_checks(['slug']).max_length is None
+    assert list(dfa.CHECKS) == list(dfa.DFA_CHECKS)
+    assert len(dfa.CHECKS) == len(dfa.DFA_CHECKS)
+    with pytest.raises(KeyError):
+        dfa.CHECKS['email']
+
+
+@pytest.mark.parametrize(
+    ('source', 'text', 'expected'),
+    [
+        (r'^a.c$', 'a-c', True),
+        (r'^a.c$', 'a\nc', False),
+        (r'^[^a-c]{2,}$', 'xyz', True),
+        (r'^[^a-c]{2,}$', 'xaz', False),
+        (r'^[]a]+$', 'a]', True),
+        (r'^[\]\-]b?$', '-', True),
+        (r'^[!-\-]$', ',', True),
+        (r'^[a-]$', '-', True),
+        (r'^(ab|c)*d{0,2}$', 'ababcdd', True),
+        (r'^(ab|c)*d{0,2}$', 'ababcddd', False),
+        (r'^x{3}$', 'xxx', True),
+    ],
+)
+def test_compile_pattern(source: str, text: str, *, expected: bool) -> None:
+    """The supported syntax means what it means to `re`."""
+    assert dfa.compile_pattern(source).accepts(text) is expected
+    assert bool(re.match(source, text)) is expected
+
+
+@pytest.mark.parametrize(
+    ('source', 'flags', 'message'),
+    [
+        ('abc', 0, 'anchored'),
+        (r'^a$', re.MULTILINE, 'IGNORECASE'),
+        (r'^(?=a)a$', 0, 'Lookarounds'),
+        (r'^a+?$', 0, 'Lazy'),
+        (r'^\w$', 0, 'Escape'),
+        (r'^a^b$', 0, 'Anchors'),
+        (r'^*$', 0, 'Nothing to repeat'),
+        (r'^(a$', 0, 'Unexpected end'),
+        (r'^a)$', 0, 'Unbalanced'),
+        (r'^(a(b$', 0, 'Unexpected end'),
+        (r'^a{x}$', 0, 'Bad repetition'),
+        (r'^é$', 0, 'Non-ASCII'),
+    ],
+)
+def test_unsupported_syntax(source: str, flags: int, message: str) -> None:
+    """Anything outside the supported subset raises ValueError."""
+    with pytest.raises(ValueError, match=message):
+        dfa.compile_pattern(source, flags)
+
+
+def test_unsupported_checks() -> None:
+    """Checks with lookarounds have no automaton."""
+    with pytest.raises(ValueError, match='have no DFA'):
+        dfa.compile_checks(['uuid', 'email'])
+    with pytest.raises(ValueError, match='Unknown checks'):
+        dfa.compile_checks(['nope'])
@@ -0,0 +1,75 @@
+"""Test engine selection."""
+
+from collections.abc import Iterator
+
+import pytest
+
+import lsre
+from lsre import engines
+from lsre.fastpath import CHECKS
+from lsre.registry import registry
+from tests.data import TEXTS
+
+
+@pytest.fixture(autouse=True)
+def _restore_default() -> Iterator[None]:
+    """Put the default engine back after each test."""
+    yield
+    engines.set_default('re')
+
+
+@pytest.mark.parametrize('name', list(registry))
+def test_engines_agree(name: str) -> None:
+    """Every engine gives the regex answers, for str and bytes."""
+    func = getattr(lsre, f'is_{name}')
+    texts = [*TEXTS, *(text.encode() for text in TEXTS)]
+    expected = [func(text, engine='re') for text in texts]
+    for engine in engines.ENGINES:
+        assert [func(text, engine=engine) for text in texts] == expected
+
+
+def test_validate_many_engine() -> None:
+    """Batch results do not depend on the engine, str or bytes."""
+    expected = lsre.validate_many(TEXTS)
+    encoded = [text.encode() for text in TEXTS]
+    for engine in engines.ENGINES:
+        assert lsre.validate_many(TEXTS, engine=engine) == expected
+        assert lsre.validate_many(encoded, engine=engine) == expected
+
+
+def test_set_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The default engine is used when a call names none."""
+    calls = []
+    monkeypatch.setitem(
+        CHECKS, 'uuid', lambda text: calls.append(text) or True
+    )
+    engines.set_default('fast')
+    assert engines.get_default() == 'fast'
+    assert lsre.is_uuid('x')
+    assert lsre.validate_many(['y'], 'uuid')['uuid'] == [True]
+    assert not lsre.is_uuid('x', engine='re')
+    assert calls == ['x', 'y']
+
+
+def test_unknown_engine() -> None:
+    """Unknown engines raise ValueError and leave the default alone."""
+    with pytest.raises(ValueError, match='nope'):
+        engines.set_default('nope')
+    with pytest.raises(ValueError, match='nope'):
+        lsre.is_ipv4('1.2.3.4', engine='nope')
+    with pytest.raises(ValueError, match='nope'):
+        lsre.validate_many(['1.2.3.4'], engine='nope')
+    assert engines.get_default() == 're'
+
+
+def test_custom_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Any check can be answered by a registered engine."""
+    monkeypatch.setitem(
+        engines.ENGINES, 'upper', dict.fromkeys(registry, str.isupper)
+    )
+    for name in registry:
+        func = getattr(lsre, f'is_{name}')
+        assert (func('ABC', engine='upper'), func(b'a', engine='upper')) == (
+            True,
+            False,
+        )
@@ -0,0 +1,137 @@
+"""Test the extraction scanners."""
+
+import io
+import random
+import re
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+import lsre
+from lsre.extract import (
+    OVERLAP,
+    Span,
+    scan,
+    scan_file,
+    scan_stream,
+    search_pattern,
+)
+from lsre.registry import SEARCH_PATTERNS
+
+LOG = (
+    b'2025-08-22 GET http://example.com/path?q=1 from 192.168.0.1 '
+    b'user=user.name+tag@sub.domain.co id=123e4567-e89b-12d3-a456-426614174000'
+    b' peer=2001:0db8:85a3:0000:0000:8a2e:0370:7334 ftp://ftp.example.org\n'
+    b'bad: 256.1.1.1 1.2.3.4.5 .user@example.com user@-example.com '
+    b'x::1 ::1 fe80::1, 10.0.0.1. mailto:admin@example.com.\n'
+)
+
+
+def _texts(data: bytes, spans: list[Span]) -> list[tuple[str, str]]:
+    """Return `(kind, text)` pairs for `spans` of `data`."""
+    return [(kind, data[start:end].decode()) for kind, start, end in spans]
+
+
+def test_scan_finds_every_kind() -> None:
+    """Values are found with their kind, in order."""
+    assert _texts(LOG, list(scan(LOG))) == [
+        ('url', 'http://example.com/path?q=1'),
+        ('ipv4', '192.168.0.1'),
+        ('email', 'user.name+tag@sub.domain.co'),
+        ('uuid', '123e4567-e89b-12d3-a456-426614174000'),
+        ('ipv6', '2001:0db8:85a3:0000:0000:8a2e:0370:7334'),
+        ('url', 'ftp://ftp.example.org'),
+        ('ipv6', '::1'),
+        ('ipv6', '::1'),
+        ('ipv6', 'fe80::1'),
+        ('ipv4', '10.0.0.1'),
+        ('email', 'admin@example.com'),
+    ]
+
+
+def test_spans_pass_their_validator() -> None:
+    """Every extracted value passes the `is_*` function of its kind."""
+    for kind, text in _texts(LOG, list(scan(LOG))):
+        assert getattr(lsre, f'is_{kind}')(text)
+
+
+def test_scan_selected_kinds() -> None:
+    """Only the requested kinds are reported."""
+    assert {span.kind for span in scan(LOG, 'ipv4')} == {'ipv4'}
+    assert {span.kind for span in scan(LOG, ['uuid', 'email'])} == {
+        'uuid',
+        'email',
+    }
+    with pytest.raises(ValueError, match='phone'):
+        list(scan(LOG, ['phone']))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33, 100])
+def test_scan_chunk_boundaries(chunk_size: int) -> None:
+    """Values straddling chunk boundaries are found once, in full."""
+    expected = list(scan(LOG))
+    assert list(scan(LOG, chunk_size=chunk_size)) == expected
+    assert list(scan(memoryview(LOG), chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 5000])
+def test_scan_stream_matches_scan(chunk_size: int) -> None:
+    """Streams report the same spans with stream offsets."""
+    data = LOG * 100
+    expected = list(scan(data))
+    stream = io.BytesIO(data)
+    assert list(scan_stream(stream, chunk_size=chunk_size)) == expected
+
+
+def test_scan_file(tmp_path: Path) -> None:
+    """Files are memory-mapped and scanned, empty files yield nothing."""
+    path = tmp_path / 'log.txt'
+    path.write_bytes(LOG)
+    assert list(scan_file(path, chunk_size=64)) == list(scan(LOG))
+    empty = tmp_path / 'empty.txt'
+    empty.write_bytes(b'')
+    assert list(scan_file(empty)) == []
+
+
+def test_search_patterns_fit_in_overlap() -> None:
+    """No search pattern can match more bytes than a window overlaps."""
+    for source in SEARCH_PATTERNS.values():
+        parsed = re._parser.parse(source)  # type: ignore[attr-defined]  # noqa: SLF001
+        _, longest = parsed.getwidth()
+        assert longest < OVERLAP
+    assert search_pattern(('ipv4',)) is search_pattern(('ipv4',))
+
+
+@pytest.mark.parametrize(
+    ('kind', 'alphabet'),
+    [
+        ('credit_card', '01234567890123456789  -a'),
+        ('phone_number', '0123456789  -()+a.'),
+        ('phone_number', '0123 -()+'),
+    ],
+)
+def test_number_matches_pass_their_validator(kind: str, alphabet: str) -> None:
+    """Phone and card numbers found in random text pass their check."""
+    rng = random.Random(0)  # noqa: S311
+    check = getattr(lsre, f'is_{kind}')
+    if kind == 'credit_card':
+        check = partial(check, extended=True)
+    found = 0
+    for _ in range(5_000):
+        data = ''.join(rng.choices(alphabet, k=60)).encode()
+        for span in scan(data, kind):
+            found += 1
+            assert check(data[span.start : span.end]), data
+    assert found > 100  # noqa: PLR2004
+
+
+def test_ids_are_not_card_numbers() -> None:
+    """Digit runs inside UUIDs and hex ids are not taken for cards."""
+    data = (
+        b'req 550e8400-e29b-41d4-a716-446655440000 '
+        b'trace_id=a4111111111111111 span=4111111111111111f'
+    )
+    assert _texts(data, list(scan(data, ['uuid', 'credit_card']))) == [
+        ('uuid', '550e8400-e29b-41d4-a716-446655440000'),
+    ]
@@ -0,0 +1,102 @@
+"""Differential tests of the hand-written checks against the regexes."""
+
+import itertools
+import random
+import re
+import sys
+
+import pytest
+
+from lsre.fastpath import CHECKS
+from lsre.registry import registry
+
+SAMPLES = {
+    'ipv4': [
+        '192.168.0.1',
+        '0.0.0.0',  # noqa: S104
+        '255.255.255.255',
+        '01.002.3.4',
+    ],
+    'ipv6': ['::1', '::', '2001:db8::ff00:42:8329', '1:2:3:4:5:6:7:8'],
+    'hex_color': ['#fff', '#ABCDEF', '#a1B2c3'],
+}
+
+ALPHABET = '0123456789abcdefABCDEFgG:.-#\n ١éK'
+"""Characters used to mutate samples, including non-ASCII look-alikes."""
+
+
+def _agrees(name: str, text: str) -> bool:
+    """Return True if both implementations answer the same for `text`."""
+    expected = registry[name].match(text) is not None
+    return CHECKS[name](text) == expected
+
+
+def test_hex_class_matches_ignorecase_semantics() -> None:
+    """The hex set agrees with `(?i)[0-9a-f]` on every code point."""
+    hex_digit = re.compile(r'[0-9a-f]', re.IGNORECASE).fullmatch
+    hex_set = set('0123456789abcdefABCDEF')
+    for code in range(sys.maxunicode + 1):
+        char = chr(code)
+        assert (hex_digit(char) is not None) == (char in hex_set)
+
+
+@pytest.mark.parametrize('name', list(CHECKS))
+def test_samples(name: str) -> None:
+    """Every sample passes both implementations, with trailing newline."""
+    for text in SAMPLES[name]:
+        assert CHECKS[name](text)
+        assert CHECKS[name](text + '\n')
+        assert not CHECKS[name](text + '\n\n')
+
+
+@pytest.mark.parametrize('name', list(CHECKS))
+def test_random_mutations(name: str) -> None:
+    """Random edits of valid samples get the regex's answer."""
+    rng = random.Random(name)  # noqa: S311
+    for _ in range(20_000):
+        chars = list(rng.choice(SAMPLES[name]))
+        for _ in range(rng.randint(1, 3)):
+            position = rng.randrange(len(chars) + 1)
+            edit = rng.randrange(3)
+            if edit == 0:
+                chars.insert(position, rng.choice(ALPHABET))
+            elif chars and edit == 1:
+                del chars[position % len(chars)]
+            elif chars:
+                chars[position % len(chars)] = rng.choice(ALPHABET)
+        text = ''.join(chars)
+        assert _agrees(name, text), text
+
+
+def test_ipv4_every_octet() -> None:
+    """Every one to three digit octet, in every position."""
+    octets = [
+        ''.join(digits)
+        for size in (1, 2, 3)
+        for digits in itertools.product('0123456789', repeat=size)
+    ]
+    for octet, position in itertools.product([*octets, '', '1234'], range(4)):
+        parts = ['1', '2', '3', '4']
+        parts[position] = octet
+        assert _agrees('ipv4', '.'.join(parts))
+
+
+def test_ipv6_every_layout() -> None:
+    """Every string of groups and colons up to 17 characters long."""
+    for size in range(18):
+        for chars in itertools.product('a:', repeat=size):
+            assert _agrees('ipv6', ''.join(chars))
+    for group in ['f', 'ff', 'fff', 'ffff', 'fffff', 'g', '']:
+        for text in [f'{group}::1', f'1::{group}', f'1:2:3:4:5:6:7:{group}']:
+            assert _agrees('ipv6', text)
+
+
+@pytest.mark.parametrize('name', list(CHECKS))
+def test_every_character_in_every_position(name: str) -> None:
+    """Each BMP character replacing each character of a valid sample."""
+    sample = SAMPLES[name][0]
+    for code in range(0x10000):
+        char = chr(code)
+        for position in range(len(sample)):
+            text = sample[:position] + char + sample[position + 1 :]
+            assert _agrees(name, text)
@@ -0,0 +1,135 @@
+"""Test the lazy `lsre` package and its logging defaults."""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+from loguru import logger
+
+import lsre
+
+IMPORT_BUDGET_US = 20_000
+"""Most microseconds `import lsre` may take, about a tenth of eager."""
+
+_PROBE = """
+import sys
+before = set(sys.modules)
+import lsre
+print(sorted(set(sys.modules) - before))
+"""
+
+
+_ENABLE = """
+import sys
+import lsre
+from loguru import logger
+logger.remove()
+messages = []
+logger.add(messages.append, format='{message}')
+if sys.argv[1] == 'after':
+    lsre.is_ipv4('10.0.0.1')
+logger.enable('lsre')
+lsre.validate_many(['10.0.0.1'], checks=['ipv4'])
+print(len(messages))
+"""
+
+
+def _run(
+    code: str, *options: str, args: tuple[str, ...] = ()
+) -> subprocess.CompletedProcess[str]:
+    """Run `code` in a fresh interpreter without coverage."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith('COV_')}
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *options, '-c', code, *args],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+
+def _import_lsre() -> tuple[list[str], int]:
+    """Import lsre in a fresh interpreter.
+
+    Returns:
+        tuple[list[str], int]: modules the import loaded and its
+            cumulative time in microseconds
+    """
+    result = _run(_PROBE, '-X', 'importtime')
+    timings = {
+        fields[2].strip(): int(fields[1])
+        for line in result.stderr.splitlines()
+        if len(fields := line.removeprefix('import time:').split('|')) == 3  # noqa: PLR2004
+        and fields[1].strip().isdigit()
+    }
+    return json.loads(result.stdout.replace("'", '"')), timings['lsre']
+
+
+def test_import_is_lazy_and_within_budget() -> None:
+    """`import lsre` loads no submodule, loguru or typing."""
+    loaded, elapsed = _import_lsre()
+    assert 'lsre' in loaded
+    assert not [name for name in loaded if name.startswith('lsre.')]
+    assert 'loguru' not in loaded
+    assert 'typing' not in loaded
+    assert elapsed < IMPORT_BUDGET_US
+
+
+def test_exports_resolve_on_access() -> None:
+    """Every exported name is reachable and listed by `dir`."""
+    for name in lsre.__all__:
+        assert getattr(lsre, name) is not None
+    assert set(lsre.__all__) <= set(dir(lsre))
+    with pytest.raises(AttributeError, match='no attribute'):
+        lsre.nope  # noqa: B018
+
+
+def test_classify_module_and_function() -> None:
+    """`lsre.classifier` is the module, `lsre.classify` its function."""
+    import lsre.classifier as module  # noqa: PLC0415
+
+    assert isinstance(module, types.ModuleType)
+    assert lsre.classify is module.classify
+    assert lsre.classify_many is module.classify_many
+
+
+def test_records_are_off_until_enabled() -> None:
+    """No handler is touched and records need `logger.enable('lsre')`.
+
+    Single `is_*` calls write no records at all.
+    """
+    importlib.reload(lsre)
+    messages: list[str] = []
+    handler = logger.add(messages.append, level='DEBUG', format='{message}')
+    try:
+        lsre.validate_many(['10.0.0.1'], checks=['ipv4'])
+        assert messages == []
+        logger.enable('lsre')
+        lsre.is_ipv4('10.0.0.1')
+        assert messages == []
+        lsre.validate_many(['10.0.0.1'], checks=['ipv4'])
+        assert messages == ["Validating 1 texts against ('ipv4',)\n"]
+    finally:
+        logger.disable('lsre')
+        logger.remove(handler)
+
+
+@pytest.mark.parametrize(('when', 'expected'), [('after', 1), ('before', 0)])
+def test_enable_after_first_call(when: str, expected: int) -> None:
+    """`logger.enable('lsre')` holds once an `lsre` function was used.
+
+    The first use disables the records, overriding an earlier enable.
+    """
+    assert _run(_ENABLE, args=(when,)).stdout == f'{expected}\n'
+
+
+def test_import_leaves_import_system(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`import lsre` installs no import hook."""
+    monkeypatch.setattr(sys, 'meta_path', list(sys.meta_path))
+    before = list(sys.meta_path)
+    importlib.reload(lsre)
+    assert sys.meta_path == before
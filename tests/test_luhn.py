@@ -0,0 +1,157 @@
+"""Test the Luhn checksum and the extended card pattern."""
+
+import random
+
+import numpy as np
+import pytest
+
+import lsre
+from lsre import engines
+from lsre.luhn import (
+    luhn_valid,
+    luhn_valid_many,
+    match_extended,
+    validate_cards,
+)
+
+VALID = [
+    '4111111111111111',
+    '4012888888881881',
+    '378282246310005',
+    '6011000990139424',
+    '4222222222222',
+    '6304000000000000000',
+]
+
+
+def _with_wrong_check_digit(number: str) -> str:
+    """Return `number` with its last digit changed."""
+    return number[:-1] + str((int(number[-1]) + 1) % 10)
+
+
+@pytest.mark.parametrize('number', VALID)
+def test_luhn_valid(number: str) -> None:
+    """Known test card numbers pass; changing the check digit fails."""
+    assert luhn_valid(number)
+    assert luhn_valid(number.encode())
+    assert not luhn_valid(_with_wrong_check_digit(number))
+
+
+def test_luhn_ignores_other_characters() -> None:
+    """Separators are skipped; no digits at all is never valid."""
+    assert luhn_valid('4111 1111-1111 1111')
+    assert luhn_valid(memoryview(b'4111-1111-1111-1111'))
+    assert not luhn_valid('')
+    assert not luhn_valid('----')
+
+
+def test_many_matches_scalar() -> None:
+    """The vectorized checksum agrees with `luhn_valid` on random texts."""
+    rng = random.Random(0)  # noqa: S311
+    texts = [
+        ''.join(rng.choice('0123456789 -x٤İ') for _ in range(n))
+        for n in (rng.randrange(30) for _ in range(5_000))
+    ]
+    texts += VALID + [_with_wrong_check_digit(n) for n in VALID]
+    expected = [luhn_valid(text) for text in texts]
+    assert luhn_valid_many(texts).tolist() == expected
+    ascii_texts = [text for text in texts if text.isascii()]
+    assert luhn_valid_many(
+        np.array([text.encode() for text in ascii_texts])
+    ).tolist() == [luhn_valid(text) for text in ascii_texts]
+
+
+@pytest.mark.parametrize('size', [255, 256, 257, 512])
+def test_many_long_numbers(size: int) -> None:
+    """Digit counts past 255 do not wrap the vectorized checksum."""
+    numbers = ['0' * size, '0' * (size - 1) + '1', '-' * size]
+    expected = [luhn_valid(number) for number in numbers]
+    assert expected == [True, False, False]
+    assert luhn_valid_many(numbers).tolist() == expected
+    assert luhn_valid_many([n.encode() for n in numbers]).tolist() == expected
+
+
+def test_many_blocks_and_shapes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Numbers are checked in blocks; empty input gives an empty array."""
+    monkeypatch.setattr('lsre.luhn._BLOCK', 4)
+    numbers = [*VALID, '12', '0']
+    assert luhn_valid_many(numbers).tolist() == [True] * 6 + [False, True]
+    assert luhn_valid_many([]).shape == (0,)
+    with pytest.raises(TypeError, match='strings or bytes'):
+        luhn_valid_many([1, 2])
+
+
+@pytest.mark.parametrize(
+    ('text', 'expected'),
+    [
+        ('4222222222222', True),
+        ('4222 2222 22222', True),
+        ('6304-0000-0000-0000-008', True),
+        ('63040000000000000080', False),
+        ('422222222222', False),
+        ('4111-1111 1111-1111', False),
+        ('4111  1111 1111 1111', False),
+        ('-4111111111111111', False),
+        ('4111111111111111-', False),
+    ],
+)
+def test_match_extended(text: str, expected: bool) -> None:
+    """13 to 19 digits, grouped by one kind of single separator."""
+    assert match_extended(text) == expected
+    assert match_extended(text.encode()) == expected
+
+
+@pytest.mark.parametrize(
+    ('text', 'kwargs', 'expected'),
+    [
+        ('4111 1111 1111 1111', {'luhn': True}, True),
+        ('4111 1111 1111 1112', {'luhn': True}, False),
+        ('4111 1111 1111 1112', {}, True),
+        ('4111-1111-1111-1111', {}, False),
+        ('4111-1111-1111-1111', {'extended': True}, True),
+        ('4222222222223', {'extended': True}, True),
+        ('4222222222223', {'extended': True, 'luhn': True}, False),
+        (b'6304000000000000000', {'extended': True, 'luhn': True}, True),
+    ],
+)
+def test_is_credit_card_flags(
+    text: str | bytes, kwargs: dict[str, bool], expected: bool
+) -> None:
+    """`luhn` and `extended` are opt in and work on every engine."""
+    for engine in engines.ENGINES:
+        assert lsre.is_credit_card(text, engine, **kwargs) == expected
+
+
+def test_validate_cards_matches_is_credit_card() -> None:
+    """The batch answers are those of `is_credit_card(luhn=True)`."""
+    texts = [
+        *VALID,
+        '4111 1111 1111 1111',
+        '4111-1111-1111-1111',
+        '4111 1111 1111 1112',
+        '4222 2222 22222',
+        'card',
+    ]
+    for extended in (False, True):
+        expected = [
+            lsre.is_credit_card(text, luhn=True, extended=extended)
+            for text in texts
+        ]
+        assert validate_cards(texts, extended=extended).tolist() == expected
+        assert (
+            validate_cards(np.array(texts), extended=extended).tolist()
+            == expected
+        )
+        encoded = [text.encode() for text in texts]
+        for numbers in (
+            encoded,
+            list(map(bytearray, encoded)),
+            list(map(memoryview, encoded)),
+            np.array(texts, dtype=object),
+            np.array(encoded, dtype=object),
+        ):
+            assert (
+                validate_cards(numbers, extended=extended).tolist() == expected
+            )
+    with pytest.raises(TypeError, match='str or bytes-like'):
+        validate_cards([4111111111111111])
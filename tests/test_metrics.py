@@ -0,0 +1,81 @@
+"""Test the opt-in metrics."""
+
+import json
+from collections.abc import Iterator
+
+import pytest
+
+import lsre
+from lsre import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics() -> Iterator[None]:
+    """Start every test with metrics disabled and empty."""
+    metrics.disable()
+    metrics.reset()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_disabled_records_nothing() -> None:
+    """Nothing is recorded unless metrics are enabled."""
+    assert not metrics.is_enabled()
+    lsre.is_email('user@example.com')
+    lsre.validate_many(['a'], checks='slug')
+    assert metrics.snapshot() == {}
+
+
+def test_scalar_calls_are_counted() -> None:
+    """Each call adds one to the count and passing calls to the matches."""
+    metrics.enable()
+    assert metrics.is_enabled()
+    lsre.is_uuid('123e4567-e89b-12d3-a456-426614174000')
+    lsre.is_uuid('nope')
+    lsre.is_uuid('nope')
+    stats = metrics.snapshot()['uuid']
+    assert (stats['calls'], stats['matches']) == (3, 1)
+    assert stats['match_ratio'] == pytest.approx(1 / 3)
+    assert stats['total_seconds'] > 0
+    assert stats['latency_buckets'][-1] == ['+Inf', 3]
+
+
+def test_batch_calls_are_counted() -> None:
+    """Batch APIs record every text of the batch."""
+    metrics.enable()
+    lsre.validate_many(['a', 'b-c', 'D'], checks=['slug', 'alphanumeric'])
+    lsre.classify_many(['a', '!'], checks=['slug'])
+    lsre.classify('b', checks=['slug'])
+    stats = metrics.snapshot()
+    counts = {name: (s['calls'], s['matches']) for name, s in stats.items()}
+    assert counts == {
+        'slug': (3, 2),
+        'alphanumeric': (3, 2),
+        'classify': (3, 2),
+    }
+
+
+def test_histogram_is_cumulative() -> None:
+    """Bucket counts are cumulative and slow calls land in +Inf."""
+    metrics.record('slow', calls=2, matches=0, elapsed_ns=10**12)
+    metrics.record('slow', calls=1, matches=1, elapsed_ns=100)
+    metrics.record('slow', calls=0, matches=0, elapsed_ns=100)
+    buckets = metrics.snapshot()['slow']['latency_buckets']
+    assert buckets[0] == [metrics.BUCKET_BOUNDS_NS[0] / 1e9, 1]
+    assert buckets[-2][1] == 1
+    assert buckets[-1] == ['+Inf', 3]
+
+
+def test_exports() -> None:
+    """Metrics can be dumped as JSON and Prometheus text."""
+    metrics.record('email', calls=4, matches=3, elapsed_ns=4_000)
+    assert json.loads(metrics.to_json()) == metrics.snapshot()
+    text = metrics.to_prometheus()
+    assert 'lsre_validator_calls_total{validator="email"} 4\n' in text
+    assert 'lsre_validator_matches_total{validator="email"} 3\n' in text
+    assert (
+        'lsre_validator_latency_seconds_bucket{validator="email",le="+Inf"} 4'
+        in text
+    )
+    assert 'lsre_validator_latency_seconds_count{validator="email"} 4' in text
@@ -0,0 +1,100 @@
+"""Test the process- and thread-pool engines."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import lsre
+from lsre import parallel
+from lsre.parallel import _warm_up, imap_validate, validate_parallel
+from tests.data import TEXTS
+
+
+def test_validate_parallel_matches_batch() -> None:
+    """Results equal `validate_many`, in input order."""
+    texts = TEXTS * 5
+    result = validate_parallel(iter(texts), workers=2, chunk_size=7)
+    assert result == lsre.validate_many(texts)
+
+
+def test_validate_parallel_empty() -> None:
+    """Empty input still reports every requested check."""
+    result = validate_parallel([], ['ipv4', 'uuid'], workers=1)
+    assert result.size == 0
+    assert result.checks == ('ipv4', 'uuid')
+
+
+def test_imap_validate_bounded_and_ordered() -> None:
+    """Chunks come back in order even with one chunk in flight."""
+    chunks = list(
+        imap_validate(TEXTS, ['email'], workers=2, chunk_size=4, max_pending=1)
+    )
+    assert [text for texts, _ in chunks for text in texts] == TEXTS
+    assert [len(texts) for texts, _ in chunks] == [4, 4, 4, 3]
+
+
+def test_imap_validate_file(tmp_path: Path) -> None:
+    """A path is read line by line."""
+    path = tmp_path / 'in.txt'
+    path.write_text('10.0.0.1\nabc\n', encoding='utf-8')
+    chunks = list(imap_validate(path, 'ipv4', workers=1))
+    assert chunks[0][0] == ['10.0.0.1', 'abc']
+    assert chunks[0][1]['ipv4'] == [True, False]
+
+
+def test_imap_validate_early_exit() -> None:
+    """Closing the generator early shuts the pool down."""
+    chunks = imap_validate(TEXTS * 10, workers=1, chunk_size=2)
+    texts, _ = next(chunks)
+    chunks.close()
+    assert texts == TEXTS[:2]
+
+
+def test_imap_validate_propagates_type_errors() -> None:
+    """Worker errors are raised in the caller."""
+    texts: list[Any] = ['a', 1]
+    with pytest.raises(TypeError):
+        validate_parallel(texts, workers=1)
+
+
+def test_warm_up_compiles_patterns() -> None:
+    """The worker initializer accepts resolved check names."""
+    _warm_up(('email', 'uuid'))
+
+
+def test_thread_pool_matches_batch() -> None:
+    """Threads give the answers of `validate_many`, in input order."""
+    texts = TEXTS * 5
+    result = validate_parallel(texts, workers=4, chunk_size=3, pool='thread')
+    assert result == lsre.validate_many(texts)
+
+
+def test_default_pool_follows_the_gil(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Threads are used by default only when the GIL is disabled."""
+    started = []
+
+    class Recording(parallel.ThreadPoolExecutor):
+        def __init__(self, max_workers: int) -> None:
+            started.append(max_workers)
+            super().__init__(max_workers)
+
+    monkeypatch.setattr(parallel, 'ThreadPoolExecutor', Recording)
+    validate_parallel(TEXTS, workers=1)
+    assert started == []
+    monkeypatch.setattr(parallel, 'gil_enabled', lambda: False)
+    assert validate_parallel(TEXTS, workers=2) == lsre.validate_many(TEXTS)
+    assert started == [2]
+
+
+def test_gil_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Builds without `sys._is_gil_enabled` always have the GIL."""
+    assert parallel.gil_enabled() is parallel.sys._is_gil_enabled()  # noqa: SLF001
+    monkeypatch.delattr(parallel.sys, '_is_gil_enabled')
+    assert parallel.gil_enabled()
+
+
+def test_unknown_pool() -> None:
+    """An unknown pool kind raises ValueError."""
+    with pytest.raises(ValueError, match='Unknown pool'):
+        validate_parallel(TEXTS, pool='fiber')
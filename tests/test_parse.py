@@ -0,0 +1,138 @@
+"""Test parsing addresses, UUIDs and colours into values."""
+
+import ipaddress
+import random
+import uuid
+from array import array
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+import lsre
+from benchmarks.corpus import generate
+from lsre.parse import (
+    Packed,
+    parse_hex_color,
+    parse_hex_color_many,
+    parse_ipv4,
+    parse_ipv4_many,
+    parse_ipv6,
+    parse_ipv6_many,
+    parse_uuid,
+    parse_uuid_many,
+)
+from lsre.registry import registry
+from tests.data import EDGE_TEXTS, TEXTS
+
+PARSERS: dict[str, tuple[Callable[..., int | None], Callable[..., bool]]] = {
+    'ipv4': (parse_ipv4, lsre.is_ipv4),
+    'ipv6': (parse_ipv6, lsre.is_ipv6),
+    'uuid': (parse_uuid, lsre.is_uuid),
+    'hex_color': (parse_hex_color, lsre.is_hex_color),
+}
+
+BATCHES: dict[str, Callable[..., Packed]] = {
+    'ipv4': parse_ipv4_many,
+    'ipv6': parse_ipv6_many,
+    'uuid': parse_uuid_many,
+    'hex_color': parse_hex_color_many,
+}
+
+
+def _corpus() -> list[str]:
+    """Return corpus values, random strings and their newline variants."""
+    rng = random.Random(0)  # noqa: S311
+    alphabet = '0123456789abcdefABCDEF:.-#x\n٣'
+    texts = [value for name in registry for _, value in generate(name, 300)]
+    texts += [
+        ''.join(rng.choices(alphabet, k=rng.randint(0, 40)))
+        for _ in range(5_000)
+    ]
+    texts += [
+        *TEXTS,
+        *EDGE_TEXTS,
+        '::',
+        '::1',
+        '1::',
+        'fe80::',
+        '1:2:3:4:5:6:7::8',
+        '1::2::3',
+        '01.002.3.4',
+        '#ABC',
+        '#abcd',
+        '#',
+        '',
+    ]
+    return texts + [f'{text}\n' for text in texts]
+
+
+CORPUS = _corpus()
+
+
+def _reference(name: str, text: str) -> int:
+    """Return the value of a valid `text` by the standard library."""
+    text = text.removesuffix('\n')
+    if name == 'ipv4':
+        return int.from_bytes(bytes(map(int, text.split('.'))))
+    if name == 'ipv6':
+        return int(ipaddress.IPv6Address(text))
+    if name == 'uuid':
+        return uuid.UUID(text).int
+    digits = text[1:]
+    if len(digits) == 3:  # noqa: PLR2004
+        digits = ''.join(c * 2 for c in digits)
+    return int(digits, 16)
+
+
+@pytest.mark.parametrize('name', PARSERS)
+def test_parse_agrees_with_check(name: str) -> None:
+    """Exactly the texts the check accepts parse, to the right value."""
+    parse, check = PARSERS[name]
+    for text in CORPUS:
+        value = parse(text)
+        assert (value is not None) == check(text), text
+        if value is not None:
+            assert value == _reference(name, text), text
+
+
+@pytest.mark.parametrize('name', PARSERS)
+def test_many_agrees_with_scalar(name: str) -> None:
+    """Batches pack the scalar values, with 0 where a text is invalid."""
+    parse, _ = PARSERS[name]
+    packed = BATCHES[name](CORPUS)
+    expected = [parse(text) for text in CORPUS]
+    assert len(packed) == len(CORPUS)
+    assert list(packed.mask) == [value is not None for value in expected]
+    assert [packed[i] for i in range(len(packed))] == expected
+    width = 4 if name in {'ipv4', 'hex_color'} else 16
+    assert memoryview(packed.values).nbytes == width * len(CORPUS)
+    bytes_packed = BATCHES[name]([text.encode() for text in CORPUS])
+    assert bytes_packed == packed
+
+
+def test_packed_layout() -> None:
+    """IPv4 addresses are words; IPv6 addresses are network order."""
+    ipv4 = parse_ipv4_many(['10.0.0.1', 'x', b'255.255.255.255'])
+    assert ipv4.values == array('I', [0x0A000001, 0, 0xFFFFFFFF])
+    assert ipv4[-1] == 0xFFFFFFFF  # noqa: PLR2004
+    assert ipv4[1] is None
+    ipv6 = parse_ipv6_many(['::1', '2001:db8::'])
+    assert bytes(ipv6.values[:16]) == ipaddress.IPv6Address('::1').packed
+    assert bytes(ipv6.values[16:]) == bytes(16)
+    text = '123e4567-e89b-12d3-a456-426614174000'
+    assert bytes(parse_uuid_many([text]).values) == uuid.UUID(text).bytes
+    assert parse_uuid_many([text.encode()]) == parse_uuid_many([text])
+    assert parse_hex_color_many(['#fa0']).values == array('I', [0xFFAA00])
+    with pytest.raises(IndexError):
+        ipv4[3]
+
+
+def test_parse_type_errors() -> None:
+    """Non-text arguments raise TypeError, as the checks do."""
+    bad: Any = 167772161
+    with pytest.raises(TypeError, match='must be of type str, bytes'):
+        parse_ipv4(bad)
+    with pytest.raises(TypeError, match='int at index 1'):
+        parse_uuid_many([b'x', bad])
+    assert parse_ipv4_many([]) == Packed(array('I'), bytearray())
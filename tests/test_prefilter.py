@@ -0,0 +1,99 @@
+"""Test the fingerprint prefilter."""
+
+import random
+
+import pytest
+
+import lsre
+from benchmarks.corpus import generate
+from lsre import prefilter
+from lsre.registry import registry
+from tests.data import EDGE_TEXTS, TEXTS
+
+
+def _corpus() -> list[str]:
+    """Return corpus values of every check plus random short strings."""
+    rng = random.Random(0)  # noqa: S311
+    alphabet = 'aF09:@#.-/ \n+()é٣_%!'
+    texts = [value for name in registry for _, value in generate(name, 300)]
+    texts += [
+        ''.join(rng.choices(alphabet, k=rng.randint(0, 40)))
+        for _ in range(3_000)
+    ]
+    texts += TEXTS + EDGE_TEXTS
+    return texts + [f'{text}\n' for text in texts]
+
+
+CORPUS = _corpus()
+
+
+def test_every_check_has_constraints() -> None:
+    """The constraint table covers exactly the registered checks."""
+    assert list(prefilter.CONSTRAINTS) == list(registry)
+
+
+def test_never_rules_out_a_passing_check() -> None:
+    """Every check a text passes is among its candidates."""
+    for text in CORPUS:
+        allowed = prefilter.candidates(text)
+        passed = tuple(name for name in registry if registry[name].match(text))
+        assert set(passed) <= set(allowed), text
+
+
+def test_rules_out_most_checks() -> None:
+    """Typical values leave only a few candidates."""
+    assert prefilter.candidates('123e4567-e89b-12d3-a456-426614174000') == (
+        'uuid',
+        'slug',
+        'strong_password',
+    )
+    assert prefilter.candidates('user@example.com') == (
+        'email',
+        'strong_password',
+    )
+    assert prefilter.candidates('') == ()
+    assert prefilter.candidates('::1', checks=['ipv4', 'ipv6']) == ('ipv6',)
+
+
+def test_bytes_fingerprints_match_str() -> None:
+    """Bytes-like input gets the fingerprint of the same ASCII string."""
+    for text in TEXTS + EDGE_TEXTS:
+        encoded = text.encode()
+        expected = prefilter.fingerprint(text)
+        assert prefilter.fingerprint(encoded) == expected
+        assert prefilter.fingerprint(bytearray(encoded)) == expected
+        assert prefilter.fingerprint(memoryview(encoded)) == expected
+    assert prefilter.fingerprint('x' * 1_000)[0] == prefilter.LENGTH_CAP
+
+
+@pytest.mark.parametrize('engine', ['re', 'fast'])
+def test_validate_many_answers_do_not_change(engine: str) -> None:
+    """Screened and unscreened batches give the same masks."""
+    for texts in (CORPUS, [t.encode() for t in TEXTS + EDGE_TEXTS]):
+        assert lsre.validate_many(texts, engine=engine) == lsre.validate_many(
+            texts, engine=engine, prefilter=False
+        )
+
+
+def test_classify_answers_do_not_change() -> None:
+    """Screened and unscreened classification agree, one by one too."""
+    assert lsre.classify_many(CORPUS) == lsre.classify_many(
+        CORPUS, prefilter=False
+    )
+    encoded = [text.encode() for text in TEXTS + EDGE_TEXTS]
+    assert lsre.classify_many(encoded) == lsre.classify_many(
+        encoded, prefilter=False
+    )
+    for text in TEXTS + EDGE_TEXTS + encoded:
+        assert lsre.classify(text) == lsre.classify(text, prefilter=False)
+
+
+def test_few_checks_are_not_screened(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batches of fewer than `MIN_CHECKS` checks skip the screening."""
+
+    def fail(*args: object) -> None:
+        raise AssertionError(args)
+
+    monkeypatch.setattr(lsre.batch, 'screen', fail)
+    checks = list(registry)[: prefilter.MIN_CHECKS - 1]
+    assert lsre.validate_many(TEXTS, checks).size == len(TEXTS)
@@ -0,0 +1,128 @@
+"""Test the PII redactor."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from lsre.redact import DEFAULT_KINDS, Redactor, redact
+
+LOG = (
+    b'2025-08-22 login user=jane.doe@example.com phone=+1-800-555-1212 '
+    b'card=4111 1111 1111 1111 ip=10.0.0.1\n'
+    b'retry JANE.DOE@example.com (555) 123-4567 card 4111111111111111 '
+    b'amex 3782 822463 10005 ok\n'
+)
+
+
+def test_full_mask() -> None:
+    """Values are replaced by their kind; other text is untouched."""
+    assert Redactor().redact(LOG) == (
+        b'2025-08-22 login user=[EMAIL] phone=[PHONE_NUMBER] '
+        b'card=[CREDIT_CARD] ip=10.0.0.1\n'
+        b'retry [EMAIL] [PHONE_NUMBER] card [CREDIT_CARD] '
+        b'amex [CREDIT_CARD] ok\n'
+    )
+    assert redact('no pii here') == 'no pii here'
+    assert Redactor('email').redact(memoryview(b'a@b.co')) == b'[EMAIL]'
+
+
+@pytest.mark.parametrize(
+    'line',
+    [
+        '2024-01-15 10:00:00,123 INFO started',
+        '10.0.0.1 - - [15/Jan/2024:10:00:00 +0100] "GET / HTTP/1.1" 200 1234',
+        'worker pid 1234567 exited after 12:30:45',
+        '2024-01-15T10:00:00+05:30 id=12345678-1234-1234-1234-123456789012',
+        'req 550e8400-e29b-41d4-a716-446655440000 done',
+        'trace_id=a4111111111111111 span=4111111111111111f',
+    ],
+)
+def test_log_noise_is_kept(line: str) -> None:
+    """Timestamps, statuses, sizes and ids are not taken for numbers."""
+    assert redact(line) == line
+
+
+def test_card_shapes() -> None:
+    """Cards are found with single spaces, single hyphens or neither."""
+    assert redact('card 4111-1111-1111-1111, exp 12/27') == (
+        'card [CREDIT_CARD], exp 12/27'
+    )
+    assert redact('amex 3782-822463-10005 ok') == 'amex [CREDIT_CARD] ok'
+    assert Redactor(mask='partial').redact('4111-1111-1111-1111') == (
+        '****-****-****-1111'
+    )
+    assert redact('phone 555-123-4567 or 1 (800) 555-1212') == (
+        'phone [PHONE_NUMBER] or [PHONE_NUMBER]'
+    )
+
+
+def test_partial_mask() -> None:
+    """Partial masks keep the ends of a value."""
+    redactor = Redactor(mask='partial')
+    assert redactor.redact('mail jane@example.com now') == (
+        'mail j***@example.com now'
+    )
+    assert redactor.redact('card 3782 822463 10005') == (
+        'card **** ****** *0005'
+    )
+    assert redactor.redact('call (555) 123-4567') == 'call (***) ***-4567'
+    assert Redactor('ipv4', 'partial').redact('10.0.0.1') == '*0.0.0.1'
+
+
+def test_hash_mask() -> None:
+    """Equal values get equal digests, whatever their case or spacing."""
+    redactor = Redactor(mask='hash', key=b'secret')
+    first = redactor.redact('4111 1111 1111 1111 jane@example.com')
+    second = redactor.redact('4111111111111111 JANE@example.com')
+    assert first == second
+    assert first.startswith('[CREDIT_CARD:')
+    other_key = Redactor(mask='hash', key=b'other')
+    assert other_key.redact('jane@example.com') != redactor.redact(
+        'jane@example.com'
+    )
+    assert Redactor('uuid', 'hash').redact('x').startswith('x')
+
+
+def test_mask_per_kind() -> None:
+    """Masks can differ per kind, unlisted kinds are masked in full."""
+    redactor = Redactor(
+        mask={'email': 'partial', 'credit_card': lambda value: b'#' * 4}
+    )
+    assert redactor.redact('a@b.co 4111 1111 1111 1111 +1 800 555 1212') == (
+        'a***@b.co #### [PHONE_NUMBER]'
+    )
+
+
+def test_bad_arguments() -> None:
+    """Unknown kinds and masks, and over-long keys, raise ValueError."""
+    with pytest.raises(ValueError, match='Unknown kinds'):
+        Redactor(['ssn'])
+    with pytest.raises(ValueError, match='Unknown mask'):
+        Redactor(mask='blur')
+    with pytest.raises(ValueError, match='not in'):
+        Redactor(['email'], {'ipv4': 'full'})
+    with pytest.raises(ValueError, match='at most 64'):
+        Redactor(mask='hash', key=b'k' * 65)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 5000, 1 << 20])
+def test_stream_matches_redact(chunk_size: int) -> None:
+    """Streamed output equals redacting the whole input at once."""
+    data = LOG * 50
+    redactor = Redactor(mask='partial', chunk_size=chunk_size)
+    out = io.BytesIO()
+    counts = redactor.redact_stream(io.BytesIO(data), out)
+    assert out.getvalue() == redactor.redact(data)
+    assert counts == {'email': 100, 'phone_number': 100, 'credit_card': 150}
+    assert Redactor().redact_stream(io.BytesIO(b''), out) == {}
+
+
+def test_redact_file(tmp_path: Path) -> None:
+    """Files are copied with every value replaced."""
+    source = tmp_path / 'app.log'
+    source.write_bytes(LOG)
+    target = tmp_path / 'clean.log'
+    counts = Redactor(DEFAULT_KINDS).redact_file(source, target)
+    assert target.read_bytes() == Redactor().redact(LOG)
+    assert sum(counts.values()) == 7  # noqa: PLR2004
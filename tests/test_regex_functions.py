@@ -5,6 +5,8 @@ from typing import Any, NamedTuple
 import pytest
 
 import lsre
+from lsre.registry import registry
+from tests.data import TEXTS
 
 
 class Case(NamedTuple):
@@ -48,6 +50,9 @@ def test_is_alphanumeric(text: str, expected: bool) -> None:
         Case(text='user@-example.com', expected=False),
         Case(text='user@example-.com', expected=False),
         Case(text='user@sub-example.com', expected=True),
+        Case(text='u' * 64 + '@' + 'a.' * 92 + 'comco', expected=True),
+        Case(text='u' * 64 + '@' + 'a.' * 92 + 'comcom', expected=False),
+        Case(text='u' * 65 + '@example.com', expected=False),
     ],
 )
 def test_is_email(text: str, expected: bool) -> None:
@@ -78,6 +83,8 @@ def test_is_email(text: str, expected: bool) -> None:
         Case(text='http://127.0.0.1', expected=True),
         Case(text='http://[::1]', expected=False),
         Case(text='http://例子.测试', expected=False),
+        Case(text='http://example.com/' + 'a' * 2029, expected=True),
+        Case(text='http://example.com/' + 'a' * 2030, expected=False),
     ],
 )
 def test_is_url(text: str, expected: bool) -> None:
@@ -140,6 +147,8 @@ def test_is_ipv6(text: str, expected: bool) -> None:
         Case(text='+123456789012345', expected=True),
         Case(text='+1234567890123456', expected=False),
         Case(text='phone', expected=False),
+        Case(text='800 555 1212' + ' ' * 20, expected=True),
+        Case(text='800 555 1212' + ' ' * 21, expected=False),
     ],
 )
 def test_is_phone_number(text: str, expected: bool) -> None:
@@ -159,6 +168,9 @@ def test_is_phone_number(text: str, expected: bool) -> None:
         Case(text='4012888888881881', expected=True),
         Case(text='378282246310005', expected=True),
         Case(text='123456789012', expected=False),
+        Case(text='41111111111111111', expected=False),
+        Case(text='4111 1111 1111 1111 1', expected=False),
+        Case(text='4111' + ' ' * 29 + '111111111111', expected=False),
     ],
 )
 def test_is_credit_card(text: str, expected: bool) -> None:
@@ -293,3 +305,37 @@ def test_is_strong_password(text: str, expected: bool) -> None:
         expected (bool): expected output for input
     """
     assert lsre.is_strong_password(text=text) == expected
+
+
+BYTES_TEXTS = [
+    *TEXTS,
+    'caf\u00e9',
+    '\u0661\u0662\u0663-4567-890',
+    '4111\x1c1111 1111 1111',
+    'P\u00e4ssw0rd!',
+]
+
+
+@pytest.mark.parametrize('kind', [bytes, bytearray, memoryview])
+@pytest.mark.parametrize('name', list(registry))
+def test_bytes_input(name: str, kind: type) -> None:
+    """Bytes-like input gives the same answer as the decoded string.
+
+    Args:
+        name (str): check name
+        kind (type): bytes-like type to wrap the encoded text in
+    """
+    func = getattr(lsre, f'is_{name}')
+    for text in BYTES_TEXTS:
+        assert func(kind(text.encode())) == func(text)
+
+
+@pytest.mark.parametrize('bad_value', [123, None, ['a'], 1.5])
+def test_rejects_non_text(bad_value: Any) -> None:  # noqa: ANN401
+    """Values that are neither strings nor bytes raise TypeError.
+
+    Args:
+        bad_value (Any): input of a wrong type
+    """
+    with pytest.raises(TypeError, match='must be of type str, bytes'):
+        lsre.is_email(bad_value)
@@ -0,0 +1,110 @@
+"""Test the pattern registry."""
+
+import re
+import time
+
+import pytest
+
+import lsre
+from benchmarks.corpus import ADVERSARIAL
+from lsre.registry import PATTERNS, PatternRegistry, registry
+
+
+def test_registry_has_all_checks() -> None:
+    """Every public validator has a registered pattern."""
+    checks = {
+        name.removeprefix('is_')
+        for name in lsre.__all__
+        if name.startswith('is_')
+    }
+    assert set(registry) == checks
+    assert len(registry) == len(checks)
+
+
+def test_registry_compiles_once() -> None:
+    """Lookups return the same compiled pattern object."""
+    local = PatternRegistry(PATTERNS)
+    first = local['email']
+    assert isinstance(first, re.Pattern)
+    assert local['email'] is first
+
+
+def test_registry_source() -> None:
+    """The uncompiled source is kept alongside the compiled pattern."""
+    source, flags = registry.source('hex_color')
+    assert registry['hex_color'].pattern == source
+    assert flags == re.IGNORECASE
+
+
+def test_registry_unknown_check() -> None:
+    """Unknown names raise KeyError."""
+    with pytest.raises(KeyError):
+        registry['not_a_check']
+
+
+def test_registry_resolve() -> None:
+    """Check names are validated, deduplicated and defaulted."""
+    assert registry.resolve(None) == tuple(PATTERNS)
+    assert registry.resolve('email') == ('email',)
+    assert registry.resolve(['uuid', 'email', 'uuid']) == ('uuid', 'email')
+    with pytest.raises(ValueError, match='not_a_check'):
+        registry.resolve(['email', 'not_a_check'])
+
+
+SHORT_TEXTS = [
+    '',
+    'ab',
+    'Ab1!abcd',
+    '1-2',
+    '1.2.3.4',
+    'a@b.cc',
+    '1:2',
+    '#abc',
+    '555 123 4567',
+    '4111 1111 1111 1111',
+]
+
+
+@pytest.mark.parametrize('name', list(PATTERNS))
+def test_registry_binary_agrees_on_ascii(name: str) -> None:
+    """Bytes patterns answer like str patterns for every ASCII character.
+
+    Each character is put at the start, middle and end of short texts
+    close to passing several checks, and used on its own.
+    """
+    text_match = registry[name].match
+    binary_match = registry.binary(name).match
+    for code in range(128):
+        char = chr(code)
+        for base in SHORT_TEXTS:
+            middle = len(base) // 2
+            for text in (
+                char,
+                char + base,
+                base[:middle] + char + base[middle:],
+                base + char,
+                base[:middle] + char + base[middle + 1 :],
+            ):
+                expected = text_match(text) is not None
+                assert (binary_match(text.encode()) is not None) == expected
+
+
+def test_registry_binary_compiles_once() -> None:
+    """Bytes patterns are compiled once and kept."""
+    local = PatternRegistry(PATTERNS)
+    assert local.binary('uuid') is local.binary('uuid')
+    assert local.combined_binary(['uuid']) is local.combined_binary('uuid')
+
+
+@pytest.mark.parametrize('name', list(PATTERNS))
+def test_registry_linear_time(name: str) -> None:
+    """Crafted 256 KB inputs are answered without backtracking.
+
+    A backtracking pattern takes seconds to years on these; linear ones
+    take a few milliseconds at most.
+    """
+    for label, make in ADVERSARIAL.items():
+        text = make(262_144)
+        start = time.perf_counter()
+        registry[name].match(text)
+        assert time.perf_counter() - start < 0.1, label  # noqa: PLR2004
@@ -0,0 +1,107 @@
+"""Test the compiled record schemas."""
+
+from typing import Any
+
+import pytest
+
+import lsre
+from lsre import engines, metrics
+from lsre.registry import registry
+from lsre.schema import Schema, SchemaResult
+from tests.data import TEXTS
+
+RECORDS: list[dict[str, Any]] = [
+    {'email': text, 'ip': other, 'day': text}
+    for text, other in zip(TEXTS, reversed(TEXTS), strict=True)
+]
+
+
+def test_validate_matches_scalar_functions() -> None:
+    """Failure masks equal calling the `is_*` function per field."""
+    schema = Schema({'email': 'email', 'ip': 'is_ipv4', 'day': lsre.is_time})
+    result = schema.validate(iter(RECORDS))
+    assert result.size == len(RECORDS)
+    assert schema.fields == ('email', 'ip', 'day')
+    assert result['email'] == [not lsre.is_email(r['email']) for r in RECORDS]
+    assert result['ip'] == [not lsre.is_ipv4(r['ip']) for r in RECORDS]
+    assert result['day'] == [not lsre.is_time(r['day']) for r in RECORDS]
+    assert result.passed() == [
+        lsre.is_email(r['email'])
+        and lsre.is_ipv4(r['ip'])
+        and lsre.is_time(r['day'])
+        for r in RECORDS
+    ]
+    assert result.row(1) == {'email': False, 'ip': True, 'day': True}
+
+
+def test_plan_binds_matchers_once() -> None:
+    """The plan holds the engine's function or the bound regex match."""
+    schema = Schema({'a': 'ipv4', 'b': 'uuid'}, engine='fast')
+    ipv4, uuid = schema.plan
+    assert ipv4.match is engines.ENGINES['fast']['ipv4']
+    assert uuid.match == registry['uuid'].match
+    assert ipv4.builtin
+    assert uuid.builtin
+
+
+def test_custom_checks() -> None:
+    """Any function of a string can check a field."""
+    schema = Schema({'code': str.isdigit, 'tag': lambda text: text != 'x'})
+    code, tag = schema.plan
+    assert (code.name, code.builtin) == ('isdigit', False)
+    assert (tag.name, tag.builtin) == ('<lambda>', False)
+    result = schema.validate([{'code': '12', 'tag': 'x'}, {'code': 'a'}])
+    assert result['code'] == [False, True]
+    assert result['tag'] == [True, True]
+
+
+def test_missing_and_non_text_values() -> None:
+    """Missing or odd values fail; bytes are decoded; optional may be None."""
+    schema = Schema({'ip': 'ipv4', 'slug': 'slug'}, optional=['slug'])
+    result = schema.validate(
+        [
+            {'ip': b'10.0.0.1', 'slug': None},
+            {'ip': None},
+            {'ip': 10, 'slug': 10},
+            {'ip': bytearray(b'10.0.0.1'), 'slug': b'a-b'},
+            {'ip': memoryview(b'1.1.1.1\xff'), 'slug': 'A B'},
+        ]
+    )
+    assert result['ip'] == [False, True, True, False, True]
+    assert result['slug'] == [False, False, True, False, True]
+
+
+def test_unknown_names() -> None:
+    """Unknown checks, engines and optional fields raise ValueError."""
+    with pytest.raises(ValueError, match='Unknown checks'):
+        Schema({'a': 'nope'})
+    with pytest.raises(ValueError, match='Unknown engine'):
+        Schema({'a': 'ipv4'}, engine='nope')
+    with pytest.raises(ValueError, match=r"\['b'\] are not in the schema"):
+        Schema({'a': 'ipv4'}, optional=['b'])
+
+
+def test_validate_stream_and_merge() -> None:
+    """Chunks come back in order and merge into the one-shot result."""
+    schema = Schema({'email': 'email', 'ip': 'ipv4'})
+    chunks = list(schema.validate_stream(iter(RECORDS), chunk_size=4))
+    assert [len(chunk) for chunk, _ in chunks] == [4, 4, 4, 3]
+    assert [row for chunk, _ in chunks for row in chunk] == RECORDS
+    merged = SchemaResult.merge(result for _, result in chunks)
+    assert merged == schema.validate(RECORDS)
+    assert SchemaResult.merge([]) == SchemaResult(size=0, failures={})
+
+
+def test_metrics_count_builtin_checks() -> None:
+    """Built-in checks are recorded per column; custom checks are not."""
+    metrics.reset()
+    metrics.enable()
+    try:
+        Schema({'a': 'slug', 'b': str.isdigit}).validate([{'a': 'x'}] * 3)
+        snapshot = metrics.snapshot()
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert snapshot['slug']['calls'] == 3  # noqa: PLR2004
+    assert snapshot['slug']['matches'] == 3  # noqa: PLR2004
+    assert 'isdigit' not in snapshot
@@ -0,0 +1,331 @@
+"""Test the HTTP validation service."""
+
+import asyncio
+import json
+import runpy
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+import pytest
+
+import lsre
+from lsre import aio, metrics, server
+from lsre.registry import registry
+from lsre.server import MicroBatcher, ValidationServer
+from tests.data import TEXTS
+
+type Scenario = Callable[[int], Awaitable[None]]
+
+
+async def _exchange(
+    port: int, *requests: bytes
+) -> list[tuple[int, dict[str, str], bytes]]:
+    """Send raw `requests` over one connection and read the responses."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b''.join(requests))
+    await writer.drain()
+    responses = []
+    for _ in requests:
+        status_line = await reader.readline()
+        if not status_line:
+            break
+        headers = {}
+        while (line := await reader.readline()) != b'\r\n':
+            name, _, value = line.decode().partition(':')
+            headers[name.lower()] = value.strip()
+        body = await reader.readexactly(int(headers['content-length']))
+        responses.append((int(status_line.split()[1]), headers, body))
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def _http(method: str, path: str, body: Any = None, **headers: str) -> bytes:  # noqa: ANN401
+    """Return a raw request, JSON-encoding `body` unless it is bytes."""
+    if body is not None and not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    body = body or b''
+    lines = [f'{method} {path} HTTP/1.1', f'Content-Length: {len(body)}']
+    lines += [f'{name}: {value}' for name, value in headers.items()]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode() + body
+
+
+async def _call(port: int, method: str, path: str, body: Any = None) -> Any:  # noqa: ANN401
+    """Send one request and return its status and decoded body."""
+    [(status, _, payload)] = await _exchange(port, _http(method, path, body))
+    return status, json.loads(payload) if payload.startswith(b'{') else payload
+
+
+def _run(scenario: Scenario, app: ValidationServer | None = None) -> None:
+    """Run `scenario` against a server listening on a free port."""
+
+    async def main() -> None:
+        listener = await (app or ValidationServer()).start('127.0.0.1', 0)
+        async with listener:
+            await scenario(listener.sockets[0].getsockname()[1])
+
+    asyncio.run(main())
+
+
+def test_validate() -> None:
+    """Results come back per check in the order of the texts."""
+
+    async def scenario(port: int) -> None:
+        body = {'texts': TEXTS, 'checks': ['email', 'ipv4']}
+        status, answer = await _call(port, 'POST', '/validate', body)
+        assert status == 200  # noqa: PLR2004
+        expected = lsre.validate_many(TEXTS, ['email', 'ipv4'])
+        assert answer == {
+            'results': {'email': expected['email'], 'ipv4': expected['ipv4']}
+        }
+        status, answer = await _call(
+            port, 'POST', '/validate?x=1', {'texts': []}
+        )
+        assert answer == {'results': {name: [] for name in registry}}
+
+    _run(scenario)
+
+
+def test_concurrent_requests_share_batches() -> None:
+    """Requests arriving together are validated in one batch."""
+    batcher = MicroBatcher(max_delay=0.05)
+
+    async def scenario(port: int) -> None:
+        bodies = [{'texts': [text], 'checks': ['uuid']} for text in TEXTS]
+        answers = await asyncio.gather(
+            *(_call(port, 'POST', '/validate', body) for body in bodies)
+        )
+        expected = lsre.validate_many(TEXTS, 'uuid')['uuid']
+        assert [a['results']['uuid'][0] for _, a in answers] == expected
+
+    _run(scenario, ValidationServer(batcher))
+    assert batcher.requests == len(TEXTS)
+    assert batcher.texts == len(TEXTS)
+    assert batcher.batches < len(TEXTS)
+
+
+def test_full_batches_run_right_away() -> None:
+    """Reaching `max_batch` texts starts the batch without waiting."""
+    batcher = MicroBatcher(max_batch=2, max_delay=60)
+
+    async def scenario(port: int) -> None:
+        body = {'texts': ['a', 'b'], 'checks': ['slug']}
+        status, answer = await _call(port, 'POST', '/validate', body)
+        assert answer == {'results': {'slug': [True, True]}}
+
+    _run(scenario, ValidationServer(batcher))
+
+
+def test_keep_alive_and_close() -> None:
+    """A connection serves requests until the client asks to close it."""
+
+    async def scenario(port: int) -> None:
+        responses = await _exchange(
+            port,
+            _http('GET', '/health'),
+            _http('GET', '/health', Connection='close'),
+            _http('GET', '/health'),
+        )
+        assert [status for status, _, _ in responses] == [200, 200]
+        assert responses[0][1]['connection'] == 'keep-alive'
+        assert responses[1][1]['connection'] == 'close'
+        assert json.loads(responses[0][2]) == {'status': 'ok'}
+
+    _run(scenario)
+
+
+def test_metrics() -> None:
+    """Server counters are always served, validator metrics when on."""
+    metrics.reset()
+
+    async def scenario(port: int) -> None:
+        await _call(
+            port, 'POST', '/validate', {'texts': ['a'], 'checks': ['slug']}
+        )
+        status, text = await _call(port, 'GET', '/metrics')
+        assert status == 200  # noqa: PLR2004
+        assert b'lsre_server_requests_total 1\n' in text
+        assert b'lsre_server_texts_total 1\n' in text
+        assert b'lsre_validator_calls_total' not in text
+        metrics.enable()
+        try:
+            await _call(port, 'POST', '/validate', {'texts': ['a']})
+            _, text = await _call(port, 'GET', '/metrics')
+        finally:
+            metrics.disable()
+            metrics.reset()
+        assert b'lsre_validator_calls_total{validator="slug"} 1' in text
+
+    _run(scenario)
+
+
+@pytest.mark.parametrize(
+    ('request_bytes', 'status', 'message'),
+    [
+        (_http('GET', '/nope'), 404, 'No route'),
+        (_http('GET', '/validate'), 405, 'only accepts POST'),
+        (_http('POST', '/validate', b'{'), 400, 'not JSON'),
+        (_http('POST', '/validate', []), 400, 'must be an object'),
+        (_http('POST', '/validate', {'texts': [1]}), 400, 'list of strings'),
+        (_http('POST', '/validate', {'texts': 'a'}), 400, 'list of strings'),
+        (
+            _http('POST', '/validate', {'texts': [], 'checks': ['nope']}),
+            400,
+            'Unknown checks',
+        ),
+    ],
+)
+def test_bad_requests(request_bytes: bytes, status: int, message: str) -> None:
+    """Bad requests get an error and the connection stays open."""
+
+    async def scenario(port: int) -> None:
+        responses = await _exchange(
+            port, request_bytes, _http('GET', '/health')
+        )
+        assert [code for code, _, _ in responses] == [status, 200]
+        assert message in json.loads(responses[0][2])['error']
+
+    _run(scenario)
+
+
+@pytest.mark.parametrize(
+    ('request_bytes', 'status'),
+    [
+        (b'NONSENSE\r\n\r\n', 400),
+        (b'POST /validate HTTP/1.1\r\nContent-Length: x\r\n\r\n', 400),
+        (b'POST /validate HTTP/1.1\r\nContent-Length: \xb2\r\n\r\n', 400),
+        (
+            b'POST /validate HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n'
+            b'2\r\n{}\r\n0\r\n\r\n',
+            501,
+        ),
+        (_http('POST', '/validate', b'x' * 11), 413),
+        (b'GET /' + b'a' * 70_000 + b' HTTP/1.1\r\n\r\n', 400),
+        (b'GET /health HTTP/1.1\r\nX: ' + b'a' * 70_000 + b'\r\n\r\n', 431),
+        (_http('GET', '/health', **{f'X-{i}': 'a' for i in range(4)}), 431),
+    ],
+)
+def test_unreadable_requests_close(request_bytes: bytes, status: int) -> None:
+    """Requests that cannot be read get an error, then the connection ends."""
+
+    async def scenario(port: int) -> None:
+        responses = await _exchange(
+            port, request_bytes, _http('GET', '/health')
+        )
+        assert [code for code, _, _ in responses] == [status]
+        assert responses[0][1]['connection'] == 'close'
+
+    _run(scenario, ValidationServer(max_body=10, max_headers=4))
+
+
+@pytest.mark.parametrize('fails', [False, True])
+def test_cancelled_requests_leave_batch(
+    monkeypatch: pytest.MonkeyPatch, *, fails: bool
+) -> None:
+    """Cancelling one request of a batch still answers the others."""
+    if fails:
+
+        async def broken(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            raise RuntimeError(args, kwargs)
+
+        monkeypatch.setattr(aio, 'validate_many', broken)
+
+    async def main() -> None:
+        batcher = MicroBatcher(max_delay=0.01)
+        gone = asyncio.create_task(batcher.validate(['a'], ('slug',)))
+        kept = asyncio.create_task(batcher.validate(['b'], ('slug',)))
+        await asyncio.sleep(0)
+        gone.cancel()
+        if fails:
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(kept, 1)
+        else:
+            assert await asyncio.wait_for(kept, 1) == {'slug': [True]}
+        assert gone.cancelled()
+
+    asyncio.run(main())
+
+
+def test_internal_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failing batch answers 500 to every request in it."""
+
+    async def broken(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        raise RuntimeError(args, kwargs)
+
+    monkeypatch.setattr(aio, 'validate_many', broken)
+
+    async def scenario(port: int) -> None:
+        status, answer = await _call(port, 'POST', '/validate', {'texts': []})
+        assert status == 500  # noqa: PLR2004
+        assert 'RuntimeError' in answer['error']
+
+    _run(scenario)
+
+
+def test_client_disconnects_mid_request() -> None:
+    """A connection dropped halfway through a body is just closed."""
+
+    async def half_close(port: int) -> None:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'POST /validate HTTP/1.1\r\nContent-Length: 10\r\n\r\n{')
+        writer.write_eof()
+        assert await reader.read() == b''
+        writer.close()
+
+    _run(half_close)
+
+
+def test_serve_and_main(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """`serve` prints its address; `main` wires the options through."""
+
+    async def scenario() -> None:
+        task = asyncio.create_task(server.serve('127.0.0.1', 0))
+        while not (out := capsys.readouterr().out):  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+        port = int(out.strip().rsplit(':', 1)[1])
+        status, _ = await _call(port, 'GET', '/health')
+        assert status == 200  # noqa: PLR2004
+        task.cancel()
+
+    asyncio.run(scenario())
+
+    calls = []
+
+    async def fake_serve(host: str, port: int, app: ValidationServer) -> None:
+        calls.append(
+            (host, port, app.batcher.max_batch, app.batcher.max_delay)
+        )
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(server, 'serve', fake_serve)
+    argv = ['--port', '9', '--max-batch', '5', '--max-delay-ms', '1']
+    try:
+        assert server.main(argv) == 0
+        assert metrics.is_enabled()
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert calls == [('127.0.0.1', 9, 5, 0.001)]
+
+
+def test_run_as_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`python -m lsre.server` runs `main` and exits with its code."""
+
+    def interrupt(coroutine: Coroutine[Any, Any, None]) -> None:
+        coroutine.close()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr('sys.argv', ['lsre-server'])
+    monkeypatch.setattr(asyncio, 'run', interrupt)
+    try:
+        with (
+            pytest.warns(RuntimeWarning, match='found in sys.modules'),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            runpy.run_module('lsre.server', run_name='__main__')
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert exc_info.value.code == 0
@@ -0,0 +1,60 @@
+"""Test streaming validation."""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import lsre
+from lsre.stream import read_lines, validate_stream, write_csv, write_jsonl
+from tests.data import TEXTS
+
+
+def test_read_lines_from_files(tmp_path: Path) -> None:
+    """Lines come out in file order without their newlines."""
+    first = tmp_path / 'first.txt'
+    first.write_text('a\nb\n', encoding='utf-8')
+    second = tmp_path / 'second.txt'
+    second.write_text('c', encoding='utf-8')
+    assert list(read_lines([first, str(second)])) == ['a', 'b', 'c']
+
+
+def test_read_lines_from_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`-` reads standard input."""
+    monkeypatch.setattr('sys.stdin', io.StringIO('x\ny\n'))
+    assert list(read_lines()) == ['x', 'y']
+
+
+def test_validate_stream_chunks() -> None:
+    """Lines are validated in chunks of the requested size."""
+    chunks = list(validate_stream(iter(TEXTS), ['email'], chunk_size=4))
+    assert [len(texts) for texts, _ in chunks] == [4, 4, 4, 3]
+    results = [flag for _, result in chunks for flag in result['email']]
+    assert results == [lsre.is_email(text) for text in TEXTS]
+
+
+def test_write_jsonl_round_trips() -> None:
+    """Every JSONL row holds the text and every check result."""
+    out = io.StringIO()
+    rows = write_jsonl(validate_stream(TEXTS, chunk_size=5), out)
+    assert rows == len(TEXTS)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [record.pop('text') for record in records] == TEXTS
+    expected = lsre.validate_many(TEXTS)
+    assert records == [expected.row(i) for i in range(len(TEXTS))]
+
+
+def test_write_csv_round_trips() -> None:
+    """Every CSV row holds the text and a 0/1 flag per check."""
+    out = io.StringIO()
+    checks = ['ipv4', 'uuid']
+    rows = write_csv(validate_stream(TEXTS, checks, chunk_size=5), out, checks)
+    assert rows == len(TEXTS)
+    out.seek(0)
+    records = list(csv.DictReader(out))
+    assert [record['text'] for record in records] == TEXTS
+    assert [record['ipv4'] == '1' for record in records] == [
+        lsre.is_ipv4(text) for text in TEXTS
+    ]
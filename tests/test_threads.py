@@ -0,0 +1,132 @@
+"""Test that shared state holds up under many threads at once.
+
+These tests also run on the free-threaded build (`python3.13t`), where
+the threads run in parallel rather than taking turns.
+"""
+
+import sys
+import threading
+from collections.abc import Callable, Iterator
+
+import pytest
+
+import lsre
+from lsre import cache, metrics
+from lsre.parallel import validate_parallel
+from lsre.schema import Schema
+from tests.data import TEXTS
+
+THREADS = 8
+ROUNDS = 50
+
+
+@pytest.fixture(autouse=True)
+def _switch_often() -> Iterator[None]:
+    """Make a GIL build switch threads often, to interleave more."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _hammer(work: Callable[[], object], rounds: int = ROUNDS) -> list[object]:
+    """Run `work` `rounds` times on each of `THREADS` threads at once.
+
+    Returns:
+        list[object]: every result, or the exception a round raised
+    """
+    barrier = threading.Barrier(THREADS)
+    results: list[object] = []
+
+    def run() -> None:
+        barrier.wait()
+        for _ in range(rounds):
+            try:
+                results.append(work())
+            except Exception as error:  # noqa: BLE001
+                results.append(error)
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_batch_functions() -> None:
+    """Batch validation, classification and schemas agree across threads."""
+    schema = Schema({'email': 'email', 'ip': 'ipv4'})
+    records = [{'email': text, 'ip': text} for text in TEXTS]
+
+    def work() -> object:
+        return (
+            lsre.validate_many(TEXTS),
+            lsre.classify_many(TEXTS),
+            schema.validate(records),
+        )
+
+    expected = work()
+    assert _hammer(work) == [expected] * THREADS * ROUNDS
+
+
+def test_metrics_count_every_call() -> None:
+    """No call is lost when threads record metrics together."""
+    metrics.reset()
+    metrics.enable()
+    try:
+        _hammer(lambda: [lsre.is_ipv4(text) for text in TEXTS])
+        snapshot = metrics.snapshot()
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert snapshot['ipv4']['calls'] == THREADS * ROUNDS * len(TEXTS)
+    assert snapshot['ipv4']['matches'] == THREADS * ROUNDS
+
+
+def test_cache_answers_and_counts() -> None:
+    """The result cache gives the right answers and counts every lookup."""
+    expected = [lsre.is_email(text) for text in TEXTS]
+    cache.enable(maxsize=8)
+    try:
+        results = _hammer(lambda: [lsre.is_email(text) for text in TEXTS])
+        stats = cache.snapshot()['email']
+    finally:
+        cache.disable()
+    assert results == [expected] * THREADS * ROUNDS
+    assert stats['hits'] + stats['misses'] == THREADS * ROUNDS * len(TEXTS)
+    assert stats['size'] <= 8  # noqa: PLR2004
+
+
+def test_cache_toggled_during_calls() -> None:
+    """Turning the cache on and off never changes an answer."""
+    expected = [lsre.is_uuid(text) for text in TEXTS]
+    stop = threading.Event()
+
+    def toggle() -> None:
+        while not stop.is_set():
+            cache.enable(maxsize=4)
+            cache.disable()
+
+    toggler = threading.Thread(target=toggle)
+    toggler.start()
+    try:
+        results = _hammer(lambda: [lsre.is_uuid(text) for text in TEXTS])
+    finally:
+        stop.set()
+        toggler.join()
+        cache.disable()
+    assert results == [expected] * THREADS * ROUNDS
+
+
+def test_thread_pool() -> None:
+    """Thread pools running at the same time all get full results."""
+    texts = TEXTS * 20
+    expected = lsre.validate_many(texts)
+    results = _hammer(
+        lambda: validate_parallel(
+            texts, workers=4, chunk_size=16, pool='thread'
+        ),
+        rounds=3,
+    )
+    assert results == [expected] * THREADS * 3
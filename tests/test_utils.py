@@ -1,8 +1,16 @@
 """Test the regex functions."""
 
+from typing import Any
+
 import pytest
 
-from lsre.utils import enforce_str_arg
+from lsre.utils import (
+    chunked,
+    enforce_str_arg,
+    enforce_text_arg,
+    ensure_text_items,
+    is_ascii,
+)
 
 
 def test_enforce_str_arg_string_input() -> None:
@@ -34,3 +42,64 @@ def test_enforce_str_arg_non_string_input(bad_value: str) -> None:
 
     with pytest.raises(TypeError):
         noop(bad_value)
+
+
+def test_enforce_text_arg() -> None:
+    """Strings and ASCII bytes pass through, other bytes are decoded."""
+
+    @enforce_text_arg
+    def echo(text: Any) -> Any:  # noqa: ANN401
+        return text
+
+    view = memoryview(b'abc')
+    assert echo('abc') == 'abc'
+    assert echo(view) is view
+    assert echo(bytearray('caf\u00e9'.encode())) == 'caf\u00e9'
+    with pytest.raises(TypeError, match='got int'):
+        echo(1)
+
+
+def test_enforce_text_arg_invalid_utf8() -> None:
+    """Invalid UTF-8 is replaced rather than raising."""
+
+    @enforce_text_arg
+    def echo(text: Any) -> Any:  # noqa: ANN401
+        return text
+
+    assert (echo(b'ok'), echo(memoryview(b'\xff'))) == (b'ok', '\ufffd')
+    assert (is_ascii(b''), is_ascii(bytearray(b'\x80'))) == (True, False)
+
+
+def test_ensure_text_items_accepts_str_subclasses() -> None:
+    """Strings and str subclasses pass through as a list."""
+
+    class Name(str):
+        __slots__ = ()
+
+    items = ensure_text_items(iter(['a', Name('b')]))
+    assert items == ['a', 'b']
+
+
+def test_ensure_text_items_keeps_ascii_bytes() -> None:
+    """All-ASCII bytes batches are kept, other batches become strings."""
+    view = memoryview(b'c')
+    ascii_items: list[Any] = [b'a', bytearray(b'b'), view]
+    assert ensure_text_items(ascii_items)[2] is view
+    assert ensure_text_items([b'a', 'caf\u00e9'.encode()]) == [
+        'a',
+        'caf\u00e9',
+    ]
+    assert ensure_text_items(['a', b'b']) == ['a', 'b']
+
+
+def test_ensure_text_items_rejects_non_text() -> None:
+    """The first item that is neither str nor bytes is reported."""
+    texts: list[Any] = ['a', b'b', 3]
+    with pytest.raises(TypeError, match='int at index 2'):
+        ensure_text_items(texts)
+
+
+def test_chunked_rejects_empty_chunks() -> None:
+    """Chunk sizes below one are rejected."""
+    with pytest.raises(ValueError, match='at least 1'):
+        list(chunked([1], 0))